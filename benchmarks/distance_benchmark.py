@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Benchmark the vectorized distance matrix against the scalar Haversine."""
+import argparse
+import os
+import sys
+import timeit
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from src.lib.locations.domain.services import LocationDomainService
+from src.lib.locations.domain.value_objects import Coordinates
+
+
+def scalar_matrix(points):
+    """Build the distance matrix one pair at a time with calculate_distance."""
+    return [[LocationDomainService.calculate_distance(a, b) for b in points] for a in points]
+
+
+def best_of(func, repeat: int) -> float:
+    """Get the best wall time in seconds over ``repeat`` runs."""
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main() -> None:
+    """Run the benchmark and print one line per matrix size."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 300, 1000], help="Number of points (matrix is N x N)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; the best one is reported")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the generated points")
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(args.seed)
+    print(f"{'N':>6} {'scalar (ms)':>12} {'float64 (ms)':>13} {'float32 (ms)':>13} {'speedup':>8} {'max err f32 (km)':>17}")
+    
+    for size in args.sizes:
+        latitudes = rng.uniform(-90, 90, size)
+        longitudes = rng.uniform(-180, 180, size)
+        points = [Coordinates(longitude=lon, latitude=lat) for lat, lon in zip(latitudes, longitudes)]
+        
+        scalar = best_of(lambda: scalar_matrix(points), args.repeat)
+        vector64 = best_of(
+            lambda: LocationDomainService.calculate_distance_matrix(latitudes, longitudes, latitudes, longitudes),
+            args.repeat
+        )
+        vector32 = best_of(
+            lambda: LocationDomainService.calculate_distance_matrix(
+                latitudes, longitudes, latitudes, longitudes, dtype=np.float32
+            ),
+            args.repeat
+        )
+        
+        expected = np.array(scalar_matrix(points))
+        error32 = np.abs(
+            LocationDomainService.calculate_distance_matrix(
+                latitudes, longitudes, latitudes, longitudes, dtype=np.float32
+            ) - expected
+        ).max()
+        
+        print(
+            f"{size:>6} {scalar * 1000:>12.2f} {vector64 * 1000:>13.2f} {vector32 * 1000:>13.2f} "
+            f"{scalar / vector64:>7.0f}x {error32:>17.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""Replay a weighted mix of API traffic and report latency, errors and throughput per scenario.
+
+By default the mix is sent in-process to ``src.main:app`` through an ASGI
+transport, on a copy of a seeded catalogue. With ``--url`` it is sent over
+HTTP to a running server instead.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Add the project root and the benchmark suite (for the seeding helpers) to the Python path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR))
+sys.path.insert(0, str(ROOT_DIR / "benchmarks" / "suite"))
+
+import httpx
+import numpy as np
+from seed_data import copy_seeded_database
+
+# Rows read per page, and the most of each kind kept, when discovering IDs to request
+DISCOVERY_PAGE_SIZE = 100
+DISCOVERY_LIMIT = 2_000
+
+# Page size of the list scenarios, and the deepest offset they page to
+PAGE_SIZE = 20
+MAX_OFFSET = 500
+
+
+@dataclass
+class Catalogue:
+    """IDs and name words of existing rows, which the scenarios draw their inputs from."""
+    
+    location_ids: List[int]
+    category_ids: List[int]
+    words: List[str]
+
+
+# A scenario builds (method, path, JSON body) from the catalogue and a random generator
+Request = Tuple[str, str, Optional[Dict[str, Any]]]
+Builder = Callable[[Catalogue, random.Random], Request]
+
+
+def list_locations(catalogue: Catalogue, rng: random.Random) -> Request:
+    """Page through locations by offset."""
+    offset = rng.randrange(MAX_OFFSET)
+    return "GET", f"/api/v1/locations/?limit={PAGE_SIZE}&offset={offset}", None
+
+
+def filter_locations(catalogue: Catalogue, rng: random.Random) -> Request:
+    """Filter locations by a word of their name."""
+    word = rng.choice(catalogue.words)
+    return "GET", f"/api/v1/locations/?limit={PAGE_SIZE}&name={word}", None
+
+
+def search_locations(catalogue: Catalogue, rng: random.Random) -> Request:
+    """Full-text search locations."""
+    word = rng.choice(catalogue.words)
+    return "GET", f"/api/v1/locations/?limit={PAGE_SIZE}&q={word}", None
+
+
+def get_location(catalogue: Catalogue, rng: random.Random) -> Request:
+    """Get one location."""
+    return "GET", f"/api/v1/locations/{rng.choice(catalogue.location_ids)}", None
+
+
+def list_categories(catalogue: Catalogue, rng: random.Random) -> Request:
+    """Get the first page of categories."""
+    return "GET", f"/api/v1/categories/?limit={PAGE_SIZE}", None
+
+
+def get_recommendations(catalogue: Catalogue, rng: random.Random) -> Request:
+    """Get the recommendations page."""
+    return "GET", "/api/v1/recommendations/", None
+
+
+def mark_reviewed(catalogue: Catalogue, rng: random.Random) -> Request:
+    """Mark a random combination as reviewed."""
+    body = {
+        "location_id": rng.choice(catalogue.location_ids),
+        "category_id": rng.choice(catalogue.category_ids),
+    }
+    return "POST", "/api/v1/recommendations/mark-reviewed", body
+
+
+def create_category(catalogue: Catalogue, rng: random.Random) -> Request:
+    """Create a category with a name no earlier run used."""
+    body = {
+        "name": f"Load test {time.time_ns()} {rng.randrange(10**9)}",
+        "description": "Created by the load test",
+    }
+    return "POST", "/api/v1/categories/", body
+
+
+# Default mix as scenario -> (weight, builder), read-heavy like the phases of test_api.sh
+SCENARIOS: Dict[str, Tuple[float, Builder]] = {
+    "list_locations": (20, list_locations),
+    "filter_locations": (5, filter_locations),
+    "search_locations": (10, search_locations),
+    "get_location": (25, get_location),
+    "list_categories": (5, list_categories),
+    "get_recommendations": (15, get_recommendations),
+    "mark_reviewed": (15, mark_reviewed),
+    "create_category": (5, create_category),
+}
+
+
+@dataclass
+class Recorder:
+    """Latencies and failures per scenario, for requests started after the warm-up."""
+    
+    measure_from: float
+    latencies: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: Dict[str, Counter] = field(default_factory=lambda: defaultdict(Counter))
+    dropped: int = 0
+    
+    def record(self, scenario: str, started: float, latency: float, error: Optional[str]) -> None:
+        """Record one request; ``error`` is the status code or exception name of a failure."""
+        if started < self.measure_from:
+            return
+        self.latencies[scenario].append(latency)
+        if error is not None:
+            self.errors[scenario][error] += 1
+
+
+async def send(
+    client: httpx.AsyncClient,
+    scenario: str,
+    catalogue: Catalogue,
+    rng: random.Random,
+    recorder: Recorder,
+    scheduled: Optional[float] = None,
+) -> None:
+    """Send one request of ``scenario`` and record its latency, from ``scheduled`` when given."""
+    method, path, body = SCENARIOS[scenario][1](catalogue, rng)
+    started = time.perf_counter() if scheduled is None else scheduled
+    try:
+        response = await client.request(method, path, json=body)
+        error = None if response.status_code < 400 else str(response.status_code)
+    except httpx.HTTPError as e:
+        error = type(e).__name__
+    recorder.record(scenario, started, time.perf_counter() - started, error)
+
+
+async def closed_loop(
+    client: httpx.AsyncClient,
+    mix: Dict[str, float],
+    catalogue: Catalogue,
+    recorder: Recorder,
+    concurrency: int,
+    deadline: float,
+    seed: int,
+) -> None:
+    """Keep ``concurrency`` requests in flight; each worker sends its next as the last returns."""
+    names, weights = list(mix), list(mix.values())
+    
+    async def worker(rng: random.Random) -> None:
+        while time.perf_counter() < deadline:
+            await send(client, rng.choices(names, weights)[0], catalogue, rng, recorder)
+    
+    await asyncio.gather(*(worker(random.Random(seed + number)) for number in range(concurrency)))
+
+
+async def open_loop(
+    client: httpx.AsyncClient,
+    mix: Dict[str, float],
+    catalogue: Catalogue,
+    recorder: Recorder,
+    rate: float,
+    max_in_flight: int,
+    deadline: float,
+    seed: int,
+) -> None:
+    """Start requests at Poisson arrivals averaging ``rate`` per second, returned or not.
+    
+    Latency is measured from the scheduled arrival, so time a request waits
+    behind a slow server counts against it. Arrivals while ``max_in_flight``
+    requests are outstanding are dropped and counted.
+    """
+    names, weights = list(mix), list(mix.values())
+    rng = random.Random(seed)
+    in_flight: set = set()
+    arrival = time.perf_counter()
+    while arrival < deadline:
+        delay = arrival - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if len(in_flight) >= max_in_flight:
+            if arrival >= recorder.measure_from:
+                recorder.dropped += 1
+        else:
+            scenario = rng.choices(names, weights)[0]
+            task = asyncio.create_task(
+                send(client, scenario, catalogue, random.Random(rng.random()), recorder, arrival)
+            )
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        arrival += rng.expovariate(rate)
+    await asyncio.gather(*in_flight)
+
+
+async def discover(client: httpx.AsyncClient, path: str) -> List[Dict[str, Any]]:
+    """Read up to ``DISCOVERY_LIMIT`` rows of a collection, following ``X-Next-Cursor``."""
+    rows: List[Dict[str, Any]] = []
+    params: Dict[str, Any] = {"limit": DISCOVERY_PAGE_SIZE}
+    while len(rows) < DISCOVERY_LIMIT:
+        response = await client.get(path, params=params)
+        response.raise_for_status()
+        rows.extend(response.json())
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            break
+        params = {"limit": DISCOVERY_PAGE_SIZE, "cursor": cursor}
+    return rows
+
+
+async def load_catalogue(client: httpx.AsyncClient) -> Catalogue:
+    """Collect the IDs and name words the scenarios need from the API itself."""
+    locations = await discover(client, "/api/v1/locations/")
+    categories = await discover(client, "/api/v1/categories/")
+    if not locations or not categories:
+        raise SystemExit("The target has no locations or no categories to request; seed it first")
+    words = sorted({
+        word
+        for row in locations
+        for word in row["name"].split()
+        if word.isalpha() and len(word) >= 3
+    })
+    return Catalogue(
+        location_ids=[row["id"] for row in locations],
+        category_ids=[row["id"] for row in categories],
+        words=words or ["a"],
+    )
+
+
+def summarize(recorder: Recorder, seconds: float) -> Dict[str, Dict[str, Any]]:
+    """Per-scenario and total request counts, error rates, throughput and latency percentiles."""
+    def stats(latencies: List[float], errors: Counter) -> Dict[str, Any]:
+        milliseconds = np.asarray(latencies) * 1000
+        p50, p95, p99 = (
+            np.percentile(milliseconds, [50, 95, 99]) if latencies else (0.0, 0.0, 0.0)
+        )
+        failed = sum(errors.values())
+        return {
+            "requests": len(latencies),
+            "errors": failed,
+            "error_rate": failed / len(latencies) if latencies else 0.0,
+            "throughput": len(latencies) / seconds,
+            "p50_ms": float(p50),
+            "p95_ms": float(p95),
+            "p99_ms": float(p99),
+            "max_ms": float(milliseconds.max()) if latencies else 0.0,
+            "error_codes": dict(errors),
+        }
+    
+    results = {
+        name: stats(recorder.latencies[name], recorder.errors[name])
+        for name in sorted(recorder.latencies)
+    }
+    all_latencies = [latency for name in recorder.latencies for latency in recorder.latencies[name]]
+    all_errors: Counter = sum(recorder.errors.values(), Counter())
+    results["total"] = stats(all_latencies, all_errors)
+    return results
+
+
+def print_report(results: Dict[str, Dict[str, Any]], seconds: float, dropped: int) -> None:
+    """Print the summary as a table, failures by status code or exception below it."""
+    print(f"\nMeasured {seconds:.1f}s")
+    print(f"{'scenario':<20} {'requests':>9} {'req/s':>9} {'errors':>8} "
+          f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for name, row in results.items():
+        print(f"{name:<20} {row['requests']:>9} {row['throughput']:>9.1f} "
+              f"{row['error_rate']:>7.1%} {row['p50_ms']:>9.2f} {row['p95_ms']:>9.2f} "
+              f"{row['p99_ms']:>9.2f} {row['max_ms']:>9.2f}")
+    for name, row in results.items():
+        if name != "total" and row["error_codes"]:
+            codes = sorted(row["error_codes"].items())
+            print(f"{name} errors: " + ", ".join(f"{code} x{count}" for code, count in codes))
+    if dropped:
+        print(f"Dropped {dropped} arrivals with --max-in-flight requests outstanding; "
+              "the target can't keep up")
+
+
+def parse_mix(value: Optional[str]) -> Dict[str, float]:
+    """Parse ``name=weight,...`` into a mix, or return the default one."""
+    if not value:
+        return {name: weight for name, (weight, _) in SCENARIOS.items()}
+    mix = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        if name.strip() not in SCENARIOS:
+            raise argparse.ArgumentTypeError(
+                f"unknown scenario {name.strip()!r}; choose from {', '.join(SCENARIOS)}"
+            )
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+async def run(args: argparse.Namespace, mix: Dict[str, float]) -> Dict[str, Any]:
+    """Open the client (and the app's lifespan in-process), discover inputs and apply the load."""
+    limits = httpx.Limits(max_connections=args.max_in_flight if args.rate else args.concurrency)
+    async with AsyncExitStack() as stack:
+        if args.url:
+            client = httpx.AsyncClient(base_url=args.url, limits=limits, timeout=args.timeout)
+        else:
+            from src.main import app
+            
+            await stack.enter_async_context(app.router.lifespan_context(app))
+            client = httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app),
+                base_url="http://load-test",
+                timeout=args.timeout,
+            )
+        await stack.enter_async_context(client)
+        
+        catalogue = await load_catalogue(client)
+        print(f"Target {args.url or 'src.main:app (in-process)'}: "
+              f"{len(catalogue.location_ids)} location IDs, "
+              f"{len(catalogue.category_ids)} category IDs")
+        if args.rate:
+            mode = f"Open loop at {args.rate:g} req/s"
+        else:
+            mode = f"Closed loop with {args.concurrency} workers"
+        print(f"{mode} for {args.warmup:g}s warm-up + {args.duration:g}s")
+        
+        start = time.perf_counter()
+        recorder = Recorder(measure_from=start + args.warmup)
+        deadline = recorder.measure_from + args.duration
+        if args.rate:
+            await open_loop(
+                client, mix, catalogue, recorder, args.rate, args.max_in_flight, deadline, args.seed
+            )
+        else:
+            await closed_loop(
+                client, mix, catalogue, recorder, args.concurrency, deadline, args.seed
+            )
+        # Requests in flight at the deadline still finish and count, so measure until they have
+        seconds = time.perf_counter() - recorder.measure_from
+    
+    results = summarize(recorder, seconds)
+    print_report(results, seconds, recorder.dropped)
+    return {"seconds": seconds, "dropped": recorder.dropped, "scenarios": results}
+
+
+def main() -> None:
+    """Parse arguments, prepare the target and run the load test."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--url", help="Base URL of a running server (default: in-process against src.main:app)"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=10, help="Requests kept in flight in closed-loop mode"
+    )
+    parser.add_argument(
+        "--rate", type=float, help="Arrivals per second; switches to open-loop mode"
+    )
+    parser.add_argument(
+        "--max-in-flight", type=int, default=1_000,
+        help="Open loop: outstanding requests before arrivals are dropped",
+    )
+    parser.add_argument("--duration", type=float, default=30.0, help="Measured seconds")
+    parser.add_argument(
+        "--warmup", type=float, default=3.0, help="Seconds of load before measuring starts"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=30.0, help="Per-request timeout in seconds"
+    )
+    parser.add_argument(
+        "--mix", help=f"Scenario weights as name=weight,... from: {', '.join(SCENARIOS)}"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=42, help="Random seed for the seeded data and the request mix"
+    )
+    parser.add_argument(
+        "--locations", type=int, default=10_000,
+        help="In-process: locations in the seeded catalogue",
+    )
+    parser.add_argument(
+        "--categories", type=int, default=50, help="In-process: categories in the seeded catalogue"
+    )
+    parser.add_argument(
+        "--no-seed", action="store_true",
+        help="In-process: use the configured DATABASE_URL instead of a seeded copy",
+    )
+    parser.add_argument("--output", type=Path, help="Also write the results as JSON to this file")
+    args = parser.parse_args()
+    
+    try:
+        mix = parse_mix(args.mix)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+    
+    work_dir = None
+    if not args.url:
+        # Settings and engines are created on import, so configure them before src.main is imported
+        if not args.no_seed:
+            work_dir = Path(tempfile.mkdtemp(prefix="map-my-world-load-"))
+            copy_seeded_database(work_dir / "load.db", args.locations, args.categories, args.seed)
+            os.environ["DATABASE_URL"] = f"sqlite:///{work_dir / 'load.db'}"
+        # Per-request log lines would otherwise flood the terminal and slow the app down
+        os.environ.setdefault("LOG_LEVEL", "WARNING")
+        os.environ.setdefault("DEBUG", "false")
+    
+    try:
+        report = asyncio.run(run(args, mix))
+    finally:
+        if work_dir is not None:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    
+    if args.output:
+        config = {key: value for key, value in vars(args).items() if key != "output"}
+        args.output.write_text(json.dumps({"config": config, "mix": mix, **report}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
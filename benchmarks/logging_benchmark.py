@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark the logging cost of a GET /locations request under each logging configuration.
+
+The log calls made while serving one real request are recorded, then replayed
+through the module loggers, so the database and the event loop don't blur
+the few hundred microseconds spent on logging.
+"""
+import argparse
+import contextlib
+import os
+import sys
+import tempfile
+import time
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Work on a throwaway database; the engine is built without SQL echo
+_workdir = tempfile.mkdtemp(prefix="logging-benchmark-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_workdir}/benchmark.db"
+os.environ["DEBUG"] = "false"
+os.chdir(_workdir)
+
+from config.core import Settings
+from src.shared.logging.logger import configure_logging, get_logger, logger, sample_request
+
+HOT_MODULES = {
+    "src.lib.locations.infrastructure.orm": "WARNING",
+    "src.lib.categories.infrastructure.orm": "WARNING",
+    "src.lib.recommendations.infrastructure.orm": "WARNING",
+}
+
+JSON = {"log_format": "json", "log_diagnose": False}
+
+CONFIGURATIONS = [
+    ("disabled", None),
+    ("default", {}),
+    ("json", JSON),
+    ("json + enqueue", {**JSON, "log_enqueue": True}),
+    ("json + orm WARNING", {**JSON, "log_levels": HOT_MODULES}),
+    ("+ 10% sampling", {**JSON, "log_levels": HOT_MODULES, "log_sample_rate": 0.1}),
+    ("+ enqueue", {**JSON, "log_levels": HOT_MODULES, "log_sample_rate": 0.1, "log_enqueue": True}),
+]
+
+
+def record_request_logs(path: str):
+    """Serve ``path`` once and return its log calls as (logger method, message) pairs."""
+    from fastapi.testclient import TestClient
+    from scripts import init_db
+    from src.app import create_app
+    
+    init_db.main()
+    client = TestClient(create_app())
+    client.get(path)  # Warm up caches so the recorded request is a typical one
+    
+    records = []
+    sink_id = logger.add(records.append, level=0, format="{message}")
+    client.get(path)
+    logger.remove(sink_id)
+    
+    return [
+        (getattr(get_logger(message.record["name"]), message.record["level"].name.lower()), message.record["message"])
+        for message in records
+    ]
+
+
+def replay(calls, requests: int) -> float:
+    """Replay the recorded calls for ``requests`` requests and return the elapsed seconds."""
+    start = time.perf_counter()
+    for _ in range(requests):
+        sample_request()
+        for log, message in calls:
+            log(message)
+    
+    # Enqueued sinks must finish writing before the run counts as done
+    logger.complete()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Parse arguments, record one request and replay its logs under every configuration."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--requests", type=int, default=5_000, help="Requests replayed per run")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per configuration; the best one is reported")
+    args = parser.parse_args()
+    
+    path = "/api/v1/locations/?limit=20"
+    calls = record_request_logs(path)
+    
+    results = {}
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for label, overrides in CONFIGURATIONS:
+            if overrides is None:
+                logger.remove()
+            else:
+                # Console sink only, so file rotation doesn't skew the runs
+                configure_logging(Settings(**{"debug": True, **overrides}))
+            results[label] = min(replay(calls, args.requests) for _ in range(args.repeat))
+    logger.remove()
+    
+    print(f"GET {path}: {len(calls)} log calls per request, {args.requests} requests, best of {args.repeat}")
+    print(f"{'configuration':<20} {'per req (us)':>13} {'vs default':>11}")
+    for label, _ in CONFIGURATIONS:
+        seconds = results[label]
+        print(f"{label:<20} {seconds / args.requests * 1e6:>13.1f} {results['default'] / seconds:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
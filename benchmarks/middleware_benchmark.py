@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Benchmark requests per second through the middleware stack on a trivial endpoint."""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from src.shared.exceptions.base import MapMyWorldException
+from src.shared.http.responses import ORJSONResponse
+from src.shared.logging.formatters import format_error_log, format_request_log, format_response_log
+from src.shared.logging.logger import logger
+from src.shared.middleware.error_handler import ErrorHandlerMiddleware, register_exception_handlers
+from src.shared.middleware.logging_middleware import LoggingMiddleware
+from src.shared.middleware.metrics_middleware import MetricsMiddleware
+from src.shared.middleware.request_stats_middleware import RequestStatsMiddleware
+
+
+class LegacyErrorHandlerMiddleware(BaseHTTPMiddleware):
+    """The previous ``BaseHTTPMiddleware`` error handler, kept as the baseline."""
+    
+    async def dispatch(self, request: Request, call_next):
+        try:
+            return await call_next(request)
+        except MapMyWorldException as e:
+            logger.error(format_error_log(e, {"method": request.method, "path": request.url.path, "status_code": e.status_code}))
+            return ORJSONResponse(
+                status_code=e.status_code,
+                content={"status_code": e.status_code, "error": e.error, "details": e.details},
+            )
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    """The previous ``BaseHTTPMiddleware`` request logger, kept as the baseline."""
+    
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        client_ip = request.client.host if request.client else "unknown"
+        logger.info(format_request_log(request.method, request.url.path, client_ip, request.headers.get("user-agent")))
+        response = await call_next(request)
+        logger.info(format_response_log(response.status_code, (time.time() - start_time) * 1000))
+        return response
+
+
+def make_app(stack: str) -> FastAPI:
+    """Build an app with a single trivial endpoint behind the given middleware stack."""
+    app = FastAPI()
+    
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+    
+    if stack == "base-http":
+        app.add_middleware(LegacyErrorHandlerMiddleware)
+        app.add_middleware(LegacyLoggingMiddleware)
+    elif stack in ("pure-asgi", "+ metrics", "+ request stats"):
+        app.add_middleware(ErrorHandlerMiddleware)
+        if stack == "+ request stats":
+            app.add_middleware(RequestStatsMiddleware, server_timing=True, statement_budget=20, repeated_statement_threshold=5)
+        app.add_middleware(LoggingMiddleware)
+        register_exception_handlers(app)
+        if stack != "pure-asgi":
+            app.add_middleware(MetricsMiddleware)
+    return app
+
+
+async def drive(app: FastAPI, requests: int) -> float:
+    """Send ``requests`` GET /ping calls straight into the ASGI app and return the elapsed seconds."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"user-agent", b"middleware-benchmark")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+    
+    async def send(message):
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200, message
+    
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return time.perf_counter() - start
+
+
+async def run(args) -> None:
+    """Measure every stack and print its throughput relative to the ``BaseHTTPMiddleware`` baseline."""
+    stacks = ["none", "base-http", "pure-asgi", "+ metrics", "+ request stats"]
+    results = {}
+    for stack in stacks:
+        app = make_app(stack)
+        await drive(app, min(args.requests, 500))  # Warm up routing and adapters
+        results[stack] = min([await drive(app, args.requests) for _ in range(args.repeat)])
+    
+    print(f"{args.requests} requests, best of {args.repeat}")
+    print(f"{'stack':<16} {'req/s':>10} {'per req (us)':>13} {'vs base-http':>13}")
+    for stack in stacks:
+        seconds = results[stack]
+        print(f"{stack:<16} {args.requests / seconds:>10.0f} {seconds / args.requests * 1e6:>13.1f} "
+              f"{results['base-http'] / seconds:>12.2f}x")
+
+
+def main() -> None:
+    """Parse arguments, silence log output and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5_000, help="Requests sent per run")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stack; the best one is reported")
+    args = parser.parse_args()
+    
+    # Keep formatting log records, but discard them so terminal I/O doesn't dominate
+    logger.remove()
+    logger.add(lambda _: None, level="INFO")
+    
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
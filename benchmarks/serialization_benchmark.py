@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Benchmark per-row JSON serialization cost of the GET /locations response."""
+import argparse
+import json
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from src.lib.locations.domain.entities import Location
+from src.lib.locations.domain.value_objects import Coordinates
+from src.lib.locations.infrastructure.api.schemas import LocationResponseSchema, LocationRow, location_row
+from src.shared.http.responses import list_adapter
+
+
+def make_locations(count: int, seed: int):
+    """Build ``count`` domain locations with random coordinates."""
+    rng = np.random.default_rng(seed)
+    start = datetime(2024, 1, 1)
+    return [
+        Location(
+            id=index + 1,
+            coordinates=Coordinates(longitude=float(longitude), latitude=float(latitude)),
+            name=f"Location {index + 1}",
+            description=f"Benchmark location number {index + 1}",
+            created_at=start + timedelta(seconds=index),
+            updated_at=start + timedelta(seconds=index),
+        )
+        for index, (latitude, longitude) in enumerate(zip(rng.uniform(-90, 90, count), rng.uniform(-180, 180, count)))
+    ]
+
+
+def schemas_then_json_dumps(locations):
+    """Pre-0.115 FastAPI: build schemas, validate them, encode to dicts, then json.dumps."""
+    adapter = list_adapter(LocationResponseSchema)
+    schemas = adapter.validate_python([LocationResponseSchema.from_domain(location) for location in locations])
+    return json.dumps(adapter.dump_python(schemas, mode="json")).encode()
+
+
+def schemas_then_dump_json(locations):
+    """Current FastAPI with response_model: build schemas, validate them, then dump_json."""
+    adapter = list_adapter(LocationResponseSchema)
+    schemas = adapter.validate_python([LocationResponseSchema.from_domain(location) for location in locations])
+    return adapter.dump_json(schemas)
+
+
+def rows_then_dump_json(locations):
+    """Fast path used by the routes: plain rows serialized once by a cached TypeAdapter."""
+    return list_adapter(LocationRow).dump_json([location_row(location) for location in locations])
+
+
+def best_of(func, repeat: int) -> float:
+    """Get the best wall time in seconds over ``repeat`` runs."""
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main() -> None:
+    """Run the benchmark and print the per-row cost of each serialization path."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000, help="Number of locations serialized per run")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement; the best one is reported")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the generated locations")
+    args = parser.parse_args()
+    
+    locations = make_locations(args.rows, args.seed)
+    paths = [
+        ("schemas + json.dumps", schemas_then_json_dumps),
+        ("schemas + dump_json", schemas_then_dump_json),
+        ("rows + dump_json", rows_then_dump_json),
+    ]
+    
+    # Every path must produce the same document
+    expected = json.loads(rows_then_dump_json(locations))
+    for label, func in paths:
+        assert json.loads(func(locations)) == expected, f"{label} produced a different payload"
+    
+    baseline = None
+    print(f"{args.rows} rows, best of {args.repeat}")
+    print(f"{'path':<22} {'total (ms)':>11} {'per row (us)':>13} {'speedup':>8}")
+    for label, func in paths:
+        seconds = best_of(lambda: func(locations), args.repeat)
+        baseline = baseline or seconds
+        print(f"{label:<22} {seconds * 1000:>11.2f} {seconds / args.rows * 1e6:>13.3f} {baseline / seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""Benchmarks for the category repository and use cases."""
+from datetime import datetime
+import pytest
+from src.lib.categories.application.dtos import CategoryCreateDTO
+from src.lib.categories.application.use_cases.create_category import CreateCategoryUseCase
+from src.lib.categories.application.use_cases.export_categories import ExportCategoriesUseCase
+from src.lib.categories.application.use_cases.get_categories import GetCategoriesUseCase
+from src.lib.categories.domain.entities import Category
+from src.lib.categories.infrastructure.orm.repositories import CategoryRepositoryImpl
+from src.shared.cache.lru import LRUCache
+
+REPOSITORY = pytest.mark.benchmark(group="categories: repository")
+USE_CASES = pytest.mark.benchmark(group="categories: use cases")
+
+# Page size used by the list benchmarks, the API's default
+PAGE_SIZE = 50
+
+# Rounds for writes, which also add or drop one review queue row per location
+WRITE_ROUNDS = 20
+
+
+def new_category(name: str) -> Category:
+    """Build an unsaved category."""
+    now = datetime.utcnow()
+    return Category(
+        id=None,
+        name=name,
+        description="Created by the benchmark suite",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+# Repository
+
+
+@REPOSITORY
+def bench_create(benchmark, in_session, unique_names):
+    """Insert a category, which queues it for review with every location."""
+    benchmark.pedantic(
+        in_session,
+        args=(
+            lambda session: CategoryRepositoryImpl(session).create(
+                new_category(next(unique_names))
+            ),
+        ),
+        rounds=WRITE_ROUNDS,
+    )
+
+
+@REPOSITORY
+def bench_get_by_id(benchmark, in_session, category_ids):
+    """Load one category from the database."""
+    category = benchmark(
+        in_session, lambda session: CategoryRepositoryImpl(session).get_by_id(next(category_ids))
+    )
+    assert category is not None
+
+
+@REPOSITORY
+def bench_get_by_id_cached(benchmark, in_session, category_ids):
+    """Serve one category from a warm entity cache."""
+    cache = LRUCache(max_size=2048, ttl_seconds=300.0)
+    benchmark(
+        in_session,
+        lambda session: CategoryRepositoryImpl(session, cache).get_by_id(next(category_ids)),
+    )
+
+
+@REPOSITORY
+def bench_get_all_page(benchmark, in_session):
+    """Load the first page of categories."""
+    categories = benchmark(
+        in_session, lambda session: CategoryRepositoryImpl(session).get_all(limit=PAGE_SIZE)
+    )
+    assert categories
+
+
+@REPOSITORY
+def bench_get_all_search(benchmark, in_session):
+    """Full-text search categories."""
+    categories = benchmark(
+        in_session,
+        lambda session: CategoryRepositoryImpl(session).get_all(
+            limit=PAGE_SIZE, search="nature lov"
+        ),
+    )
+    assert categories
+
+
+@REPOSITORY
+def bench_stream_all(benchmark, in_session, drain):
+    """Stream every category in batches."""
+    batches = benchmark(
+        in_session, lambda session: drain(CategoryRepositoryImpl(session).stream_all(1000))
+    )
+    assert batches
+
+
+@REPOSITORY
+def bench_update(benchmark, in_session, category_ids):
+    """Load a category and update its description."""
+    async def update(session):
+        repository = CategoryRepositoryImpl(session)
+        category = await repository.get_by_id(next(category_ids))
+        category.description = f"Updated at {datetime.utcnow().isoformat()}"
+        category.updated_at = datetime.utcnow()
+        return await repository.update(category)
+    
+    benchmark(in_session, update)
+
+
+@REPOSITORY
+def bench_delete(benchmark, in_session, unique_names):
+    """Delete a category, which drops its review queue rows."""
+    def setup():
+        category = in_session(
+            lambda session: CategoryRepositoryImpl(session).create(
+                new_category(next(unique_names))
+            )
+        )
+        return (category.id,), {}
+    
+    deleted = benchmark.pedantic(
+        lambda category_id: in_session(
+            lambda session: CategoryRepositoryImpl(session).delete(category_id)
+        ),
+        setup=setup,
+        rounds=WRITE_ROUNDS,
+    )
+    assert deleted
+
+
+@REPOSITORY
+def bench_exists_by_name(benchmark, in_session, category_ids):
+    """Check a category name for duplicates."""
+    category = in_session(
+        lambda session: CategoryRepositoryImpl(session).get_by_id(next(category_ids))
+    )
+    exists = benchmark(
+        in_session, lambda session: CategoryRepositoryImpl(session).exists_by_name(category.name)
+    )
+    assert exists
+
+
+# Use cases
+
+
+@USE_CASES
+def bench_create_category(benchmark, in_session, unique_names):
+    """Check for a duplicate name and insert a category."""
+    benchmark.pedantic(
+        in_session,
+        args=(
+            lambda session: CreateCategoryUseCase(CategoryRepositoryImpl(session)).execute(
+                CategoryCreateDTO(
+                    name=next(unique_names), description="Created by the benchmark suite"
+                )
+            ),
+        ),
+        rounds=WRITE_ROUNDS,
+    )
+
+
+@USE_CASES
+def bench_get_categories(benchmark, in_session):
+    """Get the first page of categories."""
+    page = benchmark(
+        in_session,
+        lambda session: GetCategoriesUseCase(CategoryRepositoryImpl(session)).execute(
+            limit=PAGE_SIZE
+        ),
+    )
+    assert page.items
+
+
+@USE_CASES
+def bench_export_categories(benchmark, in_session, drain):
+    """Export every category in batches."""
+    batches = benchmark(
+        in_session,
+        lambda session: drain(
+            ExportCategoriesUseCase(CategoryRepositoryImpl(session)).execute(1000)
+        ),
+    )
+    assert batches
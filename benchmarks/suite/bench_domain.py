@@ -0,0 +1,95 @@
+"""Benchmarks for the location domain service and response serialization."""
+import pytest
+from src.lib.locations.domain.services import LocationDomainService
+from src.lib.locations.domain.value_objects import Coordinates
+from src.lib.locations.infrastructure.api.schemas import (
+    LocationResponseSchema,
+    LocationRow,
+    location_row,
+)
+from src.lib.locations.infrastructure.orm.repositories import LocationRepositoryImpl
+from src.shared.http.responses import ORJSONResponse, json_list_response, list_adapter
+from src.lib.recommendations.infrastructure.orm.repositories import RecommendationRepositoryImpl
+
+DOMAIN = pytest.mark.benchmark(group="domain")
+SERIALIZATION = pytest.mark.benchmark(group="serialization")
+
+# Page size used by the list endpoints, and the size of a large export-like list
+PAGE_SIZE = 50
+LARGE_LIST_SIZE = 1000
+
+
+@pytest.fixture(scope="module")
+def locations(in_session):
+    """The first seeded locations, as the domain entities a list request serializes."""
+    return in_session(
+        lambda session: LocationRepositoryImpl(session).get_all(limit=LARGE_LIST_SIZE)
+    )
+
+
+# Domain
+
+
+@DOMAIN
+def bench_calculate_distance(benchmark, rng):
+    """Haversine distance between two points."""
+    origin = Coordinates(
+        longitude=float(rng.uniform(-180, 180)), latitude=float(rng.uniform(-90, 90))
+    )
+    destination = Coordinates(
+        longitude=float(rng.uniform(-180, 180)), latitude=float(rng.uniform(-90, 90))
+    )
+    distance = benchmark(LocationDomainService.calculate_distance, origin, destination)
+    assert distance > 0
+
+
+@DOMAIN
+def bench_calculate_distance_between_locations(benchmark, locations):
+    """Haversine distance between two location entities, as the radius search computes it."""
+    distance = benchmark(LocationDomainService.calculate_distance, locations[0], locations[1])
+    assert distance > 0
+
+
+# Serialization
+
+
+@SERIALIZATION
+def bench_location_rows_page(benchmark, locations):
+    """Build and serialize a page of location rows, as GET /locations does."""
+    page = locations[:PAGE_SIZE]
+    response = benchmark(
+        lambda: json_list_response(LocationRow, [location_row(location) for location in page])
+    )
+    assert response.body.startswith(b"[")
+
+
+@SERIALIZATION
+def bench_location_rows_large_list(benchmark, locations):
+    """Build and serialize a thousand location rows."""
+    response = benchmark(
+        lambda: json_list_response(LocationRow, [location_row(location) for location in locations])
+    )
+    assert response.body.startswith(b"[")
+
+
+@SERIALIZATION
+def bench_location_schemas_page(benchmark, locations):
+    """Serialize a page through response schemas, the path a ``response_model`` takes."""
+    page = locations[:PAGE_SIZE]
+    adapter = list_adapter(LocationResponseSchema)
+    
+    def serialize():
+        schemas = [LocationResponseSchema.from_domain(location) for location in page]
+        return adapter.dump_json(adapter.validate_python(schemas))
+    
+    assert benchmark(serialize).startswith(b"[")
+
+
+@SERIALIZATION
+def bench_recommendations_response(benchmark, in_session):
+    """Serialize the recommendations page with orjson."""
+    combinations = in_session(
+        lambda session: RecommendationRepositoryImpl(session).get_unreviewed_combinations(limit=10)
+    )
+    response = benchmark(ORJSONResponse, combinations)
+    assert response.body.startswith(b"[")
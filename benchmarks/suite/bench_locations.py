@@ -0,0 +1,433 @@
+"""Benchmarks for the location repository and use cases."""
+from datetime import datetime
+import pytest
+from src.lib.locations.application.dtos import (
+    DistancePointDTO,
+    LocationCreateDTO,
+    LocationFilterDTO,
+    LocationImportRowDTO,
+)
+from src.lib.locations.application.use_cases.calculate_distance_matrix import (
+    CalculateDistanceMatrixUseCase,
+)
+from src.lib.locations.application.use_cases.create_location import CreateLocationUseCase
+from src.lib.locations.application.use_cases.export_locations import ExportLocationsUseCase
+from src.lib.locations.application.use_cases.find_locations_in_area import (
+    FindLocationsInAreaUseCase,
+)
+from src.lib.locations.application.use_cases.get_location_by_id import GetLocationByIdUseCase
+from src.lib.locations.application.use_cases.get_location_rows import GetLocationRowsUseCase
+from src.lib.locations.application.use_cases.get_locations import GetLocationsUseCase
+from src.lib.locations.application.use_cases.get_nearest_locations import GetNearestLocationsUseCase
+from src.lib.locations.application.use_cases.import_locations import ImportLocationsUseCase
+from src.lib.locations.domain.entities import Location
+from src.lib.locations.domain.value_objects import BoundingBox, Coordinates
+from src.lib.locations.infrastructure.orm.repositories import LocationRepositoryImpl
+from src.lib.locations.infrastructure.spatial.knn_index import LocationKNNIndex, load_location_index
+from src.shared.cache.lru import LRUCache
+
+REPOSITORY = pytest.mark.benchmark(group="locations: repository")
+USE_CASES = pytest.mark.benchmark(group="locations: use cases")
+
+# Page size used by the list benchmarks, the API's default
+PAGE_SIZE = 50
+
+# Rows per batch insert and per import
+BATCH_SIZE = 100
+
+# Fields of the projected list path
+ROW_FIELDS = ("id", "name", "longitude", "latitude")
+
+
+def new_location(name: str, rng) -> Location:
+    """Build an unsaved location at a random position."""
+    now = datetime.utcnow()
+    return Location(
+        id=None,
+        coordinates=Coordinates(
+            longitude=float(rng.uniform(-180, 180)), latitude=float(rng.uniform(-90, 90))
+        ),
+        name=name,
+        description="Created by the benchmark suite",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def random_bbox(rng, size_degrees: float = 10.0) -> BoundingBox:
+    """Get a random ``size_degrees`` square box that doesn't cross a pole or the antimeridian."""
+    latitude = float(rng.uniform(-90, 90 - size_degrees))
+    longitude = float(rng.uniform(-180, 180 - size_degrees))
+    return BoundingBox(latitude, latitude + size_degrees, longitude, longitude + size_degrees)
+
+
+@pytest.fixture(scope="module")
+def location_index() -> LocationKNNIndex:
+    """Nearest-neighbour index loaded with the seeded locations, as at startup."""
+    from config.database import engine
+    
+    index = LocationKNNIndex()
+    load_location_index(index, engine)
+    return index
+
+
+# Repository
+
+
+@REPOSITORY
+def bench_create(benchmark, in_session, unique_names, rng):
+    """Insert one location."""
+    benchmark(
+        in_session,
+        lambda session: LocationRepositoryImpl(session).create(
+            new_location(next(unique_names), rng)
+        ),
+    )
+
+
+@REPOSITORY
+def bench_get_by_id(benchmark, in_session, location_ids):
+    """Load one location from the database."""
+    location = benchmark(
+        in_session, lambda session: LocationRepositoryImpl(session).get_by_id(next(location_ids))
+    )
+    assert location is not None
+
+
+@REPOSITORY
+def bench_get_by_id_cached(benchmark, in_session, location_ids):
+    """Serve one location from a warm entity cache."""
+    cache = LRUCache(max_size=2048, ttl_seconds=300.0)
+    benchmark(
+        in_session,
+        lambda session: LocationRepositoryImpl(session, cache).get_by_id(next(location_ids)),
+    )
+
+
+@REPOSITORY
+def bench_get_by_ids(benchmark, in_session, location_ids):
+    """Load a batch of locations by ID."""
+    ids = [next(location_ids) for _ in range(BATCH_SIZE)]
+    benchmark(in_session, lambda session: LocationRepositoryImpl(session).get_by_ids(ids))
+
+
+@REPOSITORY
+def bench_get_all_keyset_page(benchmark, in_session, location_ids):
+    """Load a page after a cursor position."""
+    locations = benchmark(
+        in_session,
+        lambda session: LocationRepositoryImpl(session).get_all(
+            limit=PAGE_SIZE, after_id=next(location_ids)
+        ),
+    )
+    assert locations
+
+
+@REPOSITORY
+def bench_get_all_deep_offset(benchmark, in_session, scale):
+    """Load a page halfway through the table by offset."""
+    benchmark(
+        in_session,
+        lambda session: LocationRepositoryImpl(session).get_all(
+            limit=PAGE_SIZE, offset=scale.locations // 2
+        ),
+    )
+
+
+@REPOSITORY
+def bench_get_all_name_filter(benchmark, in_session):
+    """Load a page of locations whose name contains a word."""
+    locations = benchmark(
+        in_session,
+        lambda session: LocationRepositoryImpl(session).get_all(
+            limit=PAGE_SIZE, name_filter="garden"
+        ),
+    )
+    assert locations
+
+
+@REPOSITORY
+def bench_get_all_search(benchmark, in_session):
+    """Full-text search locations."""
+    locations = benchmark(
+        in_session,
+        lambda session: LocationRepositoryImpl(session).get_all(
+            limit=PAGE_SIZE, search="museum hist"
+        ),
+    )
+    assert locations
+
+
+@REPOSITORY
+def bench_get_all_rows(benchmark, in_session, location_ids):
+    """Load a page of projected rows after a cursor position."""
+    rows = benchmark(
+        in_session,
+        lambda session: LocationRepositoryImpl(session).get_all_rows(
+            ROW_FIELDS, limit=PAGE_SIZE, after_id=next(location_ids)
+        ),
+    )
+    assert rows
+
+
+@REPOSITORY
+def bench_stream_all(benchmark, in_session, drain):
+    """Stream every location in batches."""
+    batches = benchmark(
+        in_session, lambda session: drain(LocationRepositoryImpl(session).stream_all(1000))
+    )
+    assert batches
+
+
+@REPOSITORY
+def bench_find_in_bbox(benchmark, in_session, rng):
+    """Find locations in a random 10 x 10 degree box."""
+    benchmark(
+        in_session,
+        lambda session: LocationRepositoryImpl(session).find_in_bbox(
+            random_bbox(rng), limit=PAGE_SIZE
+        ),
+    )
+
+
+@REPOSITORY
+def bench_find_within_radius(benchmark, in_session, rng):
+    """Find locations within 500 km of a random point."""
+    def find(session):
+        center = Coordinates(
+            longitude=float(rng.uniform(-180, 180)), latitude=float(rng.uniform(-80, 80))
+        )
+        return LocationRepositoryImpl(session).find_within_radius(center, 500.0, limit=PAGE_SIZE)
+    
+    benchmark(in_session, find)
+
+
+@REPOSITORY
+def bench_find_within_radius_wide(benchmark, in_session, rng):
+    """Get the first page of locations within 5,000 km of a random point, mostly candidates."""
+    def find(session):
+        center = Coordinates(
+            longitude=float(rng.uniform(-180, 180)), latitude=float(rng.uniform(-80, 80))
+        )
+        return LocationRepositoryImpl(session).find_within_radius(center, 5000.0, limit=PAGE_SIZE)
+    
+    benchmark(in_session, find)
+
+
+@REPOSITORY
+def bench_update(benchmark, in_session, location_ids):
+    """Load a location and update its description."""
+    async def update(session):
+        repository = LocationRepositoryImpl(session)
+        location = await repository.get_by_id(next(location_ids))
+        location.description = f"Updated at {datetime.utcnow().isoformat()}"
+        location.updated_at = datetime.utcnow()
+        return await repository.update(location)
+    
+    benchmark(in_session, update)
+
+
+@REPOSITORY
+def bench_delete(benchmark, in_session, unique_names, rng):
+    """Delete a location."""
+    def setup():
+        location = in_session(
+            lambda session: LocationRepositoryImpl(session).create(
+                new_location(next(unique_names), rng)
+            )
+        )
+        return (location.id,), {}
+    
+    deleted = benchmark.pedantic(
+        lambda location_id: in_session(
+            lambda session: LocationRepositoryImpl(session).delete(location_id)
+        ),
+        setup=setup,
+        rounds=50,
+    )
+    assert deleted
+
+
+@REPOSITORY
+def bench_exists_by_name_and_coordinates(benchmark, in_session, location_ids):
+    """Check a location for duplicates."""
+    location = in_session(
+        lambda session: LocationRepositoryImpl(session).get_by_id(next(location_ids))
+    )
+    exists = benchmark(
+        in_session,
+        lambda session: LocationRepositoryImpl(session).exists_by_name_and_coordinates(
+            location.name, location.longitude, location.latitude
+        ),
+    )
+    assert exists
+
+
+@REPOSITORY
+def bench_create_many(benchmark, in_session, unique_names, rng):
+    """Insert a batch of locations in one transaction."""
+    benchmark(
+        in_session,
+        lambda session: LocationRepositoryImpl(session).create_many(
+            [new_location(next(unique_names), rng) for _ in range(BATCH_SIZE)]
+        ),
+    )
+
+
+@REPOSITORY
+def bench_find_existing_keys(benchmark, in_session, location_ids):
+    """Look up the stored keys for a batch of names, as the import does."""
+    rows = in_session(
+        lambda session: LocationRepositoryImpl(session).get_all_rows(
+            ("name",), limit=BATCH_SIZE, after_id=next(location_ids)
+        )
+    )
+    names = [row["name"] for row in rows]
+    keys = benchmark(
+        in_session, lambda session: LocationRepositoryImpl(session).find_existing_keys(names)
+    )
+    assert keys
+
+
+# Use cases
+
+
+@USE_CASES
+def bench_create_location(benchmark, in_session, unique_names, rng, location_index):
+    """Validate, insert and index one location."""
+    def create(session):
+        data = LocationCreateDTO(
+            name=next(unique_names),
+            longitude=float(rng.uniform(-180, 180)),
+            latitude=float(rng.uniform(-90, 90)),
+            description="Created by the benchmark suite",
+        )
+        return CreateLocationUseCase(LocationRepositoryImpl(session), location_index).execute(data)
+    
+    benchmark(in_session, create)
+
+
+@USE_CASES
+def bench_get_locations(benchmark, in_session, location_ids):
+    """Get a page of locations after a cursor position."""
+    page = benchmark(
+        in_session,
+        lambda session: GetLocationsUseCase(LocationRepositoryImpl(session)).execute(
+            limit=PAGE_SIZE, after_id=next(location_ids)
+        ),
+    )
+    assert page.items
+
+
+@USE_CASES
+def bench_get_location_rows(benchmark, in_session, location_ids):
+    """Get a page of projected rows after a cursor position."""
+    page = benchmark(
+        in_session,
+        lambda session: GetLocationRowsUseCase(LocationRepositoryImpl(session)).execute(
+            ROW_FIELDS, limit=PAGE_SIZE, after_id=next(location_ids)
+        ),
+    )
+    assert page.items
+
+
+@USE_CASES
+def bench_get_location_by_id(benchmark, in_session, location_ids):
+    """Get one location."""
+    benchmark(
+        in_session,
+        lambda session: GetLocationByIdUseCase(LocationRepositoryImpl(session)).execute(
+            next(location_ids)
+        ),
+    )
+
+
+@USE_CASES
+def bench_find_locations_in_bbox(benchmark, in_session, rng):
+    """Find locations in a random 10 x 10 degree box."""
+    def find(session):
+        bbox = random_bbox(rng)
+        filters = LocationFilterDTO(
+            min_latitude=bbox.min_latitude,
+            max_latitude=bbox.max_latitude,
+            min_longitude=bbox.min_longitude,
+            max_longitude=bbox.max_longitude,
+        )
+        use_case = FindLocationsInAreaUseCase(LocationRepositoryImpl(session))
+        return use_case.execute(filters, limit=PAGE_SIZE)
+    
+    benchmark(in_session, find)
+
+
+@USE_CASES
+def bench_find_locations_in_radius(benchmark, in_session, rng):
+    """Find locations within 500 km of a random point, nearest first."""
+    def find(session):
+        filters = LocationFilterDTO(
+            latitude=float(rng.uniform(-80, 80)),
+            longitude=float(rng.uniform(-180, 180)),
+            radius_km=500.0,
+        )
+        use_case = FindLocationsInAreaUseCase(LocationRepositoryImpl(session))
+        return use_case.execute(filters, limit=PAGE_SIZE)
+    
+    benchmark(in_session, find)
+
+
+@USE_CASES
+def bench_get_nearest_locations(benchmark, in_session, rng, location_index):
+    """Get the ten locations nearest to a random point."""
+    def find(session):
+        use_case = GetNearestLocationsUseCase(LocationRepositoryImpl(session), location_index)
+        return use_case.execute(
+            latitude=float(rng.uniform(-80, 80)), longitude=float(rng.uniform(-180, 180)), k=10
+        )
+    
+    nearby = benchmark(in_session, find)
+    assert nearby
+
+
+@USE_CASES
+def bench_calculate_distance_matrix(benchmark, in_session, location_ids):
+    """Build the distance matrix between a batch of stored locations."""
+    origins = [DistancePointDTO(location_id=next(location_ids)) for _ in range(BATCH_SIZE)]
+    matrix = benchmark(
+        in_session,
+        lambda session: CalculateDistanceMatrixUseCase(LocationRepositoryImpl(session)).execute(
+            origins
+        ),
+    )
+    assert len(matrix.distances_km) == BATCH_SIZE
+
+
+@USE_CASES
+def bench_import_locations(benchmark, in_session, drain, unique_names, rng, location_index):
+    """Import a batch of new rows."""
+    async def rows():
+        for number in range(BATCH_SIZE):
+            values = {
+                "name": next(unique_names),
+                "longitude": str(rng.uniform(-180, 180)),
+                "latitude": str(rng.uniform(-90, 90)),
+                "description": "Imported by the benchmark suite",
+            }
+            yield LocationImportRowDTO(row=number + 1, values=values)
+    
+    def run(session):
+        use_case = ImportLocationsUseCase(LocationRepositoryImpl(session), location_index)
+        return drain(use_case.execute(rows()))
+    
+    events = benchmark(in_session, run)
+    assert events[-1].inserted == BATCH_SIZE
+
+
+@USE_CASES
+def bench_export_locations(benchmark, in_session, drain):
+    """Export every location in batches."""
+    batches = benchmark(
+        in_session,
+        lambda session: drain(
+            ExportLocationsUseCase(LocationRepositoryImpl(session)).execute(1000)
+        ),
+    )
+    assert batches
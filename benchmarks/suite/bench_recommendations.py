@@ -0,0 +1,135 @@
+"""Benchmarks for the recommendation repository and use cases."""
+import pytest
+from src.lib.recommendations.application.dtos import (
+    BulkMarkAsReviewedItemDTO,
+    MarkAsReviewedDTO,
+)
+from src.lib.recommendations.application.use_cases.bulk_mark_as_reviewed import (
+    BulkMarkAsReviewedUseCase,
+)
+from src.lib.recommendations.application.use_cases.get_recommendations import (
+    GetRecommendationsUseCase,
+)
+from src.lib.recommendations.application.use_cases.mark_as_reviewed import MarkAsReviewedUseCase
+from src.lib.recommendations.domain.entities import ReviewMark
+from src.lib.recommendations.infrastructure.orm.repositories import RecommendationRepositoryImpl
+
+REPOSITORY = pytest.mark.benchmark(group="recommendations: repository")
+USE_CASES = pytest.mark.benchmark(group="recommendations: use cases")
+
+# Marks per bulk request
+BATCH_SIZE = 100
+
+
+# Repository
+
+
+@REPOSITORY
+def bench_get_unreviewed_combinations(benchmark, in_session):
+    """Get the ten combinations due for review soonest."""
+    combinations = benchmark(
+        in_session,
+        lambda session: RecommendationRepositoryImpl(session).get_unreviewed_combinations(
+            limit=10
+        ),
+    )
+    assert len(combinations) == 10
+
+
+@REPOSITORY
+def bench_mark_as_reviewed(benchmark, in_session, location_ids, category_ids):
+    """Upsert one review, which also moves the combination in the review queue."""
+    benchmark(
+        in_session,
+        lambda session: RecommendationRepositoryImpl(session).mark_as_reviewed(
+            next(location_ids), next(category_ids)
+        ),
+    )
+
+
+@REPOSITORY
+def bench_mark_many_as_reviewed(benchmark, in_session, location_ids, category_ids):
+    """Upsert a batch of reviews in one transaction."""
+    def mark(session):
+        marks = [
+            ReviewMark(location_id=next(location_ids), category_id=next(category_ids))
+            for _ in range(BATCH_SIZE)
+        ]
+        return RecommendationRepositoryImpl(session).mark_many_as_reviewed(marks)
+    
+    benchmark(in_session, mark)
+
+
+@REPOSITORY
+def bench_get_reviewed_combinations(benchmark, in_session, location_ids, category_ids):
+    """Get the reviews of one combination."""
+    benchmark(
+        in_session,
+        lambda session: RecommendationRepositoryImpl(session).get_reviewed_combinations(
+            next(location_ids), next(category_ids)
+        ),
+    )
+
+
+@REPOSITORY
+def bench_check_location_exists(benchmark, in_session, location_ids):
+    """Check that a location exists."""
+    exists = benchmark(
+        in_session,
+        lambda session: RecommendationRepositoryImpl(session).check_location_exists(
+            next(location_ids)
+        ),
+    )
+    assert exists
+
+
+@REPOSITORY
+def bench_check_category_exists(benchmark, in_session, category_ids):
+    """Check that a category exists."""
+    exists = benchmark(
+        in_session,
+        lambda session: RecommendationRepositoryImpl(session).check_category_exists(
+            next(category_ids)
+        ),
+    )
+    assert exists
+
+
+# Use cases
+
+
+@USE_CASES
+def bench_get_recommendations(benchmark, in_session):
+    """Get the recommendations page."""
+    recommendations = benchmark(
+        in_session,
+        lambda session: GetRecommendationsUseCase(RecommendationRepositoryImpl(session)).execute(),
+    )
+    assert recommendations
+
+
+@USE_CASES
+def bench_mark_combination_as_reviewed(benchmark, in_session, location_ids, category_ids):
+    """Mark one combination as reviewed."""
+    benchmark(
+        in_session,
+        lambda session: MarkAsReviewedUseCase(RecommendationRepositoryImpl(session)).execute(
+            MarkAsReviewedDTO(location_id=next(location_ids), category_id=next(category_ids))
+        ),
+    )
+
+
+@USE_CASES
+def bench_bulk_mark_as_reviewed(benchmark, in_session, location_ids, category_ids):
+    """Mark a batch of combinations as reviewed."""
+    def mark(session):
+        items = [
+            BulkMarkAsReviewedItemDTO(
+                location_id=next(location_ids), category_id=next(category_ids)
+            )
+            for _ in range(BATCH_SIZE)
+        ]
+        return BulkMarkAsReviewedUseCase(RecommendationRepositoryImpl(session)).execute(items)
+    
+    result = benchmark(in_session, mark)
+    assert result.failed == 0
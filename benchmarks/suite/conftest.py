@@ -0,0 +1,201 @@
+"""Fixtures for the repository and use case benchmark suite.
+
+The suite runs against an SQLite file seeded at the scale chosen with
+``--scale`` (or ``--locations`` and ``--categories``). Seeded files are cached
+in ``benchmarks/.data``, and every session works on a fresh copy, so write
+benchmarks never change the data later runs start from.
+"""
+import asyncio
+import itertools
+import os
+import shutil
+import sys
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterator, List
+import numpy as np
+import pytest
+
+# Add the project root to the Python path
+ROOT_DIR = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT_DIR))
+
+from seed_data import copy_seeded_database
+
+# Named scales as (locations, categories); the review queue holds locations x categories rows
+SCALES = {
+    "small": (10_000, 50),
+    "medium": (100_000, 200),
+    "large": (1_000_000, 200),
+}
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Size and seed of the catalogue the benchmarks run against."""
+    
+    name: str
+    locations: int
+    categories: int
+    seed: int
+
+
+# Per-session state set in pytest_configure
+scale_key = pytest.StashKey[Scale]()
+work_dir_key = pytest.StashKey[Path]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the options choosing the seeded data."""
+    group = parser.getgroup("map-my-world", "Map My World benchmark data")
+    group.addoption(
+        "--scale", choices=sorted(SCALES), default="small",
+        help="Seeded catalogue size (default: small)",
+    )
+    group.addoption("--locations", type=int, help="Number of locations, overriding --scale")
+    group.addoption("--categories", type=int, help="Number of categories, overriding --scale")
+    group.addoption(
+        "--seed", type=int, default=42,
+        help="Random seed for the seeded data and the benchmark inputs",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Seed (or reuse) the database and point the application settings at a copy of it.
+    
+    Runs before any project module is imported, since settings and engines are
+    created at import time.
+    """
+    locations, categories = SCALES[config.getoption("scale")]
+    locations = config.getoption("locations") or locations
+    categories = config.getoption("categories") or categories
+    custom = (locations, categories) != SCALES[config.getoption("scale")]
+    name = "custom" if custom else config.getoption("scale")
+    scale = Scale(name, locations, categories, config.getoption("seed"))
+    config.stash[scale_key] = scale
+    
+    work_dir = Path(tempfile.mkdtemp(prefix="map-my-world-bench-"))
+    config.stash[work_dir_key] = work_dir
+    database = work_dir / "benchmark.db"
+    os.environ["DATABASE_URL"] = f"sqlite:///{database}"
+    # Production-like defaults that keep the output quiet and the timings clean
+    os.environ.setdefault("DEBUG", "false")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    os.environ.setdefault("SLOW_QUERY_THRESHOLD_MS", "0")
+    
+    copy_seeded_database(database, locations, categories, scale.seed)
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Delete the session's copy of the database."""
+    if work_dir_key in config.stash:
+        shutil.rmtree(config.stash[work_dir_key], ignore_errors=True)
+
+
+def pytest_report_header(config: pytest.Config) -> str:
+    """Show the scale the numbers were measured at."""
+    scale = config.stash[scale_key]
+    return (
+        f"benchmark data: {scale.name} scale, "
+        f"{scale.locations} locations x {scale.categories} categories, seed {scale.seed}"
+    )
+
+
+def pytest_benchmark_update_json(
+    config: pytest.Config, benchmarks: List[Any], output_json: dict
+) -> None:
+    """Record the scale in saved results, since numbers are only comparable at the same one."""
+    output_json["scale"] = asdict(config.stash[scale_key])
+
+
+def _run_inline(awaitable: Awaitable[Any]) -> Any:
+    """Run a coroutine that never suspends (as on sync sessions) without an event loop."""
+    try:
+        awaitable.send(None)
+    except StopIteration as stop:
+        return stop.value
+    awaitable.close()
+    raise RuntimeError(
+        "Coroutine suspended; run the suite with DATABASE_ASYNC=false or use the event loop"
+    )
+
+
+@pytest.fixture(scope="session")
+def scale(pytestconfig: pytest.Config) -> Scale:
+    """Size and seed of the seeded catalogue."""
+    return pytestconfig.stash[scale_key]
+
+
+@pytest.fixture(scope="session")
+def run() -> Iterator[Callable[[Awaitable[Any]], Any]]:
+    """Run a coroutine to completion: inline on sync sessions, on a loop with DATABASE_ASYNC."""
+    from config.core import get_settings
+    
+    if not get_settings().database_async:
+        yield _run_inline
+        return
+    
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def in_session(
+    run: Callable[[Awaitable[Any]], Any],
+) -> Callable[[Callable[[Any], Awaitable[Any]]], Any]:
+    """Call ``operation(session)`` in a fresh session, as a request would, and return its result."""
+    from config.core import get_settings
+    from config.database import AsyncSessionLocal, SessionLocal
+    
+    if get_settings().database_async:
+        async def call_async(operation: Callable[[Any], Awaitable[Any]]) -> Any:
+            async with AsyncSessionLocal() as session:
+                return await operation(session)
+        
+        return lambda operation: run(call_async(operation))
+    
+    def call(operation: Callable[[Any], Awaitable[Any]]) -> Any:
+        session = SessionLocal()
+        try:
+            return run(operation(session))
+        finally:
+            session.close()
+    
+    return call
+
+
+@pytest.fixture
+def rng(scale: Scale) -> np.random.Generator:
+    """Random generator for benchmark inputs, reseeded for every benchmark."""
+    return np.random.default_rng(scale.seed)
+
+
+@pytest.fixture
+def location_ids(scale: Scale, rng: np.random.Generator) -> Iterator[int]:
+    """Endless random IDs of seeded locations."""
+    return itertools.cycle(rng.integers(1, scale.locations + 1, 1024).tolist())
+
+
+@pytest.fixture
+def category_ids(scale: Scale, rng: np.random.Generator) -> Iterator[int]:
+    """Endless random IDs of seeded categories."""
+    return itertools.cycle(rng.integers(1, scale.categories + 1, 1024).tolist())
+
+
+@pytest.fixture(scope="session")
+def unique_names() -> Iterator[str]:
+    """Endless names no seeded or previously created row uses."""
+    return (f"Benchmark {number}" for number in itertools.count(1))
+
+
+async def _drain(iterator: Any) -> List[Any]:
+    """Collect every item of an async iterator."""
+    return [item async for item in iterator]
+
+
+@pytest.fixture(scope="session")
+def drain() -> Callable[[Any], Awaitable[List[Any]]]:
+    """Turn an async iterator, such as a streaming repository method or use case, into a list."""
+    return _drain
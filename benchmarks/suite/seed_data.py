@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Seed an SQLite file with a reproducible catalogue for the benchmark suite."""
+import argparse
+import os
+import shutil
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+from sqlalchemy import create_engine, event, insert
+
+# Seeded databases, cached per size and seed
+DATA_DIR = Path(__file__).resolve().parents[1] / ".data"
+
+# Rows per executemany batch
+BATCH_SIZE = 10_000
+
+# Words for names and descriptions, so searches and name filters have realistic matches
+ADJECTIVES = [
+    "Central", "Old", "Grand", "Royal", "Little",
+    "Golden", "Hidden", "Riverside", "Sunny", "Quiet",
+]
+NOUNS = [
+    "Park", "Museum", "Market", "Garden", "Bridge",
+    "Tower", "Square", "Harbor", "Library", "Theater",
+]
+THEMES = [
+    "food", "history", "art", "nature", "music",
+    "shopping", "sports", "science", "family", "nightlife",
+]
+
+# Reviews are spread over this many days before the seeding date
+REVIEW_WINDOW_DAYS = 60
+
+
+def _fast_load_pragmas(dbapi_connection, connection_record) -> None:
+    """Skip the journal and fsyncs while loading a file nobody else reads yet."""
+    cursor = dbapi_connection.cursor()
+    for pragma in (
+        "journal_mode = OFF", "synchronous = OFF", "cache_size = -262144", "temp_store = MEMORY"
+    ):
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
+
+def seed_database(path: Path, locations: int, categories: int, seed: int = 42) -> None:
+    """Create the schema in a new SQLite file at ``path`` and fill it.
+    
+    Inserts ``categories`` categories, ``locations`` locations with random
+    coordinates and about one review per location. The schema's triggers fill
+    the search and spatial indexes and the review queue, which holds one row
+    per location-category combination.
+    """
+    from config.database import Base
+    from src.lib.categories.infrastructure.orm.models import CategoryModel
+    from src.lib.locations.infrastructure.orm.models import LocationModel
+    from src.lib.recommendations.infrastructure.orm.models import LocationCategoryReviewModel
+    
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix(".partial")
+    partial.unlink(missing_ok=True)
+    
+    rng = np.random.default_rng(seed)
+    start = datetime(2024, 1, 1)
+    now = datetime.utcnow()
+    
+    engine = create_engine(f"sqlite:///{partial}")
+    # Renamed into place only once complete, so a crash can't leave a half-seeded cache
+    event.listen(engine, "connect", _fast_load_pragmas)
+    try:
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as connection:
+            connection.execute(insert(CategoryModel.__table__), [
+                {
+                    "name": f"{THEMES[index % len(THEMES)].title()} {index + 1}",
+                    "description": f"Places for {THEMES[index % len(THEMES)]} lovers",
+                    "created_at": start,
+                    "updated_at": start,
+                }
+                for index in range(categories)
+            ])
+            
+            words = rng.integers(0, len(ADJECTIVES), (locations, 3))
+            latitudes = rng.uniform(-90, 90, locations)
+            longitudes = rng.uniform(-180, 180, locations)
+            for batch_start in range(0, locations, BATCH_SIZE):
+                batch_end = min(batch_start + BATCH_SIZE, locations)
+                connection.execute(insert(LocationModel.__table__), [
+                    {
+                        "name": (
+                            f"{ADJECTIVES[words[index, 0]]} {NOUNS[words[index, 1]]} {index + 1}"
+                        ),
+                        "longitude": float(longitudes[index]),
+                        "latitude": float(latitudes[index]),
+                        "description": (
+                            f"A {NOUNS[words[index, 1]].lower()} known for "
+                            f"{THEMES[words[index, 2]]}"
+                        ),
+                        "created_at": start + timedelta(seconds=index),
+                        "updated_at": start + timedelta(seconds=index),
+                    }
+                    for index in range(batch_start, batch_end)
+                ])
+            
+            # About one review per location, on distinct combinations
+            pairs = np.unique(
+                np.column_stack((
+                    rng.integers(1, locations + 1, locations),
+                    rng.integers(1, categories + 1, locations),
+                )),
+                axis=0,
+            )
+            ages = rng.uniform(0, REVIEW_WINDOW_DAYS * 86400, len(pairs))
+            for batch_start in range(0, len(pairs), BATCH_SIZE):
+                connection.execute(insert(LocationCategoryReviewModel.__table__), [
+                    {
+                        "location_id": int(location_id),
+                        "category_id": int(category_id),
+                        "reviewed_at": now - timedelta(seconds=float(age)),
+                        "created_at": now - timedelta(seconds=float(age)),
+                    }
+                    for (location_id, category_id), age in zip(
+                        pairs[batch_start:batch_start + BATCH_SIZE],
+                        ages[batch_start:batch_start + BATCH_SIZE],
+                    )
+                ])
+        
+        with engine.connect() as connection:
+            connection.exec_driver_sql("ANALYZE")
+    finally:
+        engine.dispose()
+    
+    partial.replace(path)
+
+
+def copy_seeded_database(
+    destination: Path, locations: int, categories: int, seed: int = 42
+) -> None:
+    """Copy a seeded catalogue to ``destination``, seeding it into ``DATA_DIR`` if not cached."""
+    seeded = DATA_DIR / f"seed-{locations}x{categories}-{seed}.db"
+    if not seeded.exists():
+        print(f"Seeding {locations} locations x {categories} categories into {seeded}...")
+        seed_database(seeded, locations, categories, seed)
+    shutil.copyfile(seeded, destination)
+
+
+def main() -> None:
+    """Seed a database file from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", type=Path, help="SQLite file to create")
+    parser.add_argument("--locations", type=int, default=10_000, help="Number of locations")
+    parser.add_argument("--categories", type=int, default=50, help="Number of categories")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the generated data")
+    args = parser.parse_args()
+    
+    if args.path.exists():
+        parser.error(f"{args.path} already exists")
+    
+    start_time = time.perf_counter()
+    seed_database(args.path, args.locations, args.categories, args.seed)
+    elapsed = time.perf_counter() - start_time
+    print(f"Seeded {args.locations} locations x {args.categories} categories in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 """Core configuration for Map My World API."""
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import validator
 
@@ -9,6 +9,57 @@ class Settings(BaseSettings):
     
     # Database
     database_url: str = "sqlite:///./map_my_world.db"
+    database_async: bool = False
+    
+    # Connection pool
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_pre_ping: bool = False
+    pool_recycle: int = 3600
+    
+    # SQLite tuning (applied to every new connection)
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_mmap_size: int = 268435456
+    sqlite_cache_size: int = -65536
+    sqlite_temp_store: str = "MEMORY"
+    sqlite_busy_timeout: int = 5000
+    sqlite_foreign_keys: bool = True
+    sqlite_optimize_interval: int = 3600
+    
+    # Nearest-neighbour index
+    knn_leaf_size: int = 64
+    knn_rebuild_threshold: int = 4096
+    
+    # Entity cache for get-by-id lookups (size 0 disables it)
+    entity_cache_size: int = 10000
+    entity_cache_ttl: float = 300.0
+    entity_cache_negative_ttl: float = 30.0
+    
+    # HTTP caching: seconds clients may reuse a response before revalidating it
+    http_cache_max_age: int = 0
+    
+    # Prometheus metrics at /metrics (request and SQL statement timings)
+    metrics_enabled: bool = True
+    
+    # Per-request statement accounting: Server-Timing header and warnings (0 disables a check)
+    server_timing_enabled: bool = False
+    statement_budget: int = 20
+    repeated_statement_threshold: int = 5
+    
+    # Slow-query log with query plans (threshold 0 disables it, empty file disables the file)
+    slow_query_threshold_ms: float = 100.0
+    slow_query_buffer_size: int = 100
+    slow_query_log_file: str = "logs/slow_queries.log"
+    
+    # On-demand profiling of requests sent with "X-Profile: <secret>" (needs a secret)
+    profiling_enabled: bool = False
+    profiling_secret: str = ""
+    profiling_dir: str = "logs/profiles"
+    
+    # Admin endpoints under /admin, answered only with "X-Admin-Secret: <secret>" (needs a secret)
+    admin_secret: str = ""
     
     # Server
     host: str = "127.0.0.1"
@@ -18,6 +69,10 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = "INFO"
     log_format: str = "colored"
+    log_enqueue: bool = False
+    log_diagnose: bool = True
+    log_levels: Dict[str, str] = {}
+    log_sample_rate: float = 1.0
     
     # CORS
     cors_origins: List[str] = ["http://localhost:3000", "http://localhost:8080"]
@@ -33,6 +88,43 @@ class Settings(BaseSettings):
             "allow_credentials": self.cors_credentials,
             "allow_methods": self.cors_methods,
             "allow_headers": self.cors_headers,
+            "expose_headers": ["Link", "X-Next-Cursor"],
+        }
+    
+    @property
+    def request_stats_enabled(self) -> bool:
+        """Whether requests need their SQL statements and timings accounted."""
+        return self.server_timing_enabled or self.statement_budget > 0 or self.repeated_statement_threshold > 0
+    
+    @property
+    def async_database_url(self) -> str:
+        """Get the database URL for the asyncio driver."""
+        if self.database_url.startswith("sqlite://"):
+            return self.database_url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+        return self.database_url
+    
+    @property
+    def pool_settings(self) -> dict:
+        """Get connection pool settings for SQLAlchemy engines."""
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_pre_ping": self.pool_pre_ping,
+            "pool_recycle": self.pool_recycle,
+        }
+    
+    @property
+    def sqlite_pragmas(self) -> dict:
+        """Get the PRAGMA values applied to each new SQLite connection."""
+        return {
+            "journal_mode": self.sqlite_journal_mode,
+            "synchronous": self.sqlite_synchronous,
+            "mmap_size": self.sqlite_mmap_size,
+            "cache_size": self.sqlite_cache_size,
+            "temp_store": self.sqlite_temp_store,
+            "busy_timeout": self.sqlite_busy_timeout,
+            "foreign_keys": "ON" if self.sqlite_foreign_keys else "OFF",
         }
     
     @validator("log_level")
@@ -43,6 +135,30 @@ class Settings(BaseSettings):
             raise ValueError(f"Log level must be one of {valid_levels}")
         return v.upper()
     
+    @validator("log_format")
+    def validate_log_format(cls, v: str) -> str:
+        """Validate log format."""
+        valid_formats = ["colored", "plain", "json"]
+        if v.lower() not in valid_formats:
+            raise ValueError(f"Log format must be one of {valid_formats}")
+        return v.lower()
+    
+    @validator("log_levels")
+    def validate_log_levels(cls, v: Dict[str, str]) -> Dict[str, str]:
+        """Validate per-module log levels."""
+        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+        for module, level in v.items():
+            if level.upper() not in valid_levels:
+                raise ValueError(f"Log level for {module} must be one of {valid_levels}")
+        return {module: level.upper() for module, level in v.items()}
+    
+    @validator("log_sample_rate")
+    def validate_log_sample_rate(cls, v: float) -> float:
+        """Validate the fraction of requests whose INFO logs are kept."""
+        if not 0.0 <= v <= 1.0:
+            raise ValueError("Log sample rate must be between 0 and 1")
+        return v
+    
     model_config = {
         "env_file": ".env",
         "case_sensitive": False
@@ -1,21 +1,87 @@
 """Database configuration for Map My World API."""
-from sqlalchemy import create_engine
+from typing import Any, AsyncGenerator, Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from config.core import get_settings
+from src.shared.database.instrumentation import register_statement_listeners
+from src.shared.database.pool import MeteredAsyncAdaptedQueuePool, MeteredPoolMixin, MeteredQueuePool
+from src.shared.database.slow_queries import SlowQueryRecorder
 
 settings = get_settings()
 
+
+def _pool_options(pool_class: type) -> dict:
+    """Get pool arguments, leaving in-memory SQLite on its single-connection pool."""
+    if settings.database_url in ("sqlite://", "sqlite:///:memory:"):
+        return {}
+    return {"poolclass": pool_class, **settings.pool_settings}
+
+
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.database_url,
     connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
     echo=settings.debug,
+    **_pool_options(MeteredQueuePool),
 )
 
+
+def _apply_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Apply the configured PRAGMA profile to a freshly opened SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma, value in settings.sqlite_pragmas.items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+    finally:
+        cursor.close()
+
+
+def _register_sqlite_pragmas(target: Engine) -> None:
+    """Register the PRAGMA hook on an engine when it talks to SQLite."""
+    if target.dialect.name == "sqlite":
+        event.listen(target, "connect", _apply_sqlite_pragmas)
+
+
+_register_sqlite_pragmas(engine)
+
+# Statements slower than the threshold, shared by both engines
+slow_query_recorder: Optional[SlowQueryRecorder] = None
+if settings.slow_query_threshold_ms > 0:
+    slow_query_recorder = SlowQueryRecorder(settings.slow_query_threshold_ms, settings.slow_query_buffer_size)
+
+
+def _register_statement_listeners(target: Engine) -> None:
+    """Register the statement timing hooks that the current settings need."""
+    if settings.metrics_enabled or settings.request_stats_enabled or slow_query_recorder is not None:
+        register_statement_listeners(target, metrics=settings.metrics_enabled, slow_queries=slow_query_recorder)
+
+
+_register_statement_listeners(engine)
+
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Create the asyncio engine only when enabled, so its driver (aiosqlite) stays optional
+async_engine: Optional[AsyncEngine] = None
+if settings.database_async:
+    async_engine = create_async_engine(
+        settings.async_database_url,
+        echo=settings.debug,
+        **_pool_options(MeteredAsyncAdaptedQueuePool),
+    )
+    _register_sqlite_pragmas(async_engine.sync_engine)
+    _register_statement_listeners(async_engine.sync_engine)
+
+# Create AsyncSessionLocal class
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Create Base class for models
 Base = declarative_base()
 
@@ -29,6 +95,35 @@ def get_db() -> SessionLocal:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Get asyncio database session dependency."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_pool_status() -> dict:
+    """Get checkout metrics and occupancy of the active connection pool."""
+    pool = async_engine.pool if async_engine is not None else engine.pool
+    if not isinstance(pool, MeteredPoolMixin):
+        return {"status": pool.status()}
+    return pool.metrics.snapshot(pool)
+
+
+def get_slow_queries() -> dict:
+    """Get the slow-query threshold and the most recent slow statements."""
+    if slow_query_recorder is None:
+        return {"enabled": False, "queries": []}
+    return {"enabled": True, **slow_query_recorder.snapshot()}
+
+
+def optimize_database() -> None:
+    """Run ``PRAGMA optimize`` so SQLite refreshes statistics the planner relies on."""
+    if engine.dialect.name != "sqlite":
+        return
+    with engine.connect() as connection:
+        connection.exec_driver_sql("PRAGMA optimize")
+
+
 def create_tables() -> None:
     """Create all database tables."""
-    Base.metadata.create_all(bind=engine) 
\ No newline at end of file
+    Base.metadata.create_all(bind=engine)
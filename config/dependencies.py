@@ -1,18 +1,31 @@
 """Dependency injection configuration for Map My World API."""
-from typing import Generator
+from typing import AsyncGenerator, Union
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from dependency_injector import containers, providers
-from config.database import get_db, SessionLocal
+from config.core import get_settings
+from config.database import AsyncSessionLocal, SessionLocal
 from src.lib.locations.infrastructure.orm.repositories import LocationRepositoryImpl
+from src.lib.locations.infrastructure.spatial.knn_index import LocationKNNIndex
 from src.lib.categories.infrastructure.orm.repositories import CategoryRepositoryImpl
 from src.lib.recommendations.infrastructure.orm.repositories import RecommendationRepositoryImpl
+from src.shared.cache.lru import LRUCache
+from src.shared.database.versions import TableVersionRepository
 from src.lib.locations.application.use_cases.create_location import CreateLocationUseCase
-from src.lib.locations.application.use_cases.get_locations import GetLocationsUseCase
+from src.lib.locations.application.use_cases.get_location_rows import GetLocationRowsUseCase
 from src.lib.locations.application.use_cases.get_location_by_id import GetLocationByIdUseCase
+from src.lib.locations.application.use_cases.find_locations_in_area import FindLocationsInAreaUseCase
+from src.lib.locations.application.use_cases.get_nearest_locations import GetNearestLocationsUseCase
+from src.lib.locations.application.use_cases.calculate_distance_matrix import CalculateDistanceMatrixUseCase
+from src.lib.locations.application.use_cases.import_locations import ImportLocationsUseCase
+from src.lib.locations.application.use_cases.export_locations import ExportLocationsUseCase
 from src.lib.categories.application.use_cases.create_category import CreateCategoryUseCase
 from src.lib.categories.application.use_cases.get_categories import GetCategoriesUseCase
+from src.lib.categories.application.use_cases.export_categories import ExportCategoriesUseCase
 from src.lib.recommendations.application.use_cases.get_recommendations import GetRecommendationsUseCase
 from src.lib.recommendations.application.use_cases.mark_as_reviewed import MarkAsReviewedUseCase
+from src.lib.recommendations.application.use_cases.bulk_mark_as_reviewed import BulkMarkAsReviewedUseCase
 
 
 class Container(containers.DeclarativeContainer):
@@ -22,17 +35,41 @@ class Container(containers.DeclarativeContainer):
     config = providers.Configuration()
     
     # Database
-    db_session = providers.Singleton(SessionLocal)
+    db_session = providers.Factory(SessionLocal)
+    
+    # Shared in-process nearest-neighbour index, loaded at startup
+    location_index = providers.Singleton(
+        LocationKNNIndex,
+        leaf_size=get_settings().knn_leaf_size,
+        rebuild_threshold=get_settings().knn_rebuild_threshold,
+    )
+    
+    # Shared in-process caches for get-by-id lookups, one per entity type
+    location_cache = providers.Singleton(
+        LRUCache,
+        max_size=get_settings().entity_cache_size,
+        ttl_seconds=get_settings().entity_cache_ttl,
+        negative_ttl_seconds=get_settings().entity_cache_negative_ttl,
+    )
+    
+    category_cache = providers.Singleton(
+        LRUCache,
+        max_size=get_settings().entity_cache_size,
+        ttl_seconds=get_settings().entity_cache_ttl,
+        negative_ttl_seconds=get_settings().entity_cache_negative_ttl,
+    )
     
     # Repositories
     location_repository = providers.Factory(
         LocationRepositoryImpl,
         session=db_session,
+        cache=location_cache,
     )
     
     category_repository = providers.Factory(
         CategoryRepositoryImpl,
         session=db_session,
+        cache=category_cache,
     )
     
     recommendation_repository = providers.Factory(
@@ -40,14 +77,20 @@ class Container(containers.DeclarativeContainer):
         session=db_session,
     )
     
+    table_version_repository = providers.Factory(
+        TableVersionRepository,
+        session=db_session,
+    )
+    
     # Use Cases
     create_location_use_case = providers.Factory(
         CreateLocationUseCase,
         location_repository=location_repository,
+        location_index=location_index,
     )
     
-    get_locations_use_case = providers.Factory(
-        GetLocationsUseCase,
+    get_location_rows_use_case = providers.Factory(
+        GetLocationRowsUseCase,
         location_repository=location_repository,
     )
     
@@ -56,6 +99,33 @@ class Container(containers.DeclarativeContainer):
         location_repository=location_repository,
     )
     
+    find_locations_in_area_use_case = providers.Factory(
+        FindLocationsInAreaUseCase,
+        location_repository=location_repository,
+    )
+    
+    get_nearest_locations_use_case = providers.Factory(
+        GetNearestLocationsUseCase,
+        location_repository=location_repository,
+        location_index=location_index,
+    )
+    
+    calculate_distance_matrix_use_case = providers.Factory(
+        CalculateDistanceMatrixUseCase,
+        location_repository=location_repository,
+    )
+    
+    import_locations_use_case = providers.Factory(
+        ImportLocationsUseCase,
+        location_repository=location_repository,
+        location_index=location_index,
+    )
+    
+    export_locations_use_case = providers.Factory(
+        ExportLocationsUseCase,
+        location_repository=location_repository,
+    )
+    
     create_category_use_case = providers.Factory(
         CreateCategoryUseCase,
         category_repository=category_repository,
@@ -66,6 +136,11 @@ class Container(containers.DeclarativeContainer):
         category_repository=category_repository,
     )
     
+    export_categories_use_case = providers.Factory(
+        ExportCategoriesUseCase,
+        category_repository=category_repository,
+    )
+    
     get_recommendations_use_case = providers.Factory(
         GetRecommendationsUseCase,
         recommendation_repository=recommendation_repository,
@@ -75,6 +150,11 @@ class Container(containers.DeclarativeContainer):
         MarkAsReviewedUseCase,
         recommendation_repository=recommendation_repository,
     )
+    
+    bulk_mark_as_reviewed_use_case = providers.Factory(
+        BulkMarkAsReviewedUseCase,
+        recommendation_repository=recommendation_repository,
+    )
 
 
 # Global container instance
@@ -90,42 +170,125 @@ container = Container()
 # )
 
 
-def get_db_session() -> Generator[Session, None, None]:
-    """Get database session dependency."""
-    return get_db()
+async def get_db_session() -> AsyncGenerator[Union[Session, AsyncSession], None]:
+    """Get database session dependency.
+    
+    Every request gets its own session (an ``AsyncSession`` when ``database_async``
+    is enabled), checked out of the engine's pool and closed once the response has
+    been sent, so uncommitted work never leaks into the next request.
+    """
+    if get_settings().database_async:
+        async with AsyncSessionLocal() as session:
+            yield session
+    else:
+        session = container.db_session()
+        try:
+            yield session
+        finally:
+            session.close()
+
+
+def get_table_version_repository(
+    session: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> TableVersionRepository:
+    """Get table version repository dependency."""
+    return container.table_version_repository(session=session)
 
 
 # Use case dependencies
-def get_create_location_use_case() -> CreateLocationUseCase:
+def get_create_location_use_case(
+    session: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> CreateLocationUseCase:
     """Get create location use case dependency."""
-    return container.create_location_use_case()
+    return container.create_location_use_case(location_repository__session=session)
 
 
-def get_get_locations_use_case() -> GetLocationsUseCase:
-    """Get get locations use case dependency."""
-    return container.get_locations_use_case()
+def get_get_location_rows_use_case(
+    session: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> GetLocationRowsUseCase:
+    """Get get location rows use case dependency."""
+    return container.get_location_rows_use_case(location_repository__session=session)
 
 
-def get_get_location_by_id_use_case() -> GetLocationByIdUseCase:
+def get_get_location_by_id_use_case(
+    session: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> GetLocationByIdUseCase:
     """Get get location by id use case dependency."""
-    return container.get_location_by_id_use_case()
+    return container.get_location_by_id_use_case(location_repository__session=session)
+
+
+def get_find_locations_in_area_use_case(
+    session: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> FindLocationsInAreaUseCase:
+    """Get find locations in area use case dependency."""
+    return container.find_locations_in_area_use_case(location_repository__session=session)
+
 
+def get_get_nearest_locations_use_case(
+    session: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> GetNearestLocationsUseCase:
+    """Get get nearest locations use case dependency."""
+    return container.get_nearest_locations_use_case(location_repository__session=session)
 
-def get_create_category_use_case() -> CreateCategoryUseCase:
+
+def get_calculate_distance_matrix_use_case(
+    session: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> CalculateDistanceMatrixUseCase:
+    """Get calculate distance matrix use case dependency."""
+    return container.calculate_distance_matrix_use_case(location_repository__session=session)
+
+
+def get_import_locations_use_case(
+    session: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> ImportLocationsUseCase:
+    """Get import locations use case dependency."""
+    return container.import_locations_use_case(location_repository__session=session)
+
+
+def get_export_locations_use_case(
+    session: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> ExportLocationsUseCase:
+    """Get export locations use case dependency."""
+    return container.export_locations_use_case(location_repository__session=session)
+
+
+def get_create_category_use_case(
+    session: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> CreateCategoryUseCase:
     """Get create category use case dependency."""
-    return container.create_category_use_case()
+    return container.create_category_use_case(category_repository__session=session)
 
 
-def get_get_categories_use_case() -> GetCategoriesUseCase:
+def get_get_categories_use_case(
+    session: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> GetCategoriesUseCase:
     """Get get categories use case dependency."""
-    return container.get_categories_use_case()
+    return container.get_categories_use_case(category_repository__session=session)
+
+
+def get_export_categories_use_case(
+    session: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> ExportCategoriesUseCase:
+    """Get export categories use case dependency."""
+    return container.export_categories_use_case(category_repository__session=session)
 
 
-def get_get_recommendations_use_case() -> GetRecommendationsUseCase:
+def get_get_recommendations_use_case(
+    session: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> GetRecommendationsUseCase:
     """Get get recommendations use case dependency."""
-    return container.get_recommendations_use_case()
+    return container.get_recommendations_use_case(recommendation_repository__session=session)
 
 
-def get_mark_as_reviewed_use_case() -> MarkAsReviewedUseCase:
+def get_mark_as_reviewed_use_case(
+    session: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> MarkAsReviewedUseCase:
     """Get mark as reviewed use case dependency."""
-    return container.mark_as_reviewed_use_case() 
\ No newline at end of file
+    return container.mark_as_reviewed_use_case(recommendation_repository__session=session)
+
+
+def get_bulk_mark_as_reviewed_use_case(
+    session: Union[Session, AsyncSession] = Depends(get_db_session)
+) -> BulkMarkAsReviewedUseCase:
+    """Get bulk mark as reviewed use case dependency."""
+    return container.bulk_mark_as_reviewed_use_case(recommendation_repository__session=session)
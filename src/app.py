@@ -1,14 +1,64 @@
 """FastAPI application factory for Map My World API."""
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from config.core import get_settings
-from src.shared.middleware.error_handler import ErrorHandlerMiddleware
+from config.database import create_tables, engine, optimize_database
+from src.shared.middleware.error_handler import ErrorHandlerMiddleware, register_exception_handlers
 from src.shared.middleware.logging_middleware import LoggingMiddleware
+from src.shared.middleware.metrics_middleware import MetricsMiddleware
+from src.shared.middleware.profiling_middleware import ProfilingMiddleware
+from src.shared.middleware.request_stats_middleware import RequestStatsMiddleware
 from src.shared.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+async def _optimize_periodically(interval_seconds: int) -> None:
+    """Run ``PRAGMA optimize`` every ``interval_seconds`` while the app is up."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await run_in_threadpool(optimize_database)
+            logger.info("Periodic database optimization completed")
+        except Exception as e:
+            logger.error("Periodic database optimization failed: {}", e)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run startup and shutdown tasks for the application."""
+    settings = get_settings()
+    
+    # Bring the schema (tables, search indexes and their triggers) up to date
+    await run_in_threadpool(create_tables)
+    
+    # Load the nearest-neighbour index; later inserts are added by CreateLocationUseCase
+    from config.dependencies import container
+    from src.lib.locations.infrastructure.spatial.knn_index import load_location_index
+    await run_in_threadpool(load_location_index, container.location_index(), engine)
+    
+    optimize_task = None
+    if settings.sqlite_optimize_interval > 0:
+        optimize_task = asyncio.create_task(_optimize_periodically(settings.sqlite_optimize_interval))
+    
+    yield
+    
+    if optimize_task is not None:
+        optimize_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await optimize_task
+    
+    await run_in_threadpool(optimize_database)
+    logger.info("Database optimized on shutdown")
+    
+    # Flush records still queued by enqueued sinks
+    await logger.complete()
+
+
 def create_app() -> FastAPI:
     """Factory to create the FastAPI application."""
     settings = get_settings()
@@ -18,22 +68,44 @@ def create_app() -> FastAPI:
         description="API for exploring and reviewing locations",
         version="1.0.0",
         docs_url="/docs",
-        redoc_url="/redoc"
+        redoc_url="/redoc",
+        lifespan=lifespan,
     )
     
-    # Middleware
+    # Middleware (the first added is the innermost, so profiles cover the handler only)
+    if settings.profiling_enabled:
+        if settings.profiling_secret:
+            app.add_middleware(ProfilingMiddleware, secret=settings.profiling_secret, directory=settings.profiling_dir)
+        else:
+            logger.warning("Request profiling is enabled but PROFILING_SECRET is empty; profiling stays off")
     app.add_middleware(CORSMiddleware, **settings.cors_settings)
     app.add_middleware(ErrorHandlerMiddleware)
+    if settings.request_stats_enabled:
+        app.add_middleware(
+            RequestStatsMiddleware,
+            server_timing=settings.server_timing_enabled,
+            statement_budget=settings.statement_budget,
+            repeated_statement_threshold=settings.repeated_statement_threshold,
+        )
     app.add_middleware(LoggingMiddleware)
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+    
+    # Exception handlers
+    register_exception_handlers(app)
     
     # Register routes
     from src.lib.locations.infrastructure.api.routes import router as locations_router
     from src.lib.categories.infrastructure.api.routes import router as categories_router
     from src.lib.recommendations.infrastructure.api.routes import router as recommendations_router
+    from src.shared.monitoring.routes import metrics_router, router as monitoring_router
     
     app.include_router(locations_router, prefix="/api/v1")
     app.include_router(categories_router, prefix="/api/v1")
     app.include_router(recommendations_router, prefix="/api/v1")
+    app.include_router(monitoring_router, prefix="/api/v1")
+    if settings.metrics_enabled:
+        app.include_router(metrics_router)
     
     logger.info("FastAPI application initialized successfully")
     return app 
\ No newline at end of file
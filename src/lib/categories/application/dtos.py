@@ -1,7 +1,8 @@
 """DTOs for categories application layer."""
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+from ..domain.entities import Category
 
 
 @dataclass
@@ -38,4 +39,12 @@ class CategoryResponseDTO:
 class CategoryFilterDTO:
     """DTO for filtering categories."""
     
-    name: Optional[str] = None 
\ No newline at end of file
+    name: Optional[str] = None 
+
+
+@dataclass
+class CategoryPageDTO:
+    """DTO for one keyset-paginated page of categories."""
+    
+    items: List[Category]
+    next_after_id: Optional[int] = None
\ No newline at end of file
@@ -17,13 +17,13 @@ class CreateCategoryUseCase:
     
     async def execute(self, category_data: CategoryCreateDTO) -> CategoryResponseDTO:
         """Execute the create category use case."""
-        logger.info(f"Creating category: {category_data.name}")
+        logger.info("Creating category: {}", category_data.name)
         
         # Check for duplicates
         exists = await self.category_repository.exists_by_name(category_data.name)
         
         if exists:
-            logger.warning(f"Duplicate category found: {category_data.name}")
+            logger.warning("Duplicate category found: {}", category_data.name)
             raise DuplicateCategoryError(name=category_data.name)
         
         # Create domain entity
@@ -39,5 +39,5 @@ class CreateCategoryUseCase:
         # Save to repository
         created_category = await self.category_repository.create(category)
         
-        logger.info(f"Category created successfully: {created_category.id}")
+        logger.info("Category created successfully: {}", created_category.id)
         return CategoryResponseDTO.from_domain(created_category) 
\ No newline at end of file
@@ -0,0 +1,23 @@
+"""Export categories use case."""
+from typing import AsyncIterator, List
+from ...domain.entities import Category
+from ...domain.repositories import CategoryRepository
+from src.shared.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_EXPORT_BATCH_SIZE = 1000
+
+
+class ExportCategoriesUseCase:
+    """Use case for streaming every category in ID order."""
+    
+    def __init__(self, category_repository: CategoryRepository) -> None:
+        self.category_repository = category_repository
+    
+    async def execute(self, batch_size: int = DEFAULT_EXPORT_BATCH_SIZE) -> AsyncIterator[List[Category]]:
+        """Execute the export, yielding categories in batches as they are read."""
+        logger.info("Exporting categories with batch size {}", batch_size)
+        
+        async for batch in self.category_repository.stream_all(batch_size):
+            yield batch
@@ -1,7 +1,8 @@
 """Get categories use case."""
-from typing import List, Optional
+from typing import Optional
 from ...domain.repositories import CategoryRepository
-from ...domain.entities import Category
+from ..dtos import CategoryPageDTO
+from src.shared.pagination.cursor import resolve_page_size
 from src.shared.logging.logger import get_logger
 from src.shared.exceptions.http_errors import InternalServerError
 
@@ -18,23 +19,37 @@ class GetCategoriesUseCase:
         self, 
         limit: Optional[int] = None,
         offset: int = 0,
-        name_filter: Optional[str] = None
-    ) -> List[Category]:
+        name_filter: Optional[str] = None,
+        after_id: Optional[int] = None,
+        search: Optional[str] = None
+    ) -> CategoryPageDTO:
         """Execute the get categories use case with pagination and filtering."""
-        logger.info(f"Getting categories: limit={limit}, offset={offset}, name_filter={name_filter}")
+        logger.info("Getting categories: limit={}, offset={}, name_filter={}, after_id={}, search={}", limit, offset, name_filter, after_id, search)
+        
+        page_size = resolve_page_size(limit)
         
         try:
+            # Fetch one extra row to learn whether another page follows
             categories = await self.category_repository.get_all(
-                limit=limit,
+                limit=page_size + 1,
                 offset=offset,
-                name_filter=name_filter
+                name_filter=name_filter,
+                after_id=after_id,
+                search=search
             )
             
-            logger.info(f"Successfully retrieved {len(categories)} categories")
-            return categories
+            next_after_id = None
+            if len(categories) > page_size:
+                categories = categories[:page_size]
+                # Search results are ranked, not ID-ordered, so they page by offset only
+                if search is None:
+                    next_after_id = categories[-1].id
+            
+            logger.info("Successfully retrieved {} categories", len(categories))
+            return CategoryPageDTO(items=categories, next_after_id=next_after_id)
             
         except Exception as e:
-            logger.error(f"Error fetching categories: {str(e)}")
+            logger.error("Error fetching categories: {}", e)
             raise InternalServerError(
                 error="Failed to retrieve categories",
                 details=[{"context": "database", "message": "Error querying categories"}]
@@ -1,5 +1,5 @@
 """Repository interfaces for categories domain."""
-from typing import Protocol, List, Optional
+from typing import AsyncIterator, Protocol, List, Optional
 from .entities import Category
 
 
@@ -18,11 +18,17 @@ class CategoryRepository(Protocol):
         self, 
         limit: Optional[int] = None,
         offset: int = 0,
-        name_filter: Optional[str] = None
+        name_filter: Optional[str] = None,
+        after_id: Optional[int] = None,
+        search: Optional[str] = None
     ) -> List[Category]:
         """Get all categories with optional filtering and pagination."""
         ...
     
+    def stream_all(self, batch_size: int) -> AsyncIterator[List[Category]]:
+        """Stream every category ordered by ID, ``batch_size`` at a time."""
+        ...
+    
     async def update(self, category: Category) -> Category:
         """Update an existing category."""
         ...
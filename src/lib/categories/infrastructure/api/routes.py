@@ -1,18 +1,40 @@
 """FastAPI routes for categories."""
-from typing import List
-from fastapi import APIRouter, Depends
+from typing import Any, AsyncIterator, Dict, List, Literal
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from ...application.use_cases.create_category import CreateCategoryUseCase
 from ...application.use_cases.get_categories import GetCategoriesUseCase
+from ...application.use_cases.export_categories import (
+    DEFAULT_EXPORT_BATCH_SIZE,
+    ExportCategoriesUseCase,
+)
 from ...application.dtos import CategoryCreateDTO
-from .schemas import CategoryCreateSchema, CategoryResponseSchema, CategoryQueryParams
+from .schemas import (
+    CategoryCreateSchema,
+    CategoryResponseSchema,
+    CategoryQueryParams,
+    CategoryRow,
+    category_row,
+)
 from config.dependencies import (
     get_create_category_use_case,
-    get_get_categories_use_case
+    get_get_categories_use_case,
+    get_export_categories_use_case,
+    get_table_version_repository
 )
+from src.shared.database.versions import TableVersionRepository
+from src.shared.exceptions.http_errors import BadRequestError
+from src.shared.http.conditional import evaluate_conditional_get
+from src.shared.http.responses import json_list_response
 from src.shared.logging.logger import get_logger
+from src.shared.pagination.cursor import decode_cursor, encode_cursor, set_next_page_headers
+from src.shared.streaming.writers import MEDIA_TYPES, write_csv, write_ndjson
 
 logger = get_logger(__name__)
 
+# Column order of the CSV export, matching Category.to_dict()
+_EXPORT_FIELDS = ("id", "name", "description", "created_at", "updated_at")
+
 router = APIRouter(prefix="/categories", tags=["categories"])
 
 
@@ -22,7 +44,7 @@ async def create_category(
     use_case: CreateCategoryUseCase = Depends(get_create_category_use_case)
 ) -> CategoryResponseSchema:
     """Create a new category."""
-    logger.info(f"Creating category: {category_data.name}")
+    logger.info("Creating category: {}", category_data.name)
     
     # Convert schema to DTO
     category_dto = CategoryCreateDTO(
@@ -33,24 +55,93 @@ async def create_category(
     # Execute use case
     result = await use_case.execute(category_dto)
     
-    logger.info(f"Category created successfully: {result.id}")
+    logger.info("Category created successfully: {}", result.id)
     return CategoryResponseSchema.from_domain(result)
 
 
 @router.get("/", response_model=List[CategoryResponseSchema])
 async def get_categories(
+    request: Request,
+    response: Response,
     query_params: CategoryQueryParams = Depends(),
-    use_case: GetCategoriesUseCase = Depends(get_get_categories_use_case)
-) -> List[CategoryResponseSchema]:
-    """Get categories with optional pagination and filtering."""
-    logger.info(f"Getting categories with params: limit={query_params.limit}, offset={query_params.offset}, name={query_params.name}")
+    use_case: GetCategoriesUseCase = Depends(get_get_categories_use_case),
+    versions: TableVersionRepository = Depends(get_table_version_repository)
+) -> Response:
+    """Get categories with optional pagination and filtering.
+    
+    Pages are capped at 100 items. When more categories follow, the response carries
+    an ``X-Next-Cursor`` header and a ``Link: rel="next"`` URL for the next page.
+    
+    Responses carry ``ETag`` and ``Last-Modified`` validators derived from the
+    categories change counter; a matching ``If-None-Match`` or ``If-Modified-Since``
+    gets a ``304`` without querying the categories.
+    """
+    logger.info(
+        "Getting categories with params: limit={}, offset={}, name={}, q={}",
+        query_params.limit, query_params.offset, query_params.name, query_params.q
+    )
+    
+    after_id = query_params.after_id
+    if query_params.cursor is not None:
+        after_id = decode_cursor(query_params.cursor)
+    
+    if query_params.q is not None and after_id is not None:
+        raise BadRequestError(
+            error="Cursor pagination is not supported with full-text search",
+            details=[
+                {"field": "cursor", "message": "Search results are ranked; page them with offset"}
+            ]
+        )
+    
+    # Answer unchanged polls before running the query
+    version = await versions.get("categories")
+    not_modified = evaluate_conditional_get(request, response, "categories", version)
+    if not_modified is not None:
+        return not_modified
     
     # Execute use case
-    categories = await use_case.execute(
+    page = await use_case.execute(
         limit=query_params.limit,
         offset=query_params.offset,
-        name_filter=query_params.name
+        name_filter=query_params.name,
+        after_id=after_id,
+        search=query_params.q
     )
+    categories = page.items
+    
+    if page.next_after_id is not None:
+        set_next_page_headers(request, response, encode_cursor(page.next_after_id))
+    
+    logger.info("Returned {} categories", len(categories))
+    rows = [category_row(category) for category in categories]
+    return json_list_response(CategoryRow, rows, response)
+
+
+@router.get("/export")
+async def export_categories(
+    format: Literal["ndjson", "csv"] = Query(default="ndjson", description="Export format"),
+    batch_size: int = Query(
+        default=DEFAULT_EXPORT_BATCH_SIZE,
+        ge=1,
+        le=10000,
+        description="Rows fetched from the database per round trip"
+    ),
+    use_case: ExportCategoriesUseCase = Depends(get_export_categories_use_case)
+) -> StreamingResponse:
+    """Export every category as NDJSON or CSV.
+    
+    Rows are read from a server-side cursor and written as they arrive, so memory stays
+    flat whatever the table size and the first bytes are sent before the query finishes.
+    """
+    logger.info("Exporting categories: format={}, batch_size={}", format, batch_size)
     
-    logger.info(f"Returned {len(categories)} categories")
-    return [CategoryResponseSchema.from_domain(category) for category in categories] 
\ No newline at end of file
+    async def records() -> AsyncIterator[List[Dict[str, Any]]]:
+        async for batch in use_case.execute(batch_size):
+            yield [category.to_dict() for category in batch]
+    
+    body = write_csv(records(), _EXPORT_FIELDS) if format == "csv" else write_ndjson(records())
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="categories.{format}"'}
+    )
@@ -1,6 +1,8 @@
 """Pydantic schemas for category API."""
+from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, Field, field_validator
+from typing_extensions import TypedDict
 from ...domain.entities import Category
 import urllib.parse
 
@@ -11,23 +13,38 @@ class CategoryQueryParams(BaseModel):
         default=None, 
         ge=1, 
         le=100, 
-        description="Number of categories to return (max 100)"
+        description="Number of categories to return (default 50, max 100)"
     )
     offset: int = Field(
         default=0, 
         ge=0, 
         description="Number of categories to skip"
     )
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor from the previous page's X-Next-Cursor header"
+    )
+    after_id: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Return only categories with an ID greater than this one"
+    )
     name: Optional[str] = Field(
         default=None, 
         min_length=1, 
         description="Filter by category name (partial match)"
     )
+    q: Optional[str] = Field(
+        default=None,
+        min_length=1,
+        max_length=200,
+        description="Full-text search over name and description (ranked, prefix, accent-insensitive)"
+    )
     
-    @field_validator('name', mode='before')
+    @field_validator('name', 'q', mode='before')
     @classmethod
     def decode_name(cls, v):
-        """Decode URL-encoded name parameter."""
+        """Decode URL-encoded name and search parameters."""
         if v is not None and isinstance(v, str):
             try:
                 return urllib.parse.unquote_plus(v)
@@ -95,4 +112,24 @@ class CategoryResponseSchema(BaseModel):
                 "updated_at": "2023-01-01T00:00:00"
             }
         }
-    } 
\ No newline at end of file
+    }
+
+
+class CategoryRow(TypedDict):
+    """JSON row with the shape of ``CategoryResponseSchema``, serialized without building a model."""
+    id: int
+    name: str
+    description: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+
+def category_row(category: Category) -> CategoryRow:
+    """Build the response row for a category."""
+    return {
+        "id": category.id,
+        "name": category.name,
+        "description": category.description,
+        "created_at": category.created_at,
+        "updated_at": category.updated_at,
+    }
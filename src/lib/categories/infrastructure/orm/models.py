@@ -1,7 +1,8 @@
 """SQLAlchemy models for categories."""
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, event
 from sqlalchemy.sql import func
 from config.database import Base
+from src.shared.database.sqlite import create_change_counter, create_fts5_index
 from ...domain.entities import Category
 
 
@@ -38,4 +39,21 @@ class CategoryModel(Base):
         # Only set id if it's not None (for updates)
         if category.id is not None:
             model.id = category.id
-        return model 
\ No newline at end of file
+        return model 
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_category_search_index(target, connection, **kw) -> None:
+    """Create the FTS5 full-text index over category names and descriptions."""
+    create_fts5_index(
+        connection,
+        source_table="categories",
+        fts_table="categories_fts",
+        columns=("name", "description"),
+    )
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_category_change_counter(target, connection, **kw) -> None:
+    """Count writes to the categories table for HTTP cache validators."""
+    create_change_counter(connection, source_table="categories")
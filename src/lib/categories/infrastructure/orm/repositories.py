@@ -1,64 +1,101 @@
 """SQLAlchemy repository implementation for categories."""
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from dataclasses import replace
+from typing import AsyncIterator, List, Optional
+from sqlalchemy import column, func, literal_column, select, table
 from ...domain.entities import Category
 from ...domain.repositories import CategoryRepository
 from .models import CategoryModel
+from src.shared.cache.lru import MISSING
+from src.shared.database.repository import SQLAlchemyRepository
+from src.shared.database.sqlite import build_fts5_prefix_query
 from src.shared.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+# FTS5 index maintained by triggers on the categories table (see models.py)
+categories_fts = table("categories_fts", column("rowid"))
 
-class CategoryRepositoryImpl(CategoryRepository):
+# bm25 column weights: a match in the name counts ten times a match in the description
+_SEARCH_RANK = func.bm25(literal_column("categories_fts"), 10.0, 1.0)
+
+
+class CategoryRepositoryImpl(SQLAlchemyRepository, CategoryRepository):
     """SQLAlchemy implementation of CategoryRepository."""
     
-    def __init__(self, session: Session) -> None:
-        self.session = session
+    versioned_table = "categories"
     
     async def create(self, category: Category) -> Category:
         """Create a new category."""
-        logger.info(f"Creating category in database: {category.name}")
+        logger.info("Creating category in database: {}", category.name)
         
         try:
             category_model = CategoryModel.from_domain(category)
             self.session.add(category_model)
-            self.session.commit()
-            self.session.refresh(category_model)
+            await self._commit()
+            await self._refresh(category_model)
+            
+            # The new ID may have been cached as missing
+            self._cache_invalidate(category_model.id)
             
-            logger.info(f"Category created in database: {category_model.id}")
+            logger.info("Category created in database: {}", category_model.id)
             return category_model.to_domain()
         except Exception as e:
-            logger.error(f"Error creating category: {e}")
-            self.session.rollback()
+            logger.error("Error creating category: {}", e)
+            await self._rollback()
             raise
     
     async def get_by_id(self, category_id: int) -> Optional[Category]:
         """Get category by ID."""
-        logger.info(f"Getting category from database: {category_id}")
+        cached = self._cache_get(category_id)
+        if cached is not MISSING:
+            logger.info("Category served from cache: {}", category_id)
+            # Copy so callers never mutate the shared cached entity
+            return replace(cached) if cached is not None else None
         
-        category_model = self.session.query(CategoryModel).filter(CategoryModel.id == category_id).first()
+        logger.info("Getting category from database: {}", category_id)
+        
+        result = await self._execute(select(CategoryModel).where(CategoryModel.id == category_id))
+        category_model = result.scalars().first()
         
         if category_model:
-            logger.info(f"Category found in database: {category_id}")
-            return category_model.to_domain()
+            logger.info("Category found in database: {}", category_id)
+            category = category_model.to_domain()
+            self._cache_set(category_id, replace(category))
+            return category
         
-        logger.warning(f"Category not found in database: {category_id}")
+        logger.warning("Category not found in database: {}", category_id)
+        self._cache_set(category_id, None)
         return None
     
     async def get_all(
         self, 
         limit: Optional[int] = None,
         offset: int = 0,
-        name_filter: Optional[str] = None
+        name_filter: Optional[str] = None,
+        after_id: Optional[int] = None,
+        search: Optional[str] = None
     ) -> List[Category]:
         """Get all categories with optional filtering and pagination."""
-        logger.info(f"Getting categories from database: limit={limit}, offset={offset}, name_filter={name_filter}")
+        logger.info("Getting categories from database: limit={}, offset={}, name_filter={}, after_id={}, search={}", limit, offset, name_filter, after_id, search)
         
-        query = self.session.query(CategoryModel)
+        query = select(CategoryModel)
         
         # Apply name filter if provided
         if name_filter:
-            query = query.filter(CategoryModel.name.ilike(f"%{name_filter}%"))
+            query = query.where(CategoryModel.name.ilike(f"%{name_filter}%"))
+        
+        # Apply full-text search through the FTS5 index, best matches first
+        if search is not None:
+            match_query = build_fts5_prefix_query(search)
+            if match_query is None:
+                return []
+            query = query.join(categories_fts, categories_fts.c.rowid == CategoryModel.id).where(
+                literal_column("categories_fts").op("MATCH")(match_query)
+            ).order_by(_SEARCH_RANK)
+        
+        # Apply keyset position so deep pages seek on the primary key instead of scanning
+        if after_id is not None:
+            query = query.where(CategoryModel.id > after_id)
         
         # Apply ordering for consistent pagination
         query = query.order_by(CategoryModel.id)
@@ -71,21 +108,48 @@ class CategoryRepositoryImpl(CategoryRepository):
         if limit:
             query = query.limit(limit)
         
-        category_models = query.all()
-        categories = [model.to_domain() for model in category_models]
+        result = await self._execute(query)
+        categories = [model.to_domain() for model in result.scalars()]
         
-        logger.info(f"Retrieved {len(categories)} categories from database")
+        logger.info("Retrieved {} categories from database", len(categories))
         return categories
     
+    async def stream_all(self, batch_size: int) -> AsyncIterator[List[Category]]:
+        """Stream every category ordered by ID, ``batch_size`` at a time."""
+        logger.info("Streaming categories from database: batch_size={}", batch_size)
+        
+        # Plain column rows skip the ORM identity map, so memory is bounded by one batch
+        columns = CategoryModel.__table__.c
+        query = select(
+            columns.id, columns.name, columns.description, columns.created_at, columns.updated_at
+        ).order_by(columns.id)
+        
+        total = 0
+        async for rows in self._stream(query, batch_size):
+            total += len(rows)
+            yield [
+                Category(
+                    id=row.id,
+                    name=row.name,
+                    description=row.description,
+                    created_at=row.created_at,
+                    updated_at=row.updated_at
+                )
+                for row in rows
+            ]
+        
+        logger.info("Streamed {} categories from database", total)
+    
     async def update(self, category: Category) -> Optional[Category]:
         """Update an existing category."""
-        logger.info(f"Updating category in database: {category.id}")
+        logger.info("Updating category in database: {}", category.id)
         
         try:
-            category_model = self.session.query(CategoryModel).filter(CategoryModel.id == category.id).first()
+            result = await self._execute(select(CategoryModel).where(CategoryModel.id == category.id))
+            category_model = result.scalars().first()
             
             if not category_model:
-                logger.warning(f"Category not found for update: {category.id}")
+                logger.warning("Category not found for update: {}", category.id)
                 return None
             
             # Update fields
@@ -94,42 +158,46 @@ class CategoryRepositoryImpl(CategoryRepository):
                 category_model.description = category.description
             category_model.updated_at = category.updated_at
             
-            self.session.commit()
-            self.session.refresh(category_model)
+            await self._commit()
+            self._cache_invalidate(category.id)
+            await self._refresh(category_model)
             
-            logger.info(f"Category updated in database: {category.id}")
+            logger.info("Category updated in database: {}", category.id)
             return category_model.to_domain()
         except Exception as e:
-            logger.error(f"Error updating category: {e}")
-            self.session.rollback()
+            logger.error("Error updating category: {}", e)
+            await self._rollback()
             raise
     
     async def delete(self, category_id: int) -> bool:
         """Delete a category by ID."""
-        logger.info(f"Deleting category from database: {category_id}")
+        logger.info("Deleting category from database: {}", category_id)
         
         try:
-            category_model = self.session.query(CategoryModel).filter(CategoryModel.id == category_id).first()
+            result = await self._execute(select(CategoryModel).where(CategoryModel.id == category_id))
+            category_model = result.scalars().first()
             
             if not category_model:
-                logger.warning(f"Category not found for deletion: {category_id}")
+                logger.warning("Category not found for deletion: {}", category_id)
                 return False
             
-            self.session.delete(category_model)
-            self.session.commit()
+            await self._delete(category_model)
+            await self._commit()
+            self._cache_invalidate(category_id)
             
-            logger.info(f"Category deleted from database: {category_id}")
+            logger.info("Category deleted from database: {}", category_id)
             return True
         except Exception as e:
-            logger.error(f"Error deleting category: {e}")
-            self.session.rollback()
+            logger.error("Error deleting category: {}", e)
+            await self._rollback()
             raise
     
     async def exists_by_name(self, name: str) -> bool:
         """Check if category exists by name."""
-        logger.info(f"Checking if category exists: {name}")
+        logger.info("Checking if category exists: {}", name)
         
-        exists = self.session.query(CategoryModel).filter(CategoryModel.name == name).first() is not None
+        result = await self._execute(select(CategoryModel.id).where(CategoryModel.name == name).limit(1))
+        exists = result.first() is not None
         
-        logger.info(f"Category exists check result: {exists}")
+        logger.info("Category exists check result: {}", exists)
         return exists 
\ No newline at end of file
@@ -1,7 +1,8 @@
 """DTOs for locations application layer."""
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
+from ..domain.entities import Location
 
 
 @dataclass
@@ -48,4 +49,86 @@ class LocationFilterDTO:
     min_latitude: Optional[float] = None
     max_latitude: Optional[float] = None
     min_longitude: Optional[float] = None
-    max_longitude: Optional[float] = None 
\ No newline at end of file
+    max_longitude: Optional[float] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    radius_km: Optional[float] = None
+    
+    @property
+    def is_spatial(self) -> bool:
+        """Check whether any bounding-box or radius parameter is set."""
+        return any(
+            value is not None
+            for value in (
+                self.min_latitude, self.max_latitude, self.min_longitude, self.max_longitude,
+                self.latitude, self.longitude, self.radius_km,
+            )
+        )
+
+
+@dataclass
+class LocationPageDTO:
+    """DTO for one keyset-paginated page of locations."""
+    
+    items: List[Location]
+    next_after_id: Optional[int] = None
+
+
+@dataclass
+class LocationRowPageDTO:
+    """DTO for one keyset-paginated page of location rows holding only the requested fields."""
+    
+    items: List[Dict[str, Any]]
+    next_after_id: Optional[int] = None
+
+
+@dataclass
+class NearbyLocationDTO:
+    """DTO for a location and its distance from a query point."""
+    
+    location: Location
+    distance_km: float
+
+
+@dataclass
+class DistancePointDTO:
+    """DTO for a distance matrix point, given by location ID or by coordinates."""
+    
+    location_id: Optional[int] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+
+
+@dataclass
+class DistanceMatrixDTO:
+    """DTO for a computed distance matrix in kilometers."""
+    
+    distances_km: List[List[float]]
+
+
+@dataclass
+class LocationImportRowDTO:
+    """DTO for one raw row of a location import, or the reason it could not be parsed."""
+    
+    row: int
+    values: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class LocationImportErrorDTO:
+    """DTO for a rejected import row."""
+    
+    row: int
+    message: str
+
+
+@dataclass
+class LocationImportProgressDTO:
+    """DTO for running import totals, reported after every chunk."""
+    
+    rows: int = 0
+    inserted: int = 0
+    duplicates: int = 0
+    errors: int = 0
+    done: bool = False
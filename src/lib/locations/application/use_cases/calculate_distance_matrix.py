@@ -0,0 +1,89 @@
+"""Calculate distance matrix use case."""
+from typing import List, Optional, Tuple
+import numpy as np
+from ...domain.repositories import LocationRepository
+from ...domain.services import LocationDomainService
+from ..dtos import DistanceMatrixDTO, DistancePointDTO
+from src.shared.exceptions.domain_errors import LocationNotFoundError
+from src.shared.exceptions.http_errors import BadRequestError
+from src.shared.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+DTYPES = {"float32": np.float32, "float64": np.float64}
+
+
+class CalculateDistanceMatrixUseCase:
+    """Use case for calculating distances between sets of locations or coordinates."""
+    
+    def __init__(self, location_repository: LocationRepository) -> None:
+        self.location_repository = location_repository
+    
+    async def execute(
+        self,
+        origins: List[DistancePointDTO],
+        destinations: Optional[List[DistancePointDTO]] = None,
+        dtype: str = "float64"
+    ) -> DistanceMatrixDTO:
+        """Execute the calculate distance matrix use case.
+        
+        Without ``destinations`` the matrix is origins x origins.
+        """
+        logger.info(
+            "Calculating distance matrix: origins={}, destinations={}, dtype={}",
+            len(origins), len(destinations) if destinations is not None else 'origins', dtype
+        )
+        
+        points = origins + (destinations or [])
+        latitudes, longitudes = await self._resolve(points)
+        split = len(origins)
+        if destinations is None:
+            destination_latitudes, destination_longitudes = latitudes, longitudes
+        else:
+            destination_latitudes, destination_longitudes = latitudes[split:], longitudes[split:]
+        
+        matrix = LocationDomainService.calculate_distance_matrix(
+            latitudes[:split],
+            longitudes[:split],
+            destination_latitudes,
+            destination_longitudes,
+            dtype=DTYPES[dtype]
+        )
+        
+        logger.info("Distance matrix calculated: {}x{}", matrix.shape[0], matrix.shape[1])
+        return DistanceMatrixDTO(distances_km=matrix.tolist())
+    
+    async def _resolve(
+        self, points: List[DistancePointDTO]
+    ) -> Tuple[List[float], List[float]]:
+        """Get latitudes and longitudes for the points, loading referenced locations at once."""
+        location_ids = sorted(
+            {point.location_id for point in points if point.location_id is not None}
+        )
+        locations = await self.location_repository.get_by_ids(location_ids)
+        coordinates = {
+            location.id: (location.latitude, location.longitude) for location in locations
+        }
+        
+        for location_id in location_ids:
+            if location_id not in coordinates:
+                logger.warning("Location not found for distance matrix: {}", location_id)
+                raise LocationNotFoundError(location_id)
+        
+        latitudes, longitudes = [], []
+        for point in points:
+            if point.location_id is not None:
+                latitude, longitude = coordinates[point.location_id]
+            elif point.latitude is not None and point.longitude is not None:
+                latitude, longitude = point.latitude, point.longitude
+            else:
+                raise BadRequestError(
+                    error="Invalid distance matrix point",
+                    details=[{
+                        "field": "location_id",
+                        "message": "Give either location_id or both latitude and longitude"
+                    }]
+                )
+            latitudes.append(latitude)
+            longitudes.append(longitude)
+        return latitudes, longitudes
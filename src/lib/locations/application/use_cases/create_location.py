@@ -1,8 +1,8 @@
 """Create location use case."""
 from datetime import datetime
-from typing import Protocol
+from typing import Optional, Protocol
 from ...domain.entities import Location
-from ...domain.repositories import LocationRepository
+from ...domain.repositories import LocationIndex, LocationRepository
 from ...domain.services import LocationDomainService
 from ...domain.value_objects import Coordinates
 from ..dtos import LocationCreateDTO, LocationResponseDTO
@@ -15,12 +15,17 @@ logger = get_logger(__name__)
 class CreateLocationUseCase:
     """Use case for creating a new location."""
     
-    def __init__(self, location_repository: LocationRepository) -> None:
+    def __init__(
+        self,
+        location_repository: LocationRepository,
+        location_index: Optional[LocationIndex] = None
+    ) -> None:
         self.location_repository = location_repository
+        self.location_index = location_index
     
     async def execute(self, location_data: LocationCreateDTO) -> LocationResponseDTO:
         """Execute the create location use case."""
-        logger.info(f"Creating location: {location_data.name}")
+        logger.info("Creating location: {}", location_data.name)
         
         # Validate coordinates
         coordinates = LocationDomainService.validate_coordinates(
@@ -36,7 +41,7 @@ class CreateLocationUseCase:
         )
         
         if exists:
-            logger.warning(f"Duplicate location found: {location_data.name}")
+            logger.warning("Duplicate location found: {}", location_data.name)
             raise DuplicateLocationError(
                 name=location_data.name,
                 longitude=location_data.longitude,
@@ -57,5 +62,9 @@ class CreateLocationUseCase:
         # Save to repository
         created_location = await self.location_repository.create(location)
         
-        logger.info(f"Location created successfully: {created_location.id}")
+        # Make the new location visible to nearest-neighbour lookups right away
+        if self.location_index is not None:
+            self.location_index.add(created_location.id, created_location.latitude, created_location.longitude)
+        
+        logger.info("Location created successfully: {}", created_location.id)
         return LocationResponseDTO.from_domain(created_location) 
\ No newline at end of file
@@ -0,0 +1,23 @@
+"""Export locations use case."""
+from typing import AsyncIterator, List
+from ...domain.entities import Location
+from ...domain.repositories import LocationRepository
+from src.shared.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_EXPORT_BATCH_SIZE = 1000
+
+
+class ExportLocationsUseCase:
+    """Use case for streaming every location in ID order."""
+    
+    def __init__(self, location_repository: LocationRepository) -> None:
+        self.location_repository = location_repository
+    
+    async def execute(self, batch_size: int = DEFAULT_EXPORT_BATCH_SIZE) -> AsyncIterator[List[Location]]:
+        """Execute the export, yielding locations in batches as they are read."""
+        logger.info("Exporting locations with batch size {}", batch_size)
+        
+        async for batch in self.location_repository.stream_all(batch_size):
+            yield batch
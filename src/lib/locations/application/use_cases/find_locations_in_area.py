@@ -0,0 +1,107 @@
+"""Find locations in area use case."""
+from typing import Optional, Tuple, Union
+from ...domain.repositories import LocationRepository
+from ...domain.services import LocationDomainService
+from ...domain.value_objects import BoundingBox, Coordinates
+from ..dtos import LocationFilterDTO, LocationPageDTO
+from src.shared.pagination.cursor import resolve_page_size
+from src.shared.logging.logger import get_logger
+from src.shared.exceptions.http_errors import BadRequestError, InternalServerError
+
+logger = get_logger(__name__)
+
+
+class FindLocationsInAreaUseCase:
+    """Use case for finding locations inside a bounding box or within a radius."""
+    
+    def __init__(self, location_repository: LocationRepository) -> None:
+        self.location_repository = location_repository
+    
+    async def execute(
+        self,
+        filters: LocationFilterDTO,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> LocationPageDTO:
+        """Execute the find locations in area use case.
+        
+        A radius search (``latitude``, ``longitude`` and ``radius_km``) returns the
+        nearest locations first; a bounding-box search returns them ordered by ID.
+        """
+        logger.info(
+            "Finding locations in area: filters={}, limit={}, offset={}", filters, limit, offset
+        )
+        
+        page_size = resolve_page_size(limit)
+        latitude, longitude, radius_km = filters.latitude, filters.longitude, filters.radius_km
+        min_latitude, max_latitude = filters.min_latitude, filters.max_latitude
+        min_longitude, max_longitude = filters.min_longitude, filters.max_longitude
+        bbox_params = (min_latitude, max_latitude, min_longitude, max_longitude)
+        has_bbox = any(value is not None for value in bbox_params)
+        
+        # The search area: a (center, radius_km) pair or a bounding box
+        area: Union[Tuple[Coordinates, float], BoundingBox]
+        try:
+            if latitude is not None or longitude is not None or radius_km is not None:
+                if latitude is None or longitude is None or radius_km is None or has_bbox:
+                    raise BadRequestError(
+                        error="Invalid radius search",
+                        details=[{
+                            "field": "radius_km",
+                            "message": (
+                                "latitude, longitude and radius_km must be given together, "
+                                "without bounding-box parameters"
+                            )
+                        }]
+                    )
+                area = (LocationDomainService.validate_coordinates(longitude, latitude), radius_km)
+            else:
+                if (min_latitude is None or max_latitude is None
+                        or min_longitude is None or max_longitude is None):
+                    raise BadRequestError(
+                        error="Invalid bounding box",
+                        details=[{
+                            "field": "bbox",
+                            "message": (
+                                "min_latitude, max_latitude, min_longitude and max_longitude "
+                                "must be given together"
+                            )
+                        }]
+                    )
+                area = LocationDomainService.validate_bounding_box(
+                    min_latitude, max_latitude, min_longitude, max_longitude
+                )
+        except ValueError as e:
+            raise BadRequestError(
+                error="Invalid area",
+                details=[{"field": "bbox", "message": str(e)}]
+            )
+        
+        try:
+            if isinstance(area, BoundingBox):
+                locations = await self.location_repository.find_in_bbox(
+                    area,
+                    limit=page_size,
+                    offset=offset,
+                    name_filter=filters.name
+                )
+            else:
+                center, radius = area
+                matches = await self.location_repository.find_within_radius(
+                    center,
+                    radius,
+                    limit=page_size,
+                    offset=offset,
+                    name_filter=filters.name
+                )
+                locations = [location for location, _ in matches]
+            
+            logger.info("Successfully found {} locations in area", len(locations))
+            return LocationPageDTO(items=locations)
+        
+        except Exception as e:
+            logger.error("Error finding locations in area: {}", e)
+            raise InternalServerError(
+                error="Failed to retrieve locations",
+                details=[{"context": "database", "message": "Error querying locations in area"}]
+            )
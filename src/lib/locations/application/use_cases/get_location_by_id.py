@@ -15,13 +15,13 @@ class GetLocationByIdUseCase:
     
     async def execute(self, location_id: int) -> LocationResponseDTO:
         """Execute the get location by ID use case."""
-        logger.info(f"Getting location by ID: {location_id}")
+        logger.info("Getting location by ID: {}", location_id)
         
         location = await self.location_repository.get_by_id(location_id)
         
         if not location:
-            logger.warning(f"Location not found: {location_id}")
+            logger.warning("Location not found: {}", location_id)
             raise LocationNotFoundError(location_id)
         
-        logger.info(f"Location retrieved successfully: {location_id}")
+        logger.info("Location retrieved successfully: {}", location_id)
         return LocationResponseDTO.from_domain(location) 
\ No newline at end of file
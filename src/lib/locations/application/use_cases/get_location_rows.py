@@ -0,0 +1,68 @@
+"""Get location rows use case."""
+from typing import Optional, Sequence
+from ...domain.repositories import LocationRepository
+from ..dtos import LocationRowPageDTO
+from src.shared.pagination.cursor import resolve_page_size
+from src.shared.logging.logger import get_logger
+from src.shared.exceptions.http_errors import InternalServerError
+
+logger = get_logger(__name__)
+
+
+class GetLocationRowsUseCase:
+    """Use case for listing selected location fields without building domain entities."""
+    
+    def __init__(self, location_repository: LocationRepository) -> None:
+        self.location_repository = location_repository
+    
+    async def execute(
+        self,
+        fields: Sequence[str],
+        limit: Optional[int] = None,
+        offset: int = 0,
+        name_filter: Optional[str] = None,
+        after_id: Optional[int] = None,
+        search: Optional[str] = None
+    ) -> LocationRowPageDTO:
+        """Execute the use case; pages like the locations list, returning rows of ``fields``."""
+        logger.info(
+            "Getting location rows: fields={}, limit={}, offset={}, name_filter={}, "
+            "after_id={}, search={}",
+            list(fields), limit, offset, name_filter, after_id, search
+        )
+        
+        page_size = resolve_page_size(limit)
+        
+        # The ID is always read so the next-page cursor can be built from it
+        selected = list(fields) if "id" in fields else ["id", *fields]
+        
+        try:
+            # Fetch one extra row to learn whether another page follows
+            rows = await self.location_repository.get_all_rows(
+                selected,
+                limit=page_size + 1,
+                offset=offset,
+                name_filter=name_filter,
+                after_id=after_id,
+                search=search
+            )
+        except Exception as e:
+            logger.error("Error fetching location rows: {}", e)
+            raise InternalServerError(
+                error="Failed to retrieve locations",
+                details=[{"context": "database", "message": "Error querying locations"}]
+            )
+        
+        next_after_id = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            # Search results are ranked, not ID-ordered, so they page by offset only
+            if search is None:
+                next_after_id = rows[-1]["id"]
+        
+        if "id" not in fields:
+            for row in rows:
+                del row["id"]
+        
+        logger.info("Successfully retrieved {} location rows", len(rows))
+        return LocationRowPageDTO(items=rows, next_after_id=next_after_id)
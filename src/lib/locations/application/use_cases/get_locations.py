@@ -1,7 +1,8 @@
 """Get locations use case."""
-from typing import List, Optional
+from typing import Optional
 from ...domain.repositories import LocationRepository
-from ...domain.entities import Location
+from ..dtos import LocationPageDTO
+from src.shared.pagination.cursor import resolve_page_size
 from src.shared.logging.logger import get_logger
 from src.shared.exceptions.http_errors import InternalServerError
 
@@ -18,23 +19,37 @@ class GetLocationsUseCase:
         self, 
         limit: Optional[int] = None,
         offset: int = 0,
-        name_filter: Optional[str] = None
-    ) -> List[Location]:
+        name_filter: Optional[str] = None,
+        after_id: Optional[int] = None,
+        search: Optional[str] = None
+    ) -> LocationPageDTO:
         """Execute the get locations use case with pagination and filtering."""
-        logger.info(f"Getting locations: limit={limit}, offset={offset}, name_filter={name_filter}")
+        logger.info("Getting locations: limit={}, offset={}, name_filter={}, after_id={}, search={}", limit, offset, name_filter, after_id, search)
+        
+        page_size = resolve_page_size(limit)
         
         try:
+            # Fetch one extra row to learn whether another page follows
             locations = await self.location_repository.get_all(
-                limit=limit,
+                limit=page_size + 1,
                 offset=offset,
-                name_filter=name_filter
+                name_filter=name_filter,
+                after_id=after_id,
+                search=search
             )
             
-            logger.info(f"Successfully retrieved {len(locations)} locations")
-            return locations
+            next_after_id = None
+            if len(locations) > page_size:
+                locations = locations[:page_size]
+                # Search results are ranked, not ID-ordered, so they page by offset only
+                if search is None:
+                    next_after_id = locations[-1].id
+            
+            logger.info("Successfully retrieved {} locations", len(locations))
+            return LocationPageDTO(items=locations, next_after_id=next_after_id)
             
         except Exception as e:
-            logger.error(f"Error fetching locations: {str(e)}")
+            logger.error("Error fetching locations: {}", e)
             raise InternalServerError(
                 error="Failed to retrieve locations",
                 details=[{"context": "database", "message": "Error querying locations"}]
@@ -0,0 +1,42 @@
+"""Get nearest locations use case."""
+from typing import List, Optional
+from ...domain.repositories import LocationIndex, LocationRepository
+from ...domain.services import LocationDomainService
+from ..dtos import NearbyLocationDTO
+from src.shared.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class GetNearestLocationsUseCase:
+    """Use case for getting the locations nearest to a point."""
+    
+    def __init__(self, location_repository: LocationRepository, location_index: LocationIndex) -> None:
+        self.location_repository = location_repository
+        self.location_index = location_index
+    
+    async def execute(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int,
+        max_km: Optional[float] = None
+    ) -> List[NearbyLocationDTO]:
+        """Execute the get nearest locations use case, nearest first."""
+        logger.info("Getting {} nearest locations to ({}, {}) within {} km", k, longitude, latitude, max_km)
+        
+        center = LocationDomainService.validate_coordinates(longitude=longitude, latitude=latitude)
+        neighbours = self.location_index.query(center.latitude, center.longitude, k, max_km)
+        
+        locations = await self.location_repository.get_by_ids([location_id for location_id, _ in neighbours])
+        locations_by_id = {location.id: location for location in locations}
+        
+        # Locations deleted since they were indexed are skipped
+        nearby = [
+            NearbyLocationDTO(location=locations_by_id[location_id], distance_km=distance_km)
+            for location_id, distance_km in neighbours
+            if location_id in locations_by_id
+        ]
+        
+        logger.info("Found {} nearest locations", len(nearby))
+        return nearby
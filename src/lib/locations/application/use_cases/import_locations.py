@@ -0,0 +1,176 @@
+"""Import locations use case."""
+import math
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+import numpy as np
+from ...domain.entities import Location
+from ...domain.repositories import LocationIndex, LocationRepository
+from ...domain.value_objects import Coordinates
+from ..dtos import LocationImportErrorDTO, LocationImportProgressDTO, LocationImportRowDTO
+from src.shared.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_IMPORT_CHUNK_SIZE = 1000
+
+ImportEvent = Union[LocationImportErrorDTO, LocationImportProgressDTO]
+
+
+def _to_float(value: Any) -> float:
+    """Convert a raw coordinate to float, NaN when it is missing or not a number."""
+    if isinstance(value, bool) or value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class ImportLocationsUseCase:
+    """Use case for importing a stream of locations in chunked transactions."""
+    
+    def __init__(
+        self,
+        location_repository: LocationRepository,
+        location_index: Optional[LocationIndex] = None
+    ) -> None:
+        self.location_repository = location_repository
+        self.location_index = location_index
+    
+    async def execute(
+        self,
+        rows: AsyncIterator[LocationImportRowDTO],
+        chunk_size: int = DEFAULT_IMPORT_CHUNK_SIZE
+    ) -> AsyncIterator[ImportEvent]:
+        """Execute the import, yielding row errors and a progress report after every chunk.
+        
+        Rows are consumed ``chunk_size`` at a time and each chunk is committed on its own,
+        so memory stays bounded by the chunk and earlier chunks survive a later failure.
+        Rows matching a stored location (same name and coordinates) or an earlier row of
+        the import are counted as duplicates and skipped. The final report has ``done`` set;
+        if a chunk cannot be stored the import stops after an error for its first row.
+        """
+        logger.info("Importing locations with chunk size {}", chunk_size)
+        
+        progress = LocationImportProgressDTO()
+        chunk: List[LocationImportRowDTO] = []
+        
+        async for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                events, stored = await self._import_chunk(chunk, progress)
+                for event in events:
+                    yield event
+                if not stored:
+                    return
+                chunk = []
+        
+        if chunk:
+            events, stored = await self._import_chunk(chunk, progress)
+            for event in events:
+                yield event
+            if not stored:
+                return
+        
+        progress.done = True
+        logger.info("Location import finished: {}", progress)
+        yield progress
+    
+    async def _import_chunk(
+        self,
+        chunk: List[LocationImportRowDTO],
+        progress: LocationImportProgressDTO
+    ) -> Tuple[List[ImportEvent], bool]:
+        """Validate, deduplicate and insert one chunk of rows.
+        
+        Returns the chunk's events and whether it was stored.
+        """
+        errors = []
+        parsed: List[Tuple[int, Dict[str, Any]]] = []
+        for row in chunk:
+            if row.error is not None:
+                errors.append(LocationImportErrorDTO(row.row, row.error))
+            elif row.values is None:
+                errors.append(LocationImportErrorDTO(row.row, "Row has no values"))
+            else:
+                parsed.append((row.row, row.values))
+        
+        # Coordinates are range-checked for the whole chunk at once
+        longitudes = np.array(
+            [_to_float(values.get("longitude")) for _, values in parsed], dtype=np.float64
+        )
+        latitudes = np.array(
+            [_to_float(values.get("latitude")) for _, values in parsed], dtype=np.float64
+        )
+        valid_coordinates = (
+            np.isfinite(longitudes) & np.isfinite(latitudes)
+            & (np.abs(longitudes) <= 180) & (np.abs(latitudes) <= 90)
+        )
+        
+        candidates = []
+        for (row_number, values), longitude, latitude, coordinates_ok in zip(
+            parsed, longitudes.tolist(), latitudes.tolist(), valid_coordinates.tolist()
+        ):
+            name = values.get("name")
+            name = name.strip() if isinstance(name, str) else ""
+            description = values.get("description")
+            if not name or len(name) > 255:
+                errors.append(
+                    LocationImportErrorDTO(row_number, "name must be 1 to 255 characters")
+                )
+            elif not coordinates_ok:
+                errors.append(LocationImportErrorDTO(
+                    row_number,
+                    "longitude must be between -180 and 180 and latitude between -90 and 90"
+                ))
+            elif description is not None and not isinstance(description, str):
+                errors.append(LocationImportErrorDTO(row_number, "description must be a string"))
+            else:
+                candidates.append((name, longitude, latitude, description or None))
+        
+        # One set-based lookup per chunk; earlier chunks are already committed, so this
+        # also catches duplicates across the whole import
+        existing = await self.location_repository.find_existing_keys(
+            [name for name, _, _, _ in candidates]
+        )
+        now = datetime.utcnow()
+        locations = []
+        duplicates = 0
+        for name, longitude, latitude, description in candidates:
+            key = (name, longitude, latitude)
+            if key in existing:
+                duplicates += 1
+                continue
+            existing.add(key)
+            locations.append(Location(
+                id=None,
+                coordinates=Coordinates(longitude=longitude, latitude=latitude),
+                name=name,
+                description=description,
+                created_at=now,
+                updated_at=now
+            ))
+        
+        try:
+            location_ids = await self.location_repository.create_many(locations)
+        except Exception as e:
+            logger.error("Location import stopped at row {}: {}", chunk[0].row, e)
+            stopped = LocationImportErrorDTO(
+                chunk[0].row, "Import stopped: could not store the chunk starting at this row"
+            )
+            return [stopped], False
+        
+        if self.location_index is not None and location_ids:
+            self.location_index.add_many(
+                location_ids,
+                [location.latitude for location in locations],
+                [location.longitude for location in locations]
+            )
+        
+        errors.sort(key=lambda error: error.row)
+        progress.rows += len(chunk)
+        progress.inserted += len(location_ids)
+        progress.duplicates += duplicates
+        progress.errors += len(errors)
+        return [*errors, replace(progress)], True
@@ -1,6 +1,7 @@
 """Repository interfaces for locations domain."""
-from typing import Protocol, List, Optional
+from typing import Any, AsyncIterator, Dict, Protocol, List, Optional, Sequence, Set, Tuple
 from .entities import Location
+from .value_objects import BoundingBox, Coordinates
 
 
 class LocationRepository(Protocol):
@@ -18,11 +19,54 @@ class LocationRepository(Protocol):
         self, 
         limit: Optional[int] = None,
         offset: int = 0,
-        name_filter: Optional[str] = None
+        name_filter: Optional[str] = None,
+        after_id: Optional[int] = None,
+        search: Optional[str] = None
     ) -> List[Location]:
         """Get all locations with optional filtering and pagination."""
         ...
     
+    async def get_all_rows(
+        self,
+        fields: Sequence[str],
+        limit: Optional[int] = None,
+        offset: int = 0,
+        name_filter: Optional[str] = None,
+        after_id: Optional[int] = None,
+        search: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get only the ``fields`` columns of the locations ``get_all`` would return, as plain rows."""
+        ...
+    
+    def stream_all(self, batch_size: int) -> AsyncIterator[List[Location]]:
+        """Stream every location ordered by ID, ``batch_size`` at a time."""
+        ...
+    
+    async def find_in_bbox(
+        self,
+        bbox: BoundingBox,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        name_filter: Optional[str] = None
+    ) -> List[Location]:
+        """Get locations inside a bounding box, ordered by ID."""
+        ...
+    
+    async def find_within_radius(
+        self,
+        center: Coordinates,
+        radius_km: float,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        name_filter: Optional[str] = None
+    ) -> List[Tuple[Location, float]]:
+        """Get locations within ``radius_km`` of ``center`` with their distances, nearest first."""
+        ...
+    
+    async def get_by_ids(self, location_ids: List[int]) -> List[Location]:
+        """Get the locations with the given IDs, in no particular order."""
+        ...
+    
     async def update(self, location: Location) -> Location:
         """Update an existing location."""
         ...
@@ -33,4 +77,37 @@ class LocationRepository(Protocol):
     
     async def exists_by_name_and_coordinates(self, name: str, longitude: float, latitude: float) -> bool:
         """Check if location exists by name and coordinates."""
-        ... 
\ No newline at end of file
+        ...
+    
+    async def create_many(self, locations: List[Location]) -> List[int]:
+        """Insert locations in one transaction and return their IDs in input order.
+        
+        ``locations`` must not repeat a (name, longitude, latitude) key.
+        """
+        ...
+    
+    async def find_existing_keys(self, names: Sequence[str]) -> Set[Tuple[str, float, float]]:
+        """Get the (name, longitude, latitude) keys already stored for any of ``names``."""
+        ...
+
+
+class LocationIndex(Protocol):
+    """Nearest-neighbour index interface for location lookups."""
+    
+    def add(self, location_id: int, latitude: float, longitude: float) -> None:
+        """Add one location to the index."""
+        ...
+    
+    def add_many(self, location_ids: Sequence[int], latitudes: Sequence[float], longitudes: Sequence[float]) -> None:
+        """Add many locations to the index."""
+        ...
+    
+    def query(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int,
+        max_km: Optional[float] = None
+    ) -> List[Tuple[int, float]]:
+        """Get up to ``k`` nearest location IDs with their distances in kilometers, nearest first."""
+        ...
@@ -1,7 +1,17 @@
 """Domain services for locations."""
-from typing import List
+import math
+from typing import Iterator, List, Sequence, Tuple, Union
+import numpy as np
+import numpy.typing as npt
 from .entities import Location
-from .value_objects import Coordinates
+from .value_objects import BoundingBox, Coordinates
+
+# Mean Earth radius in kilometers
+EARTH_RADIUS_KM = 6371
+
+# Origin rows per block when building distance matrices; bounds temporaries to
+# DISTANCE_CHUNK_ROWS x destinations elements per intermediate array
+DISTANCE_CHUNK_ROWS = 256
 
 
 class LocationDomainService:
@@ -13,10 +23,53 @@ class LocationDomainService:
         return Coordinates(longitude=longitude, latitude=latitude)
     
     @staticmethod
-    def calculate_distance(location1: Location, location2: Location) -> float:
-        """Calculate distance between two locations using Haversine formula."""
-        import math
+    def validate_bounding_box(
+        min_latitude: float,
+        max_latitude: float,
+        min_longitude: float,
+        max_longitude: float
+    ) -> BoundingBox:
+        """Validate and create a bounding box."""
+        return BoundingBox(
+            min_latitude=min_latitude,
+            max_latitude=max_latitude,
+            min_longitude=min_longitude,
+            max_longitude=max_longitude
+        )
+    
+    @staticmethod
+    def bounding_box_around(center: Coordinates, radius_km: float) -> BoundingBox:
+        """Get the smallest latitude/longitude box enclosing a circle on the sphere."""
+        delta_lat = math.degrees(radius_km / EARTH_RADIUS_KM)
+        min_lat = center.latitude - delta_lat
+        max_lat = center.latitude + delta_lat
         
+        # Near a pole the circle covers every longitude
+        if min_lat <= -90 or max_lat >= 90 or delta_lat >= 90:
+            return BoundingBox(max(min_lat, -90.0), min(max_lat, 90.0), -180.0, 180.0)
+        
+        delta_lon = math.degrees(
+            math.asin(min(1.0, math.sin(radius_km / EARTH_RADIUS_KM) / math.cos(math.radians(center.latitude))))
+        )
+        if delta_lon >= 180:
+            return BoundingBox(min_lat, max_lat, -180.0, 180.0)
+        
+        min_lon = center.longitude - delta_lon
+        max_lon = center.longitude + delta_lon
+        
+        # Wrap across the antimeridian; BoundingBox treats min > max as a wrapped box
+        if min_lon < -180:
+            min_lon += 360
+        if max_lon > 180:
+            max_lon -= 360
+        return BoundingBox(min_lat, max_lat, min_lon, max_lon)
+    
+    @staticmethod
+    def calculate_distance(
+        location1: Union[Location, Coordinates],
+        location2: Union[Location, Coordinates]
+    ) -> float:
+        """Calculate distance in kilometers between two locations using Haversine formula."""
         # Convert to radians
         lat1, lon1 = math.radians(location1.latitude), math.radians(location1.longitude)
         lat2, lon2 = math.radians(location2.latitude), math.radians(location2.longitude)
@@ -27,7 +80,67 @@ class LocationDomainService:
         a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
         c = 2 * math.asin(math.sqrt(a))
         
-        # Earth's radius in kilometers
-        r = 6371
+        return c * EARTH_RADIUS_KM
+    
+    @staticmethod
+    def calculate_distances(
+        origin: Union[Location, Coordinates],
+        latitudes: Sequence[float],
+        longitudes: Sequence[float],
+        dtype: npt.DTypeLike = np.float64
+    ) -> np.ndarray:
+        """Calculate distances in kilometers from one point to many using a vectorized Haversine."""
+        return LocationDomainService.calculate_distance_matrix(
+            [origin.latitude], [origin.longitude], latitudes, longitudes, dtype=dtype
+        )[0]
+    
+    @staticmethod
+    def calculate_distance_matrix(
+        origin_latitudes: Sequence[float],
+        origin_longitudes: Sequence[float],
+        destination_latitudes: Sequence[float],
+        destination_longitudes: Sequence[float],
+        dtype: npt.DTypeLike = np.float64,
+        chunk_rows: int = DISTANCE_CHUNK_ROWS
+    ) -> np.ndarray:
+        """Calculate the origins x destinations distance matrix in kilometers."""
+        matrix = np.empty((len(origin_latitudes), len(destination_latitudes)), dtype=dtype)
+        for start, block in LocationDomainService.iter_distance_matrix(
+            origin_latitudes,
+            origin_longitudes,
+            destination_latitudes,
+            destination_longitudes,
+            dtype=dtype,
+            chunk_rows=chunk_rows
+        ):
+            matrix[start:start + len(block)] = block
+        return matrix
+    
+    @staticmethod
+    def iter_distance_matrix(
+        origin_latitudes: Sequence[float],
+        origin_longitudes: Sequence[float],
+        destination_latitudes: Sequence[float],
+        destination_longitudes: Sequence[float],
+        dtype: npt.DTypeLike = np.float64,
+        chunk_rows: int = DISTANCE_CHUNK_ROWS
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """Yield ``(first_row, block)`` pairs of the distance matrix, ``chunk_rows`` origins at a time."""
+        lat1 = np.radians(np.asarray(origin_latitudes, dtype=dtype))
+        lon1 = np.radians(np.asarray(origin_longitudes, dtype=dtype))
+        lat2 = np.radians(np.asarray(destination_latitudes, dtype=dtype))
+        lon2 = np.radians(np.asarray(destination_longitudes, dtype=dtype))
+        cos_lat2 = np.cos(lat2)
         
-        return c * r 
\ No newline at end of file
+        for start in range(0, len(lat1), chunk_rows):
+            rows = slice(start, start + chunk_rows)
+            lat1_block = lat1[rows, np.newaxis]
+            
+            # Same Haversine as calculate_distance, broadcast over a block of origins
+            a = np.sin((lat2 - lat1_block) / 2) ** 2
+            a += np.cos(lat1_block) * cos_lat2 * np.sin((lon2 - lon1[rows, np.newaxis]) / 2) ** 2
+            np.clip(a, 0, 1, out=a)
+            np.sqrt(a, out=a)
+            np.arcsin(a, out=a)
+            a *= 2 * EARTH_RADIUS_KM
+            yield start, a
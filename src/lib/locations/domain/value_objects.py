@@ -1,6 +1,6 @@
 """Value objects for locations domain."""
 from dataclasses import dataclass
-from typing import Protocol
+from typing import List, Protocol
 
 
 @dataclass(frozen=True)
@@ -27,4 +27,53 @@ class Coordinates:
         return {
             "longitude": self.longitude,
             "latitude": self.latitude
-        } 
\ No newline at end of file
+        } 
+
+
+@dataclass(frozen=True)
+class BoundingBox:
+    """Value object for a latitude/longitude bounding box.
+    
+    A box whose ``min_longitude`` is greater than its ``max_longitude`` wraps
+    across the antimeridian (e.g. 170 to -170).
+    """
+    
+    min_latitude: float
+    max_latitude: float
+    min_longitude: float
+    max_longitude: float
+    
+    def __post_init__(self) -> None:
+        """Validate the box after initialization."""
+        for latitude in (self.min_latitude, self.max_latitude):
+            if not -90 <= latitude <= 90:
+                raise ValueError("Latitude must be between -90 and 90 degrees")
+        
+        for longitude in (self.min_longitude, self.max_longitude):
+            if not -180 <= longitude <= 180:
+                raise ValueError("Longitude must be between -180 and 180 degrees")
+        
+        if self.min_latitude > self.max_latitude:
+            raise ValueError("min_latitude cannot be greater than max_latitude")
+    
+    @property
+    def crosses_antimeridian(self) -> bool:
+        """Check whether the box wraps across the 180th meridian."""
+        return self.min_longitude > self.max_longitude
+    
+    def split_at_antimeridian(self) -> List["BoundingBox"]:
+        """Split the box into boxes that each have min_longitude <= max_longitude."""
+        if not self.crosses_antimeridian:
+            return [self]
+        return [
+            BoundingBox(self.min_latitude, self.max_latitude, self.min_longitude, 180.0),
+            BoundingBox(self.min_latitude, self.max_latitude, -180.0, self.max_longitude),
+        ]
+    
+    def contains(self, coordinates: Coordinates) -> bool:
+        """Check whether the box contains the given coordinates."""
+        if not self.min_latitude <= coordinates.latitude <= self.max_latitude:
+            return False
+        if self.crosses_antimeridian:
+            return coordinates.longitude >= self.min_longitude or coordinates.longitude <= self.max_longitude
+        return self.min_longitude <= coordinates.longitude <= self.max_longitude
\ No newline at end of file
@@ -0,0 +1,131 @@
+"""Record parsers for streamed location imports."""
+import csv
+import json
+from typing import AsyncIterator, Dict, Optional
+from ...application.dtos import LocationImportRowDTO
+from src.shared.streaming.readers import MAX_LINE_LENGTH, LineTooLongError
+
+IMPORT_FORMATS = ("ndjson", "csv")
+
+_CONTENT_TYPES = {
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "application/json-lines": "ndjson",
+    "text/csv": "csv",
+}
+
+_REQUIRED_CSV_COLUMNS = ("name", "longitude", "latitude")
+
+
+def resolve_import_format(requested: Optional[str], content_type: Optional[str]) -> Optional[str]:
+    """Get the import format from the ``format`` parameter or, failing that, the Content-Type."""
+    if requested is not None:
+        return requested if requested in IMPORT_FORMATS else None
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    return _CONTENT_TYPES.get(media_type)
+
+
+def _line_too_long(error: LineTooLongError) -> LocationImportRowDTO:
+    """Get the row error that ends an import at an oversized line."""
+    return LocationImportRowDTO(row=error.line_number, error=f"{error}; import stopped")
+
+
+async def iter_ndjson_rows(lines: AsyncIterator[str]) -> AsyncIterator[LocationImportRowDTO]:
+    """Parse one JSON object per line; blank lines are skipped.
+    
+    An oversized line ends the rows with an error, since the rest of the body cannot be trusted.
+    """
+    line_number = 0
+    try:
+        async for line in lines:
+            line_number += 1
+            if not line.strip():
+                continue
+            try:
+                values = json.loads(line)
+            except ValueError as e:
+                yield LocationImportRowDTO(row=line_number, error=f"Invalid JSON: {e}")
+                continue
+            if not isinstance(values, dict):
+                yield LocationImportRowDTO(row=line_number, error="Each line must be a JSON object")
+                continue
+            yield LocationImportRowDTO(row=line_number, values=values)
+    except LineTooLongError as e:
+        yield _line_too_long(e)
+
+
+async def iter_csv_rows(lines: AsyncIterator[str]) -> AsyncIterator[LocationImportRowDTO]:
+    """Parse CSV with a header row naming at least name, longitude and latitude.
+    
+    Quoted fields may span lines; a record is complete once its quotes balance.
+    Rows are numbered by the line they start on. An oversized line or record ends
+    the rows with an error, so an unclosed quote cannot buffer the rest of the body.
+    """
+    try:
+        async for row in _iter_csv_records(lines):
+            yield row
+    except LineTooLongError as e:
+        yield _line_too_long(e)
+
+
+async def _iter_csv_records(lines: AsyncIterator[str]) -> AsyncIterator[LocationImportRowDTO]:
+    """Parse the CSV records of ``lines`` into rows (see iter_csv_rows)."""
+    header = None
+    record = ""
+    record_start = 0
+    line_number = 0
+    
+    async for line in lines:
+        line_number += 1
+        if not record:
+            if not line.strip():
+                continue
+            record_start = line_number
+            record = line
+        else:
+            record += "\n" + line
+        
+        if record.count('"') % 2:
+            if len(record) > MAX_LINE_LENGTH:
+                raise LineTooLongError(record_start, MAX_LINE_LENGTH)
+            continue
+        
+        fields = next(csv.reader([record]))
+        record = ""
+        
+        if header is None:
+            header = [field.strip().lower() for field in fields]
+            missing = [column for column in _REQUIRED_CSV_COLUMNS if column not in header]
+            if missing:
+                yield LocationImportRowDTO(
+                    row=record_start,
+                    error=f"CSV header is missing columns: {', '.join(missing)}"
+                )
+                return
+            continue
+        
+        if len(fields) != len(header):
+            yield LocationImportRowDTO(
+                row=record_start,
+                error=f"Expected {len(header)} fields, got {len(fields)}"
+            )
+            continue
+        
+        values: Dict[str, Optional[str]] = dict(zip(header, fields))
+        if values.get("description") == "":
+            values["description"] = None
+        yield LocationImportRowDTO(row=record_start, values=values)
+    
+    if record:
+        yield LocationImportRowDTO(row=record_start, error="Unterminated quoted field")
+
+
+def iter_import_rows(
+    lines: AsyncIterator[str],
+    import_format: str
+) -> AsyncIterator[LocationImportRowDTO]:
+    """Get the row parser for ``import_format`` applied to ``lines``."""
+    if import_format == "csv":
+        return iter_csv_rows(lines)
+    return iter_ndjson_rows(lines)
@@ -1,20 +1,62 @@
 """FastAPI routes for locations."""
-from typing import List
-from fastapi import APIRouter, Depends
+import json
+from dataclasses import asdict
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from ...application.use_cases.create_location import CreateLocationUseCase
-from ...application.use_cases.get_locations import GetLocationsUseCase
+from ...application.use_cases.get_location_rows import GetLocationRowsUseCase
 from ...application.use_cases.get_location_by_id import GetLocationByIdUseCase
-from ...application.dtos import LocationCreateDTO
-from .schemas import LocationCreateSchema, LocationResponseSchema, LocationQueryParams
+from ...application.use_cases.find_locations_in_area import FindLocationsInAreaUseCase
+from ...application.use_cases.get_nearest_locations import GetNearestLocationsUseCase
+from ...application.use_cases.calculate_distance_matrix import CalculateDistanceMatrixUseCase
+from ...application.use_cases.export_locations import DEFAULT_EXPORT_BATCH_SIZE, ExportLocationsUseCase
+from ...application.use_cases.import_locations import DEFAULT_IMPORT_CHUNK_SIZE, ImportEvent, ImportLocationsUseCase
+from ...domain.entities import Location
+from ...application.dtos import LocationCreateDTO, LocationFilterDTO, LocationImportErrorDTO
+from .importers import iter_import_rows, resolve_import_format
+from .schemas import (
+    DistanceMatrixRequestSchema,
+    DistanceMatrixResponseSchema,
+    LOCATION_FIELDS,
+    LocationCreateSchema,
+    LocationResponseSchema,
+    LocationQueryParams,
+    LocationRow,
+    NearbyLocationResponseSchema,
+    NearbyLocationRow,
+    NearestLocationsQueryParams,
+    location_row,
+    nearby_location_row,
+    parse_fields,
+    select_fields
+)
 from config.dependencies import (
     get_create_location_use_case,
-    get_get_locations_use_case,
-    get_get_location_by_id_use_case
+    get_get_location_rows_use_case,
+    get_get_location_by_id_use_case,
+    get_find_locations_in_area_use_case,
+    get_get_nearest_locations_use_case,
+    get_calculate_distance_matrix_use_case,
+    get_import_locations_use_case,
+    get_export_locations_use_case,
+    get_table_version_repository
 )
+from src.shared.database.versions import TableVersionRepository
+from src.shared.exceptions.http_errors import BadRequestError
+from src.shared.http.conditional import evaluate_conditional_get, evaluate_conditional_get_for_row
+from src.shared.http.responses import json_list_response
 from src.shared.logging.logger import get_logger
+from src.shared.pagination.cursor import decode_cursor, encode_cursor, set_next_page_headers
+from src.shared.streaming.readers import iter_text_lines
+from src.shared.streaming.responses import UploadStreamingResponse
+from src.shared.streaming.writers import MEDIA_TYPES, write_csv, write_geojson, write_ndjson
 
 logger = get_logger(__name__)
 
+# Column order of the CSV export, matching Location.to_dict()
+_EXPORT_FIELDS = ("id", "longitude", "latitude", "name", "description", "created_at", "updated_at")
+
 router = APIRouter(prefix="/locations", tags=["locations"])
 
 
@@ -24,7 +66,7 @@ async def create_location(
     use_case: CreateLocationUseCase = Depends(get_create_location_use_case)
 ) -> LocationResponseSchema:
     """Create a new location."""
-    logger.info(f"Creating location: {location_data.name}")
+    logger.info("Creating location: {}", location_data.name)
     
     # Convert schema to DTO
     location_dto = LocationCreateDTO(
@@ -37,39 +79,263 @@ async def create_location(
     # Execute use case
     result = await use_case.execute(location_dto)
     
-    logger.info(f"Location created successfully: {result.id}")
+    logger.info("Location created successfully: {}", result.id)
     return LocationResponseSchema.from_domain(result)
 
 
+async def _ndjson_import_events(events: AsyncIterator[ImportEvent]) -> AsyncIterator[str]:
+    """Serialize import events as NDJSON lines tagged ``error`` or ``progress``."""
+    async for event in events:
+        event_type = "error" if isinstance(event, LocationImportErrorDTO) else "progress"
+        yield json.dumps({"type": event_type, **asdict(event)}) + "\n"
+
+
+@router.post("/import")
+async def import_locations(
+    request: Request,
+    format: Optional[str] = Query(
+        default=None,
+        description="ndjson or csv; defaults to the request Content-Type"
+    ),
+    chunk_size: int = Query(
+        default=DEFAULT_IMPORT_CHUNK_SIZE,
+        ge=1,
+        le=10000,
+        description="Rows validated and committed together"
+    ),
+    use_case: ImportLocationsUseCase = Depends(get_import_locations_use_case)
+) -> UploadStreamingResponse:
+    """Import locations from a streamed NDJSON or CSV body.
+    
+    The body is read incrementally and committed ``chunk_size`` rows at a time. The
+    response is NDJSON streamed while the import runs: an ``error`` line per rejected
+    row and a ``progress`` line per chunk, the last one with ``done: true``.
+    """
+    import_format = resolve_import_format(format, request.headers.get("content-type"))
+    if import_format is None:
+        raise BadRequestError(
+            error="Unsupported import format",
+            details=[{"field": "format", "message": "Send NDJSON (application/x-ndjson) or CSV (text/csv), or set format=ndjson|csv"}]
+        )
+    
+    logger.info("Importing locations: format={}, chunk_size={}", import_format, chunk_size)
+    
+    rows = iter_import_rows(iter_text_lines(request.stream()), import_format)
+    events = use_case.execute(rows, chunk_size=chunk_size)
+    return UploadStreamingResponse(_ndjson_import_events(events), media_type="application/x-ndjson")
+
+
+@router.post("/distance-matrix", response_model=DistanceMatrixResponseSchema)
+async def calculate_distance_matrix(
+    request_data: DistanceMatrixRequestSchema,
+    use_case: CalculateDistanceMatrixUseCase = Depends(get_calculate_distance_matrix_use_case)
+) -> DistanceMatrixResponseSchema:
+    """Calculate great-circle distances between origins and destinations.
+    
+    Points are location IDs or raw coordinates; without ``destinations`` the matrix
+    is origins x origins.
+    """
+    logger.info("Calculating distance matrix: origins={}", len(request_data.origins))
+    
+    # Execute use case
+    result = await use_case.execute(
+        origins=[point.to_dto() for point in request_data.origins],
+        destinations=[point.to_dto() for point in request_data.destinations] if request_data.destinations is not None else None,
+        dtype=request_data.dtype
+    )
+    
+    logger.info("Distance matrix returned successfully")
+    return DistanceMatrixResponseSchema(distances_km=result.distances_km)
+
+
 @router.get("/", response_model=List[LocationResponseSchema])
 async def get_locations(
+    request: Request,
+    response: Response,
     query_params: LocationQueryParams = Depends(),
-    use_case: GetLocationsUseCase = Depends(get_get_locations_use_case)
-) -> List[LocationResponseSchema]:
-    """Get locations with optional pagination and filtering."""
-    logger.info(f"Getting locations with params: limit={query_params.limit}, offset={query_params.offset}, name={query_params.name}")
+    use_case: GetLocationRowsUseCase = Depends(get_get_location_rows_use_case),
+    area_use_case: FindLocationsInAreaUseCase = Depends(get_find_locations_in_area_use_case),
+    versions: TableVersionRepository = Depends(get_table_version_repository)
+) -> Response:
+    """Get locations with optional pagination and filtering.
     
-    # Execute use case
-    locations = await use_case.execute(
+    Pages are capped at 100 items. When more locations follow, the response carries
+    an ``X-Next-Cursor`` header and a ``Link: rel="next"`` URL for the next page.
+    
+    Passing all four ``min/max_latitude/longitude`` parameters restricts the results
+    to a bounding box; ``latitude``, ``longitude`` and ``radius_km`` return the
+    locations within that distance, nearest first. Both are answered from the
+    R*Tree spatial index and page with ``offset``.
+    
+    ``fields`` narrows each item to a comma-separated subset of its fields. Plain
+    listings then select only those columns as rows, skipping ORM and domain objects.
+    Each item carries only the requested fields, although the response schema below
+    lists all of them.
+    
+    Responses carry ``ETag`` and ``Last-Modified`` validators derived from the
+    locations change counter; a matching ``If-None-Match`` or ``If-Modified-Since``
+    gets a ``304`` without querying the locations.
+    """
+    logger.info("Getting locations with params: limit={}, offset={}, name={}, q={}", query_params.limit, query_params.offset, query_params.name, query_params.q)
+    
+    after_id = query_params.after_id
+    if query_params.cursor is not None:
+        after_id = decode_cursor(query_params.cursor)
+    
+    if query_params.q is not None and after_id is not None:
+        raise BadRequestError(
+            error="Cursor pagination is not supported with full-text search",
+            details=[{"field": "cursor", "message": "Search results are ranked; page them with offset"}]
+        )
+    
+    area = LocationFilterDTO(
+        name=query_params.name,
+        min_latitude=query_params.min_latitude,
+        max_latitude=query_params.max_latitude,
+        min_longitude=query_params.min_longitude,
+        max_longitude=query_params.max_longitude,
+        latitude=query_params.latitude,
+        longitude=query_params.longitude,
+        radius_km=query_params.radius_km
+    )
+    if area.is_spatial and (query_params.q is not None or after_id is not None):
+        raise BadRequestError(
+            error="Spatial search cannot be combined with full-text search or cursor pagination",
+            details=[{"field": "bbox", "message": "Page spatial results with offset"}]
+        )
+    
+    fields = parse_fields(query_params.fields)
+    if fields is None:
+        raise BadRequestError(
+            error="Unknown fields requested",
+            details=[{"field": "fields", "message": f"Use a comma-separated subset of: {', '.join(LOCATION_FIELDS)}"}]
+        )
+    
+    # Answer unchanged polls before running the query
+    not_modified = evaluate_conditional_get(request, response, "locations", await versions.get("locations"))
+    if not_modified is not None:
+        return not_modified
+    
+    if area.is_spatial:
+        page = await area_use_case.execute(area, limit=query_params.limit, offset=query_params.offset)
+        rows = [select_fields(location_row(location), fields) for location in page.items]
+        logger.info("Returned {} locations in area", len(rows))
+        return json_list_response(LocationRow, rows, response)
+    
+    # Execute use case; only the requested columns are selected
+    page = await use_case.execute(
+        fields,
         limit=query_params.limit,
         offset=query_params.offset,
-        name_filter=query_params.name
+        name_filter=query_params.name,
+        after_id=after_id,
+        search=query_params.q
+    )
+    
+    if page.next_after_id is not None:
+        set_next_page_headers(request, response, encode_cursor(page.next_after_id))
+    
+    logger.info("Returned {} locations", len(page.items))
+    return json_list_response(LocationRow, page.items, response)
+
+
+@router.get("/nearest", response_model=List[NearbyLocationResponseSchema])
+async def get_nearest_locations(
+    query_params: NearestLocationsQueryParams = Depends(),
+    use_case: GetNearestLocationsUseCase = Depends(get_get_nearest_locations_use_case)
+) -> Response:
+    """Get the ``k`` locations nearest to a point, nearest first.
+    
+    Answered from the in-memory k-nearest-neighbour index, so the cost grows with
+    ``log N`` rather than with the number of stored locations.
+    """
+    logger.info("Getting nearest locations: lat={}, lon={}, k={}, max_km={}", query_params.lat, query_params.lon, query_params.k, query_params.max_km)
+    
+    # Execute use case
+    nearby = await use_case.execute(
+        latitude=query_params.lat,
+        longitude=query_params.lon,
+        k=query_params.k,
+        max_km=query_params.max_km
     )
     
-    logger.info(f"Returned {len(locations)} locations")
-    return [LocationResponseSchema.from_domain(location) for location in locations]
+    logger.info("Returned {} nearest locations", len(nearby))
+    return json_list_response(NearbyLocationRow, [nearby_location_row(item) for item in nearby])
+
+
+def _to_feature(location: Location) -> Dict[str, Any]:
+    """Convert a location to a GeoJSON Point feature."""
+    return {
+        "type": "Feature",
+        "id": location.id,
+        "geometry": {"type": "Point", "coordinates": [location.longitude, location.latitude]},
+        "properties": {
+            "name": location.name,
+            "description": location.description,
+            "created_at": location.created_at.isoformat(),
+            "updated_at": location.updated_at.isoformat(),
+        },
+    }
+
+
+@router.get("/export")
+async def export_locations(
+    format: Literal["ndjson", "csv", "geojson"] = Query(default="ndjson", description="Export format"),
+    batch_size: int = Query(
+        default=DEFAULT_EXPORT_BATCH_SIZE,
+        ge=1,
+        le=10000,
+        description="Rows fetched from the database per round trip"
+    ),
+    use_case: ExportLocationsUseCase = Depends(get_export_locations_use_case)
+) -> StreamingResponse:
+    """Export every location as NDJSON, CSV or a GeoJSON FeatureCollection.
+    
+    Rows are read from a server-side cursor and written as they arrive, so memory stays
+    flat whatever the table size and the first bytes are sent before the query finishes.
+    """
+    logger.info("Exporting locations: format={}, batch_size={}", format, batch_size)
+    
+    convert = _to_feature if format == "geojson" else Location.to_dict
+    
+    async def records() -> AsyncIterator[List[Dict[str, Any]]]:
+        async for batch in use_case.execute(batch_size):
+            yield [convert(location) for location in batch]
+    
+    if format == "csv":
+        body = write_csv(records(), _EXPORT_FIELDS)
+    elif format == "geojson":
+        body = write_geojson(records())
+    else:
+        body = write_ndjson(records())
+    
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="locations.{format}"'}
+    )
 
 
 @router.get("/{location_id}", response_model=LocationResponseSchema)
 async def get_location(
     location_id: int,
+    request: Request,
+    response: Response,
     use_case: GetLocationByIdUseCase = Depends(get_get_location_by_id_use_case)
 ) -> LocationResponseSchema:
-    """Get a specific location by ID."""
-    logger.info(f"Getting location: {location_id}")
+    """Get a specific location by ID.
     
-    # Execute use case
+    Supports conditional requests: the validators come from the location's own
+    ``updated_at``, so an unchanged poll gets a ``304`` and an unknown ID a ``404``.
+    """
+    logger.info("Getting location: {}", location_id)
+    
+    # Execute use case; raises the 404 before any validator is compared
     result = await use_case.execute(location_id)
     
-    logger.info(f"Location returned successfully: {location_id}")
+    not_modified = evaluate_conditional_get_for_row(request, response, "location", result.id, result.updated_at)
+    if not_modified is not None:
+        return not_modified
+    
+    logger.info("Location returned successfully: {}", location_id)
     return LocationResponseSchema.from_domain(result) 
\ No newline at end of file
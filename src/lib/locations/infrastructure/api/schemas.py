@@ -1,9 +1,18 @@
 """Pydantic schemas for location API."""
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from datetime import datetime
+from typing import Any, List, Literal, Mapping, Optional, Tuple
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing_extensions import TypedDict
 from ...domain.entities import Location
+from ...application.dtos import DistancePointDTO, NearbyLocationDTO
 import urllib.parse
 
+# Largest origins x destinations matrix a single request may ask for
+MAX_DISTANCE_MATRIX_CELLS = 250_000
+
+# Fields a location list can be narrowed to with ?fields=, in response order
+LOCATION_FIELDS = ("id", "name", "longitude", "latitude", "description", "created_at", "updated_at")
+
 
 class LocationQueryParams(BaseModel):
     """Query parameters for location endpoints."""
@@ -11,23 +20,64 @@ class LocationQueryParams(BaseModel):
         default=None, 
         ge=1, 
         le=100, 
-        description="Number of locations to return (max 100)"
+        description="Number of locations to return (default 50, max 100)"
     )
     offset: int = Field(
         default=0, 
         ge=0, 
         description="Number of locations to skip"
     )
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor from the previous page's X-Next-Cursor header"
+    )
+    after_id: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Return only locations with an ID greater than this one"
+    )
     name: Optional[str] = Field(
         default=None, 
         min_length=1, 
         description="Filter by location name (partial match)"
     )
+    q: Optional[str] = Field(
+        default=None,
+        min_length=1,
+        max_length=200,
+        description="Full-text search over name and description (ranked, prefix, accent-insensitive)"
+    )
+    min_latitude: Optional[float] = Field(default=None, ge=-90, le=90, description="Bounding box: minimum latitude")
+    max_latitude: Optional[float] = Field(default=None, ge=-90, le=90, description="Bounding box: maximum latitude")
+    min_longitude: Optional[float] = Field(
+        default=None,
+        ge=-180,
+        le=180,
+        description="Bounding box: minimum longitude (greater than max_longitude wraps the antimeridian)"
+    )
+    max_longitude: Optional[float] = Field(default=None, ge=-180, le=180, description="Bounding box: maximum longitude")
+    latitude: Optional[float] = Field(default=None, ge=-90, le=90, description="Radius search: center latitude")
+    longitude: Optional[float] = Field(default=None, ge=-180, le=180, description="Radius search: center longitude")
+    radius_km: Optional[float] = Field(
+        default=None,
+        gt=0,
+        le=20038,
+        description="Radius search: distance from the center in kilometers (nearest first)"
+    )
     
-    @field_validator('name', mode='before')
+    fields: Optional[str] = Field(
+        default=None,
+        min_length=1,
+        description=(
+            f"Comma-separated fields to return (sparse fieldset): {', '.join(LOCATION_FIELDS)}. "
+            "Items then carry only these fields, although the response schema lists all of them"
+        )
+    )
+    
+    @field_validator('name', 'q', mode='before')
     @classmethod
     def decode_name(cls, v):
-        """Decode URL-encoded name parameter."""
+        """Decode URL-encoded name and search parameters."""
         if v is not None and isinstance(v, str):
             try:
                 return urllib.parse.unquote_plus(v)
@@ -36,6 +86,18 @@ class LocationQueryParams(BaseModel):
         return v
 
 
+class NearestLocationsQueryParams(BaseModel):
+    """Query parameters for the nearest locations endpoint."""
+    lat: float = Field(..., ge=-90, le=90, description="Latitude of the query point")
+    lon: float = Field(..., ge=-180, le=180, description="Longitude of the query point")
+    k: int = Field(default=10, ge=1, le=100, description="Number of locations to return (default 10, max 100)")
+    max_km: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Only return locations within this distance in kilometers"
+    )
+
+
 class LocationCreateSchema(BaseModel):
     """Schema for creating a location."""
     name: str = Field(..., min_length=1, max_length=255, description="Location name")
@@ -110,6 +172,130 @@ class LocationResponseSchema(BaseModel):
     }
 
 
+class LocationRow(TypedDict):
+    """JSON row with the shape of ``LocationResponseSchema``, serialized without building a model."""
+    id: int
+    name: str
+    longitude: float
+    latitude: float
+    description: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+
+class NearbyLocationRow(LocationRow):
+    """JSON row with the shape of ``NearbyLocationResponseSchema``."""
+    distance_km: float
+
+
+def location_row(location: Location) -> LocationRow:
+    """Build the response row for a location."""
+    return {
+        "id": location.id,
+        "name": location.name,
+        "longitude": location.coordinates.longitude,
+        "latitude": location.coordinates.latitude,
+        "description": location.description,
+        "created_at": location.created_at,
+        "updated_at": location.updated_at,
+    }
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Parse a ``?fields=`` value into fields in response order; all of them when absent, None when invalid."""
+    if fields is None:
+        return LOCATION_FIELDS
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    if not requested or not requested <= set(LOCATION_FIELDS):
+        return None
+    return tuple(field for field in LOCATION_FIELDS if field in requested)
+
+
+def select_fields(row: Mapping[str, Any], fields: Tuple[str, ...]) -> Mapping[str, Any]:
+    """Narrow a response row to ``fields``; the row itself when all of them are requested."""
+    if len(fields) == len(LOCATION_FIELDS):
+        return row
+    return {field: row[field] for field in fields}
+
+
+def nearby_location_row(nearby: NearbyLocationDTO) -> NearbyLocationRow:
+    """Build the response row for a nearby location."""
+    return {**location_row(nearby.location), "distance_km": round(nearby.distance_km, 6)}
+
+
+class NearbyLocationResponseSchema(LocationResponseSchema):
+    """Schema for a location and its distance from the query point."""
+    distance_km: float = Field(..., description="Great-circle distance from the query point in kilometers")
+    
+    @classmethod
+    def from_nearby(cls, nearby: NearbyLocationDTO) -> "NearbyLocationResponseSchema":
+        """Create schema from a nearby location DTO."""
+        return cls(
+            **LocationResponseSchema.from_domain(nearby.location).model_dump(),
+            distance_km=round(nearby.distance_km, 6)
+        )
+
+
+class DistancePointSchema(BaseModel):
+    """Schema for a distance matrix point: a location ID or raw coordinates."""
+    location_id: Optional[int] = Field(None, ge=1, description="ID of a stored location")
+    latitude: Optional[float] = Field(None, ge=-90, le=90, description="Latitude coordinate")
+    longitude: Optional[float] = Field(None, ge=-180, le=180, description="Longitude coordinate")
+    
+    @model_validator(mode="after")
+    def check_one_form(self) -> "DistancePointSchema":
+        """Require either a location ID or both coordinates, not both forms."""
+        has_coordinates = self.latitude is not None and self.longitude is not None
+        has_partial = (self.latitude is None) != (self.longitude is None)
+        if has_partial or (self.location_id is None) == (not has_coordinates):
+            raise ValueError("Give either location_id or both latitude and longitude")
+        return self
+    
+    def to_dto(self) -> DistancePointDTO:
+        """Convert schema to DTO."""
+        return DistancePointDTO(location_id=self.location_id, latitude=self.latitude, longitude=self.longitude)
+
+
+class DistanceMatrixRequestSchema(BaseModel):
+    """Schema for distance matrix requests."""
+    origins: List[DistancePointSchema] = Field(..., min_length=1, description="Matrix rows")
+    destinations: Optional[List[DistancePointSchema]] = Field(
+        None,
+        min_length=1,
+        description="Matrix columns (defaults to the origins)"
+    )
+    dtype: Literal["float32", "float64"] = Field(
+        "float64",
+        description="Floating point precision; float32 is faster but only accurate to ~0.2 km"
+    )
+    
+    @model_validator(mode="after")
+    def check_size(self) -> "DistanceMatrixRequestSchema":
+        """Cap the number of matrix cells."""
+        columns = len(self.destinations) if self.destinations is not None else len(self.origins)
+        if len(self.origins) * columns > MAX_DISTANCE_MATRIX_CELLS:
+            raise ValueError(f"Distance matrix cannot exceed {MAX_DISTANCE_MATRIX_CELLS} cells")
+        return self
+    
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "origins": [{"location_id": 1}, {"latitude": 40.7580, "longitude": -73.9855}],
+                "destinations": [{"location_id": 2}, {"location_id": 3}],
+                "dtype": "float64"
+            }
+        }
+    }
+
+
+class DistanceMatrixResponseSchema(BaseModel):
+    """Schema for distance matrix responses."""
+    distances_km: List[List[float]] = Field(
+        ...,
+        description="Great-circle distances in kilometers, one row per origin and one column per destination"
+    )
+
+
 class LocationFilterSchema(BaseModel):
     """Schema for filtering locations."""
     
@@ -1,7 +1,8 @@
 """SQLAlchemy models for locations."""
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, event
 from sqlalchemy.sql import func
 from config.database import Base
+from src.shared.database.sqlite import create_change_counter, create_fts5_index, create_rtree_index
 from ...domain.entities import Location
 from ...domain.value_objects import Coordinates
 
@@ -45,4 +46,27 @@ class LocationModel(Base):
         # Only set id if it's not None (for updates)
         if location.id is not None:
             model.id = location.id
-        return model 
\ No newline at end of file
+        return model 
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_location_search_index(target, connection, **kw) -> None:
+    """Create the FTS5 full-text index over location names and descriptions."""
+    create_fts5_index(
+        connection,
+        source_table="locations",
+        fts_table="locations_fts",
+        columns=("name", "description"),
+    )
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_location_spatial_index(target, connection, **kw) -> None:
+    """Create the R*Tree spatial index over location coordinates."""
+    create_rtree_index(connection, source_table="locations", rtree_table="locations_rtree")
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_location_change_counter(target, connection, **kw) -> None:
+    """Count writes to the locations table for HTTP cache validators."""
+    create_change_counter(connection, source_table="locations")
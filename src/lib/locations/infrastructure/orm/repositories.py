@@ -1,65 +1,128 @@
 """SQLAlchemy repository implementation for locations."""
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from dataclasses import replace
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Set, Tuple
+import numpy as np
+from sqlalchemy import Select, and_, column, func, insert, literal_column, or_, select, table
 from ...domain.entities import Location
 from ...domain.repositories import LocationRepository
+from ...domain.services import LocationDomainService
+from ...domain.value_objects import BoundingBox, Coordinates
 from .models import LocationModel
+from src.shared.cache.lru import MISSING
+from src.shared.database.instrumentation import batched_statements
+from src.shared.database.repository import SQLAlchemyRepository
+from src.shared.database.sqlite import build_fts5_prefix_query
 from src.shared.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+# FTS5 index maintained by triggers on the locations table (see models.py)
+locations_fts = table("locations_fts", column("rowid"))
 
-class LocationRepositoryImpl(LocationRepository):
+# R*Tree index maintained by triggers on the locations table (see models.py)
+locations_rtree = table(
+    "locations_rtree",
+    column("id"),
+    column("min_lat"),
+    column("max_lat"),
+    column("min_lon"),
+    column("max_lon"),
+)
+
+# Bound parameters per name IN (...) lookup, well under SQLite's variable limit
+_NAME_CHUNK_SIZE = 500
+
+# bm25 column weights: a match in the name counts ten times a match in the description
+_SEARCH_RANK = func.bm25(literal_column("locations_fts"), 10.0, 1.0)
+
+
+class LocationRepositoryImpl(SQLAlchemyRepository, LocationRepository):
     """SQLAlchemy implementation of LocationRepository."""
     
-    def __init__(self, session: Session) -> None:
-        self.session = session
+    versioned_table = "locations"
     
     async def create(self, location: Location) -> Location:
         """Create a new location."""
-        logger.info(f"Creating location in database: {location.name}")
+        logger.info("Creating location in database: {}", location.name)
         
         try:
             location_model = LocationModel.from_domain(location)
             self.session.add(location_model)
-            self.session.commit()
-            self.session.refresh(location_model)
+            await self._commit()
+            await self._refresh(location_model)
+            
+            # The new ID may have been cached as missing
+            self._cache_invalidate(location_model.id)
             
-            logger.info(f"Location created in database: {location_model.id}")
+            logger.info("Location created in database: {}", location_model.id)
             return location_model.to_domain()
         except Exception as e:
-            logger.error(f"Error creating location: {e}")
-            self.session.rollback()
+            logger.error("Error creating location: {}", e)
+            await self._rollback()
             raise
     
     async def get_by_id(self, location_id: int) -> Optional[Location]:
         """Get location by ID."""
-        logger.info(f"Getting location from database: {location_id}")
+        cached = self._cache_get(location_id)
+        if cached is not MISSING:
+            logger.info("Location served from cache: {}", location_id)
+            # Copy so callers never mutate the shared cached entity
+            return replace(cached) if cached is not None else None
+        
+        logger.info("Getting location from database: {}", location_id)
         
-        location_model = self.session.query(LocationModel).filter(LocationModel.id == location_id).first()
+        result = await self._execute(select(LocationModel).where(LocationModel.id == location_id))
+        location_model = result.scalars().first()
         
         if location_model:
-            logger.info(f"Location found in database: {location_id}")
-            return location_model.to_domain()
+            logger.info("Location found in database: {}", location_id)
+            location = location_model.to_domain()
+            self._cache_set(location_id, replace(location))
+            return location
         
-        logger.warning(f"Location not found in database: {location_id}")
+        logger.warning("Location not found in database: {}", location_id)
+        self._cache_set(location_id, None)
         return None
     
-    async def get_all(
-        self, 
-        limit: Optional[int] = None,
-        offset: int = 0,
-        name_filter: Optional[str] = None
-    ) -> List[Location]:
-        """Get all locations with optional filtering and pagination."""
-        logger.info(f"Getting locations from database: limit={limit}, offset={offset}, name_filter={name_filter}")
+    async def get_by_ids(self, location_ids: List[int]) -> List[Location]:
+        """Get the locations with the given IDs, in no particular order."""
+        logger.info("Getting {} locations by ID from database", len(location_ids))
+        
+        if not location_ids:
+            return []
         
-        query = self.session.query(LocationModel)
+        result = await self._execute(select(LocationModel).where(LocationModel.id.in_(location_ids)))
+        locations = [model.to_domain() for model in result.scalars()]
         
+        logger.info("Retrieved {} locations by ID from database", len(locations))
+        return locations
+    
+    def _filter_list_query(
+        self,
+        query: Select,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        name_filter: Optional[str] = None,
+        after_id: Optional[int] = None,
+        search: Optional[str] = None
+    ) -> Optional[Select]:
+        """Apply list filters, ordering and paging; None when the search has no words."""
         # Apply name filter if provided
         if name_filter:
-            query = query.filter(LocationModel.name.ilike(f"%{name_filter}%"))
+            query = query.where(LocationModel.name.ilike(f"%{name_filter}%"))
+        
+        # Apply full-text search through the FTS5 index, best matches first
+        if search is not None:
+            match_query = build_fts5_prefix_query(search)
+            if match_query is None:
+                return None
+            query = query.join(locations_fts, locations_fts.c.rowid == LocationModel.id).where(
+                literal_column("locations_fts").op("MATCH")(match_query)
+            ).order_by(_SEARCH_RANK)
+        
+        # Apply keyset position so deep pages seek on the primary key instead of scanning
+        if after_id is not None:
+            query = query.where(LocationModel.id > after_id)
         
         # Apply ordering for consistent pagination
         query = query.order_by(LocationModel.id)
@@ -72,20 +135,199 @@ class LocationRepositoryImpl(LocationRepository):
         if limit:
             query = query.limit(limit)
         
-        location_models = query.all()
-        locations = [model.to_domain() for model in location_models]
+        return query
+    
+    async def get_all(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        name_filter: Optional[str] = None,
+        after_id: Optional[int] = None,
+        search: Optional[str] = None
+    ) -> List[Location]:
+        """Get all locations with optional filtering and pagination."""
+        logger.info("Getting locations from database: limit={}, offset={}, name_filter={}, after_id={}, search={}", limit, offset, name_filter, after_id, search)
         
-        logger.info(f"Retrieved {len(locations)} locations from database")
+        query = self._filter_list_query(select(LocationModel), limit, offset, name_filter, after_id, search)
+        if query is None:
+            return []
+        
+        result = await self._execute(query)
+        locations = [model.to_domain() for model in result.scalars()]
+        
+        logger.info("Retrieved {} locations from database", len(locations))
         return locations
     
+    async def get_all_rows(
+        self,
+        fields: Sequence[str],
+        limit: Optional[int] = None,
+        offset: int = 0,
+        name_filter: Optional[str] = None,
+        after_id: Optional[int] = None,
+        search: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get only the ``fields`` columns of the locations ``get_all`` would return, as plain rows.
+        
+        Rows skip ORM hydration, the identity map and domain validation; they are meant
+        for read-only responses.
+        """
+        logger.info("Getting location rows from database: fields={}, limit={}, offset={}, name_filter={}, after_id={}, search={}", list(fields), limit, offset, name_filter, after_id, search)
+        
+        columns = LocationModel.__table__.c
+        query = self._filter_list_query(
+            select(*(columns[field] for field in fields)), limit, offset, name_filter, after_id, search
+        )
+        if query is None:
+            return []
+        
+        result = await self._execute(query)
+        rows = [dict(row) for row in result.mappings()]
+        
+        logger.info("Retrieved {} location rows from database", len(rows))
+        return rows
+    
+    async def stream_all(self, batch_size: int) -> AsyncIterator[List[Location]]:
+        """Stream every location ordered by ID, ``batch_size`` at a time."""
+        logger.info("Streaming locations from database: batch_size={}", batch_size)
+        
+        # Plain column rows skip the ORM identity map, so memory is bounded by one batch
+        columns = LocationModel.__table__.c
+        query = select(
+            columns.id, columns.name, columns.longitude, columns.latitude,
+            columns.description, columns.created_at, columns.updated_at
+        ).order_by(columns.id)
+        
+        total = 0
+        async for rows in self._stream(query, batch_size):
+            total += len(rows)
+            yield [
+                Location(
+                    id=row.id,
+                    coordinates=Coordinates(longitude=row.longitude, latitude=row.latitude),
+                    name=row.name,
+                    description=row.description,
+                    created_at=row.created_at,
+                    updated_at=row.updated_at
+                )
+                for row in rows
+            ]
+        
+        logger.info("Streamed {} locations from database", total)
+    
+    def _bbox_query(
+        self,
+        bbox: BoundingBox,
+        name_filter: Optional[str] = None,
+        columns: Sequence[Any] = (LocationModel,)
+    ) -> Select[Any]:
+        """Build a query selecting ``columns`` of the locations inside a bounding box.
+        
+        The R*Tree prefilters the candidates.
+        """
+        # R*Tree boxes are stored as float32 rounded outwards, so the index lookup
+        # uses overlap tests and the exact columns decide the boundary cases
+        index_conditions = []
+        exact_conditions = []
+        for box in bbox.split_at_antimeridian():
+            index_conditions.append(and_(
+                locations_rtree.c.max_lat >= box.min_latitude,
+                locations_rtree.c.min_lat <= box.max_latitude,
+                locations_rtree.c.max_lon >= box.min_longitude,
+                locations_rtree.c.min_lon <= box.max_longitude,
+            ))
+            exact_conditions.append(and_(
+                LocationModel.latitude.between(box.min_latitude, box.max_latitude),
+                LocationModel.longitude.between(box.min_longitude, box.max_longitude),
+            ))
+        
+        # An IN subquery keeps the R*Tree as the driving lookup whatever the planner's statistics say
+        candidate_ids = select(locations_rtree.c.id).where(or_(*index_conditions))
+        query = select(*columns).where(LocationModel.id.in_(candidate_ids), or_(*exact_conditions))
+        
+        if name_filter:
+            query = query.where(LocationModel.name.ilike(f"%{name_filter}%"))
+        return query
+    
+    async def find_in_bbox(
+        self,
+        bbox: BoundingBox,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        name_filter: Optional[str] = None
+    ) -> List[Location]:
+        """Get locations inside a bounding box, ordered by ID."""
+        logger.info("Getting locations in bounding box from database: {}, limit={}, offset={}, name_filter={}", bbox, limit, offset, name_filter)
+        
+        query = self._bbox_query(bbox, name_filter).order_by(LocationModel.id)
+        
+        if offset > 0:
+            query = query.offset(offset)
+        
+        if limit:
+            query = query.limit(limit)
+        
+        result = await self._execute(query)
+        locations = [model.to_domain() for model in result.scalars()]
+        
+        logger.info("Retrieved {} locations in bounding box from database", len(locations))
+        return locations
+    
+    async def find_within_radius(
+        self,
+        center: Coordinates,
+        radius_km: float,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        name_filter: Optional[str] = None
+    ) -> List[Tuple[Location, float]]:
+        """Get locations within ``radius_km`` of ``center`` with their distances, nearest first."""
+        logger.info("Getting locations within {} km of ({}, {}) from database: limit={}, offset={}, name_filter={}", radius_km, center.longitude, center.latitude, limit, offset, name_filter)
+        
+        # The enclosing box narrows candidates through the index; Haversine decides the circle.
+        # Candidates are read as bare coordinates and only the requested page is loaded as entities
+        bbox = LocationDomainService.bounding_box_around(center, radius_km)
+        result = await self._execute(self._bbox_query(
+            bbox, name_filter, columns=(LocationModel.id, LocationModel.latitude, LocationModel.longitude)
+        ))
+        rows = result.all()
+        if not rows:
+            logger.info("Retrieved 0 locations within radius from database")
+            return []
+        
+        ids = np.array([row.id for row in rows], dtype=np.int64)
+        distances = LocationDomainService.calculate_distances(
+            center, [row.latitude for row in rows], [row.longitude for row in rows]
+        )
+        inside = distances <= radius_km
+        ids, distances = ids[inside], distances[inside]
+        
+        # Nearest first, ties broken by ID
+        order = np.lexsort((ids, distances))
+        page = order[offset:offset + limit] if limit else order[offset:]
+        page_ids: List[int] = ids[page].tolist()
+        page_distances: List[float] = distances[page].tolist()
+        
+        locations = {location.id: location for location in await self.get_by_ids(page_ids)}
+        # A location deleted between the two queries is left out
+        matches = [
+            (locations[location_id], distance)
+            for location_id, distance in zip(page_ids, page_distances)
+            if location_id in locations
+        ]
+        
+        logger.info("Retrieved {} locations within radius from database", len(matches))
+        return matches
+    
     async def update(self, location: Location) -> Location:
         """Update an existing location."""
-        logger.info(f"Updating location in database: {location.id}")
+        logger.info("Updating location in database: {}", location.id)
         
-        location_model = self.session.query(LocationModel).filter(LocationModel.id == location.id).first()
+        result = await self._execute(select(LocationModel).where(LocationModel.id == location.id))
+        location_model = result.scalars().first()
         
         if not location_model:
-            logger.warning(f"Location not found for update: {location.id}")
+            logger.warning("Location not found for update: {}", location.id)
             return None
         
         # Update fields
@@ -95,39 +337,109 @@ class LocationRepositoryImpl(LocationRepository):
         location_model.description = location.description
         location_model.updated_at = location.updated_at
         
-        self.session.commit()
-        self.session.refresh(location_model)
+        await self._commit()
+        self._cache_invalidate(location.id)
+        await self._refresh(location_model)
         
-        logger.info(f"Location updated in database: {location.id}")
+        logger.info("Location updated in database: {}", location.id)
         return location_model.to_domain()
     
     async def delete(self, location_id: int) -> bool:
         """Delete a location by ID."""
-        logger.info(f"Deleting location from database: {location_id}")
+        logger.info("Deleting location from database: {}", location_id)
         
-        location_model = self.session.query(LocationModel).filter(LocationModel.id == location_id).first()
+        result = await self._execute(select(LocationModel).where(LocationModel.id == location_id))
+        location_model = result.scalars().first()
         
         if not location_model:
-            logger.warning(f"Location not found for deletion: {location_id}")
+            logger.warning("Location not found for deletion: {}", location_id)
             return False
         
-        self.session.delete(location_model)
-        self.session.commit()
+        await self._delete(location_model)
+        await self._commit()
+        self._cache_invalidate(location_id)
         
-        logger.info(f"Location deleted from database: {location_id}")
+        logger.info("Location deleted from database: {}", location_id)
         return True
     
     async def exists_by_name_and_coordinates(self, name: str, longitude: float, latitude: float) -> bool:
         """Check if location exists by name and coordinates."""
-        logger.info(f"Checking if location exists: {name} at ({longitude}, {latitude})")
+        logger.info("Checking if location exists: {} at ({}, {})", name, longitude, latitude)
+        
+        result = await self._execute(
+            select(LocationModel.id).where(
+                and_(
+                    LocationModel.name == name,
+                    LocationModel.longitude == longitude,
+                    LocationModel.latitude == latitude
+                )
+            ).limit(1)
+        )
+        exists = result.first() is not None
+        
+        logger.info("Location exists check result: {}", exists)
+        return exists
+    
+    @batched_statements
+    async def create_many(self, locations: List[Location]) -> List[int]:
+        """Insert locations in one transaction and return their IDs in input order.
+        
+        ``locations`` must not repeat a (name, longitude, latitude) key.
+        """
+        logger.info("Creating {} locations in database", len(locations))
+        
+        if not locations:
+            return []
+        
+        rows = [
+            {
+                "name": location.name,
+                "longitude": location.longitude,
+                "latitude": location.latitude,
+                "description": location.description,
+                "created_at": location.created_at,
+                "updated_at": location.updated_at,
+            }
+            for location in locations
+        ]
+        
+        try:
+            # executemany with RETURNING, batched into multi-row INSERTs by SQLAlchemy. SQLite
+            # cannot guarantee RETURNING order for those, so IDs are matched back by key
+            result = await self._execute(
+                insert(LocationModel).returning(
+                    LocationModel.id, LocationModel.name, LocationModel.longitude, LocationModel.latitude
+                ),
+                rows
+            )
+            ids_by_key = {(row.name, row.longitude, row.latitude): row.id for row in result}
+            location_ids = [
+                ids_by_key[(location.name, location.longitude, location.latitude)] for location in locations
+            ]
+            await self._commit()
+            self._cache_invalidate(*location_ids)
+        except Exception as e:
+            logger.error("Error creating locations: {}", e)
+            await self._rollback()
+            raise
+        
+        logger.info("Created {} locations in database", len(location_ids))
+        return location_ids
+    
+    @batched_statements
+    async def find_existing_keys(self, names: Sequence[str]) -> Set[Tuple[str, float, float]]:
+        """Get the (name, longitude, latitude) keys already stored for any of ``names``."""
+        logger.info("Looking up existing locations for {} names", len(names))
         
-        exists = self.session.query(LocationModel).filter(
-            and_(
-                LocationModel.name == name,
-                LocationModel.longitude == longitude,
-                LocationModel.latitude == latitude
+        keys = set()
+        unique_names = sorted(set(names))
+        for start in range(0, len(unique_names), _NAME_CHUNK_SIZE):
+            result = await self._execute(
+                select(LocationModel.name, LocationModel.longitude, LocationModel.latitude).where(
+                    LocationModel.name.in_(unique_names[start:start + _NAME_CHUNK_SIZE])
+                )
             )
-        ).first() is not None
+            keys.update((row.name, row.longitude, row.latitude) for row in result)
         
-        logger.info(f"Location exists check result: {exists}")
-        return exists 
\ No newline at end of file
+        logger.info("Found {} existing locations", len(keys))
+        return keys
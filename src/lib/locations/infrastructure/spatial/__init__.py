@@ -0,0 +1 @@
+"""Locations spatial index package for Map My World API."""
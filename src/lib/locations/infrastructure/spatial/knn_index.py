@@ -0,0 +1,300 @@
+"""In-memory k-nearest-neighbour index for locations."""
+import heapq
+import math
+import threading
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+import numpy.typing as npt
+from sqlalchemy import select
+from sqlalchemy.engine import Engine, Row
+from ...domain.services import EARTH_RADIUS_KM
+from ..orm.models import LocationModel
+from src.shared.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_LEAF_SIZE = 64
+DEFAULT_REBUILD_THRESHOLD = 4096
+
+
+def to_unit_vectors(latitudes: npt.ArrayLike, longitudes: npt.ArrayLike) -> np.ndarray:
+    """Map latitude/longitude degrees to 3D points on the unit sphere."""
+    lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lon = np.radians(np.asarray(longitudes, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+def km_to_chord(distance_km: float) -> float:
+    """Convert a great-circle distance to the straight-line distance between unit vectors."""
+    angle = min(distance_km / EARTH_RADIUS_KM, math.pi)
+    return 2.0 * math.sin(angle / 2.0)
+
+
+def chord_to_km(chord: float) -> float:
+    """Convert a straight-line distance between unit vectors to a great-circle distance."""
+    return 2.0 * EARTH_RADIUS_KM * math.asin(min(1.0, chord / 2.0))
+
+
+@dataclass(frozen=True)
+class _KDTree:
+    """Immutable KD-tree whose leaves are contiguous slices of ``points``."""
+    
+    ids: np.ndarray
+    points: np.ndarray
+    starts: List[int]
+    ends: List[int]
+    lefts: List[int]
+    rights: List[int]
+    box_mins: List[Tuple[float, float, float]]
+    box_maxs: List[Tuple[float, float, float]]
+    
+    @classmethod
+    def build(cls, ids: np.ndarray, points: np.ndarray, leaf_size: int) -> "_KDTree":
+        """Build a tree by splitting on the median of the widest axis."""
+        order = np.arange(len(ids))
+        starts, ends, lefts, rights, box_mins, box_maxs = [], [], [], [], [], []
+        
+        def new_node(start: int, end: int) -> int:
+            starts.append(start)
+            ends.append(end)
+            lefts.append(-1)
+            rights.append(-1)
+            box_mins.append((0.0, 0.0, 0.0))
+            box_maxs.append((0.0, 0.0, 0.0))
+            return len(starts) - 1
+        
+        stack = [new_node(0, len(ids))] if len(ids) else []
+        while stack:
+            node = stack.pop()
+            start, end = starts[node], ends[node]
+            chunk = points[order[start:end]]
+            low, high = chunk.min(axis=0), chunk.max(axis=0)
+            box_mins[node] = tuple(low.tolist())
+            box_maxs[node] = tuple(high.tolist())
+            
+            if end - start <= leaf_size:
+                continue
+            
+            axis = int(np.argmax(high - low))
+            mid = (start + end) // 2
+            partition = np.argpartition(chunk[:, axis], mid - start)
+            order[start:end] = order[start:end][partition]
+            
+            lefts[node] = new_node(start, mid)
+            rights[node] = new_node(mid, end)
+            stack.extend((lefts[node], rights[node]))
+        
+        return cls(
+            ids=ids[order],
+            points=np.ascontiguousarray(points[order]),
+            starts=starts,
+            ends=ends,
+            lefts=lefts,
+            rights=rights,
+            box_mins=box_mins,
+            box_maxs=box_maxs,
+        )
+    
+    def _box_distance_sq(self, node: int, x: float, y: float, z: float) -> float:
+        """Get the squared distance from a point to a node's bounding box."""
+        total = 0.0
+        for value, low, high in zip((x, y, z), self.box_mins[node], self.box_maxs[node]):
+            if value < low:
+                total += (low - value) ** 2
+            elif value > high:
+                total += (value - high) ** 2
+        return total
+    
+    def search(
+        self,
+        query: np.ndarray,
+        k: int,
+        bound_sq: float,
+        best_ids: np.ndarray,
+        best_sq: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Merge this tree's k nearest points within ``bound_sq`` into the current best set."""
+        if not self.starts:
+            return best_ids, best_sq
+        
+        x, y, z = query.tolist()
+        if len(best_sq) == k:
+            bound_sq = min(bound_sq, float(best_sq.max()))
+        
+        # Best-first traversal: always expand the node whose box is closest to the query
+        heap = [(self._box_distance_sq(0, x, y, z), 0)]
+        while heap:
+            node_sq, node = heapq.heappop(heap)
+            if node_sq > bound_sq:
+                break
+            
+            if self.lefts[node] < 0:
+                diff = self.points[self.starts[node]:self.ends[node]] - query
+                leaf_sq = np.einsum("ij,ij->i", diff, diff)
+                best_ids, best_sq = _keep_nearest(
+                    np.concatenate((best_ids, self.ids[self.starts[node]:self.ends[node]])),
+                    np.concatenate((best_sq, leaf_sq)),
+                    k,
+                    bound_sq,
+                )
+                if len(best_sq) == k:
+                    bound_sq = min(bound_sq, float(best_sq.max()))
+                continue
+            
+            for child in (self.lefts[node], self.rights[node]):
+                child_sq = self._box_distance_sq(child, x, y, z)
+                if child_sq <= bound_sq:
+                    heapq.heappush(heap, (child_sq, child))
+        
+        return best_ids, best_sq
+
+
+def _keep_nearest(
+    ids: np.ndarray,
+    distances_sq: np.ndarray,
+    k: int,
+    bound_sq: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Keep the (at most) ``k`` smallest distances that are within ``bound_sq``."""
+    within = distances_sq <= bound_sq
+    if not within.all():
+        ids, distances_sq = ids[within], distances_sq[within]
+    if len(distances_sq) > k:
+        nearest = np.argpartition(distances_sq, k - 1)[:k]
+        ids, distances_sq = ids[nearest], distances_sq[nearest]
+    return ids, distances_sq
+
+
+class LocationKNNIndex:
+    """k-nearest-neighbour index over location coordinates.
+    
+    Locations are stored as unit vectors in a KD-tree, where straight-line (chord)
+    distance orders points exactly like great-circle distance. New locations go to a
+    small pending buffer that is scanned by brute force; once it reaches
+    ``rebuild_threshold`` entries the tree is rebuilt on a background thread and
+    swapped in, so inserts never wait for a rebuild.
+    """
+    
+    def __init__(
+        self,
+        leaf_size: int = DEFAULT_LEAF_SIZE,
+        rebuild_threshold: int = DEFAULT_REBUILD_THRESHOLD,
+    ) -> None:
+        self.leaf_size = leaf_size
+        self.rebuild_threshold = rebuild_threshold
+        self._lock = threading.Lock()
+        self._tree = _KDTree.build(np.empty(0, dtype=np.int64), np.empty((0, 3)), leaf_size)
+        self._pending_ids = np.empty(rebuild_threshold, dtype=np.int64)
+        self._pending_points = np.empty((rebuild_threshold, 3))
+        self._pending_count = 0
+        self._rebuilding = False
+    
+    def __len__(self) -> int:
+        """Get the number of indexed locations."""
+        return len(self._tree.ids) + self._pending_count
+    
+    def load(self, ids: np.ndarray, latitudes: np.ndarray, longitudes: np.ndarray) -> None:
+        """Replace the index contents with the given locations."""
+        tree = _KDTree.build(
+            np.asarray(ids, dtype=np.int64),
+            to_unit_vectors(latitudes, longitudes),
+            self.leaf_size,
+        )
+        with self._lock:
+            self._tree = tree
+            self._pending_count = 0
+        logger.info("Location k-NN index loaded with {} locations", len(tree.ids))
+    
+    def add(self, location_id: int, latitude: float, longitude: float) -> None:
+        """Add one location to the index."""
+        self.add_many([location_id], [latitude], [longitude])
+    
+    def add_many(
+        self,
+        location_ids: Sequence[int],
+        latitudes: Sequence[float],
+        longitudes: Sequence[float]
+    ) -> None:
+        """Add many locations to the index."""
+        points = to_unit_vectors(latitudes, longitudes)
+        with self._lock:
+            end = self._pending_count + len(points)
+            if end > len(self._pending_ids):
+                capacity = max(end, 2 * len(self._pending_ids))
+                self._pending_ids = np.resize(self._pending_ids, capacity)
+                self._pending_points = np.resize(self._pending_points, (capacity, 3))
+            self._pending_ids[self._pending_count:end] = location_ids
+            self._pending_points[self._pending_count:end] = points
+            self._pending_count = end
+            
+            start_rebuild = self._pending_count >= self.rebuild_threshold and not self._rebuilding
+            if start_rebuild:
+                self._rebuilding = True
+        
+        if start_rebuild:
+            threading.Thread(target=self._rebuild, name="location-knn-rebuild", daemon=True).start()
+    
+    def _rebuild(self) -> None:
+        """Fold the pending buffer into a freshly built tree."""
+        try:
+            with self._lock:
+                tree = self._tree
+                merged = self._pending_count
+                ids = np.concatenate((tree.ids, self._pending_ids[:merged]))
+                points = np.concatenate((tree.points, self._pending_points[:merged]))
+            
+            new_tree = _KDTree.build(ids, points, self.leaf_size)
+            
+            with self._lock:
+                # Keep whatever was added while the tree was being built
+                remaining = self._pending_count - merged
+                self._pending_ids[:remaining] = self._pending_ids[merged:self._pending_count]
+                self._pending_points[:remaining] = self._pending_points[merged:self._pending_count]
+                self._pending_count = remaining
+                self._tree = new_tree
+            logger.info("Location k-NN index rebuilt with {} locations", len(new_tree.ids))
+        except Exception as e:
+            logger.error("Location k-NN index rebuild failed: {}", e)
+        finally:
+            with self._lock:
+                self._rebuilding = False
+    
+    def query(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int,
+        max_km: Optional[float] = None,
+    ) -> List[Tuple[int, float]]:
+        """Get up to ``k`` nearest location IDs with their distances in km, nearest first."""
+        query = to_unit_vectors([latitude], [longitude])[0]
+        bound_sq = km_to_chord(max_km) ** 2 if max_km is not None else math.inf
+        
+        with self._lock:
+            tree = self._tree
+            pending_ids = self._pending_ids[:self._pending_count].copy()
+            pending_points = self._pending_points[:self._pending_count].copy()
+        
+        diff = pending_points - query
+        pending_sq = np.einsum("ij,ij->i", diff, diff)
+        best_ids, best_sq = _keep_nearest(pending_ids, pending_sq, k, bound_sq)
+        best_ids, best_sq = tree.search(query, k, bound_sq, best_ids, best_sq)
+        
+        order = np.lexsort((best_ids, best_sq))
+        return [
+            (int(location_id), chord_to_km(math.sqrt(distance_sq)))
+            for location_id, distance_sq in zip(best_ids[order].tolist(), best_sq[order].tolist())
+        ]
+
+
+def load_location_index(index: LocationKNNIndex, bind: Engine) -> None:
+    """Load every stored location into the index."""
+    with bind.connect() as connection:
+        rows: Sequence[Row[int, float, float]] = connection.execute(
+            select(LocationModel.id, LocationModel.latitude, LocationModel.longitude)
+        ).all()
+    
+    data = np.array(rows, dtype=np.float64).reshape(-1, 3)
+    index.load(data[:, 0].astype(np.int64), data[:, 1], data[:, 2])
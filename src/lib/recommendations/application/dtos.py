@@ -1,7 +1,8 @@
 """DTOs for recommendations application layer."""
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+from ..domain.entities import ReviewMarkResult
 
 
 @dataclass
@@ -35,4 +36,22 @@ class MarkAsReviewedDTO:
     """DTO for marking a combination as reviewed."""
     
     location_id: int
-    category_id: int 
\ No newline at end of file
+    category_id: int
+
+
+@dataclass
+class BulkMarkAsReviewedItemDTO:
+    """DTO for one item of a bulk mark-as-reviewed request."""
+    
+    location_id: int
+    category_id: int
+    reviewed_at: Optional[datetime] = None
+
+
+@dataclass
+class BulkMarkAsReviewedResultDTO:
+    """DTO for the per-item report of a bulk mark-as-reviewed request."""
+    
+    reviewed: int
+    failed: int
+    results: List[ReviewMarkResult]
@@ -0,0 +1,34 @@
+"""Bulk mark as reviewed use case."""
+from datetime import timezone
+from typing import List
+from ...domain.entities import ReviewMark, ReviewMarkResult
+from ...domain.repositories import RecommendationRepository
+from ..dtos import BulkMarkAsReviewedItemDTO, BulkMarkAsReviewedResultDTO
+from src.shared.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class BulkMarkAsReviewedUseCase:
+    """Use case for marking many location-category combinations as reviewed at once."""
+    
+    def __init__(self, recommendation_repository: RecommendationRepository) -> None:
+        self.recommendation_repository = recommendation_repository
+    
+    async def execute(self, items: List[BulkMarkAsReviewedItemDTO]) -> BulkMarkAsReviewedResultDTO:
+        """Execute the bulk mark as reviewed use case."""
+        logger.info("Bulk marking {} combinations as reviewed", len(items))
+        
+        marks = []
+        for item in items:
+            reviewed_at = item.reviewed_at
+            # Reviews are stored as naive UTC, like the ones stamped by the server
+            if reviewed_at is not None and reviewed_at.tzinfo is not None:
+                reviewed_at = reviewed_at.astimezone(timezone.utc).replace(tzinfo=None)
+            marks.append(ReviewMark(location_id=item.location_id, category_id=item.category_id, reviewed_at=reviewed_at))
+        
+        results = await self.recommendation_repository.mark_many_as_reviewed(marks)
+        reviewed = sum(1 for result in results if result.status == ReviewMarkResult.REVIEWED)
+        
+        logger.info("Bulk marked {} of {} combinations as reviewed", reviewed, len(items))
+        return BulkMarkAsReviewedResultDTO(reviewed=reviewed, failed=len(results) - reviewed, results=results)
@@ -22,5 +22,5 @@ class GetRecommendationsUseCase:
         # The repository handles the optimized SQL query
         combinations = await self.recommendation_repository.get_unreviewed_combinations(limit=10)
         
-        logger.info(f"Retrieved {len(combinations)} recommendations")
+        logger.info("Retrieved {} recommendations", len(combinations))
         return combinations 
\ No newline at end of file
@@ -22,4 +22,27 @@ class LocationCategoryReview:
             "category_id": self.category_id,
             "reviewed_at": self.reviewed_at.isoformat() if self.reviewed_at else None,
             "created_at": self.created_at.isoformat(),
-        } 
\ No newline at end of file
+        }
+
+
+@dataclass
+class ReviewMark:
+    """A request to mark a location-category combination as reviewed."""
+    
+    location_id: int
+    category_id: int
+    reviewed_at: Optional[datetime] = None
+
+
+@dataclass
+class ReviewMarkResult:
+    """Outcome of one ReviewMark in a batch."""
+    
+    REVIEWED = "reviewed"
+    LOCATION_NOT_FOUND = "location_not_found"
+    CATEGORY_NOT_FOUND = "category_not_found"
+    
+    location_id: int
+    category_id: int
+    status: str
+    reviewed_at: Optional[datetime] = None
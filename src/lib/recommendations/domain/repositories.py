@@ -1,6 +1,6 @@
 """Repository interfaces for recommendations domain."""
 from typing import Protocol, List
-from .entities import LocationCategoryReview
+from .entities import LocationCategoryReview, ReviewMark, ReviewMarkResult
 
 
 class RecommendationRepository(Protocol):
@@ -14,6 +14,10 @@ class RecommendationRepository(Protocol):
         """Mark a location-category combination as reviewed."""
         ...
     
+    async def mark_many_as_reviewed(self, marks: List[ReviewMark]) -> List[ReviewMarkResult]:
+        """Mark many combinations as reviewed in one transaction, reporting each one's outcome."""
+        ...
+    
     async def get_reviewed_combinations(self, location_id: int, category_id: int) -> List[LocationCategoryReview]:
         """Get reviewed combinations for a specific location and category."""
         ...
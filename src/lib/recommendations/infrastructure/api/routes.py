@@ -3,9 +3,17 @@ from typing import List
 from fastapi import APIRouter, Depends
 from ...application.use_cases.get_recommendations import GetRecommendationsUseCase
 from ...application.use_cases.mark_as_reviewed import MarkAsReviewedUseCase
-from ...application.dtos import MarkAsReviewedDTO
-from .schemas import RecommendationResponseSchema, MarkAsReviewedSchema
+from ...application.use_cases.bulk_mark_as_reviewed import BulkMarkAsReviewedUseCase
+from ...application.dtos import BulkMarkAsReviewedItemDTO, MarkAsReviewedDTO
+from .schemas import (
+    BulkMarkAsReviewedItemResultSchema,
+    BulkMarkAsReviewedResponseSchema,
+    BulkMarkAsReviewedSchema,
+    MarkAsReviewedSchema,
+    RecommendationResponseSchema
+)
 from config.dependencies import (
+    get_bulk_mark_as_reviewed_use_case,
     get_get_recommendations_use_case,
     get_mark_as_reviewed_use_case
 )
@@ -26,7 +34,7 @@ async def get_recommendations(
     # Execute use case
     results = await use_case.execute()
     
-    logger.info(f"Retrieved {len(results)} recommendations")
+    logger.info("Retrieved {} recommendations", len(results))
     return results
 
 
@@ -36,7 +44,7 @@ async def mark_as_reviewed(
     use_case: MarkAsReviewedUseCase = Depends(get_mark_as_reviewed_use_case)
 ) -> dict:
     """Mark a location-category combination as reviewed."""
-    logger.info(f"Marking location {data.location_id} - category {data.category_id} as reviewed")
+    logger.info("Marking location {} - category {} as reviewed", data.location_id, data.category_id)
     
     # Convert schema to DTO
     mark_dto = MarkAsReviewedDTO(
@@ -47,5 +55,41 @@ async def mark_as_reviewed(
     # Execute use case
     await use_case.execute(mark_dto)
     
-    logger.info(f"Successfully marked location {data.location_id} - category {data.category_id} as reviewed")
-    return {"message": "Successfully marked as reviewed"} 
\ No newline at end of file
+    logger.info("Successfully marked location {} - category {} as reviewed", data.location_id, data.category_id)
+    return {"message": "Successfully marked as reviewed"}
+
+
+@router.post("/mark-reviewed/bulk", response_model=BulkMarkAsReviewedResponseSchema, status_code=200)
+async def bulk_mark_as_reviewed(
+    data: BulkMarkAsReviewedSchema,
+    use_case: BulkMarkAsReviewedUseCase = Depends(get_bulk_mark_as_reviewed_use_case)
+) -> BulkMarkAsReviewedResponseSchema:
+    """Mark many location-category combinations as reviewed in one transaction.
+    
+    Items referring to unknown locations or categories are reported and skipped;
+    the rest are written together with a single commit.
+    """
+    logger.info("Bulk marking {} combinations as reviewed", len(data.items))
+    
+    # Convert schema to DTOs
+    items = [
+        BulkMarkAsReviewedItemDTO(
+            location_id=item.location_id,
+            category_id=item.category_id,
+            reviewed_at=item.reviewed_at
+        )
+        for item in data.items
+    ]
+    
+    # Execute use case
+    result = await use_case.execute(items)
+    
+    logger.info("Bulk marked {} combinations as reviewed, {} failed", result.reviewed, result.failed)
+    return BulkMarkAsReviewedResponseSchema(
+        reviewed=result.reviewed,
+        failed=result.failed,
+        results=[
+            BulkMarkAsReviewedItemResultSchema.from_domain(index, item_result)
+            for index, item_result in enumerate(result.results)
+        ]
+    )
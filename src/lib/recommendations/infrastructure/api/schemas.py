@@ -1,7 +1,11 @@
 """Pydantic schemas for recommendations API."""
-from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field
+from datetime import datetime, timezone
+from typing import List, Optional
+from pydantic import BaseModel, Field, field_validator
+from ...domain.entities import ReviewMarkResult
+
+# Largest number of items accepted by one bulk mark-as-reviewed request
+MAX_BULK_REVIEW_ITEMS = 5000
 
 
 class RecommendationResponseSchema(BaseModel):
@@ -41,4 +45,87 @@ class MarkAsReviewedSchema(BaseModel):
                 "location_id": 1,
                 "category_id": 1
             }
-        } 
\ No newline at end of file
+        }
+
+
+class BulkMarkAsReviewedItemSchema(BaseModel):
+    """Schema for one item of a bulk mark-as-reviewed request."""
+    
+    location_id: int = Field(..., description="Location ID")
+    category_id: int = Field(..., description="Category ID")
+    reviewed_at: Optional[datetime] = Field(
+        None,
+        description=(
+            "When the review happened (defaults to now, must not be in the future); "
+            "older than the stored review is ignored"
+        )
+    )
+    
+    @field_validator('reviewed_at')
+    @classmethod
+    def reject_future_review(cls, v: Optional[datetime]) -> Optional[datetime]:
+        """Reject review times after now, which would hide the combination until then.
+        
+        Stored review times only move forward, so a later correct mark could not undo one.
+        Times without an offset are taken as UTC.
+        """
+        if v is None:
+            return v
+        aware = v if v.tzinfo is not None else v.replace(tzinfo=timezone.utc)
+        if aware > datetime.now(timezone.utc):
+            raise ValueError("reviewed_at must not be in the future")
+        return v
+
+
+class BulkMarkAsReviewedSchema(BaseModel):
+    """Schema for marking many combinations as reviewed."""
+    
+    items: List[BulkMarkAsReviewedItemSchema] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BULK_REVIEW_ITEMS,
+        description="Combinations to mark as reviewed"
+    )
+    
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "items": [
+                    {"location_id": 1, "category_id": 1},
+                    {"location_id": 2, "category_id": 3, "reviewed_at": "2024-05-01T09:30:00Z"}
+                ]
+            }
+        }
+    }
+
+
+class BulkMarkAsReviewedItemResultSchema(BaseModel):
+    """Schema for the outcome of one bulk mark-as-reviewed item."""
+    
+    index: int = Field(..., description="Position of the item in the request")
+    location_id: int = Field(..., description="Location ID")
+    category_id: int = Field(..., description="Category ID")
+    status: str = Field(..., description="reviewed, location_not_found or category_not_found")
+    reviewed_at: Optional[datetime] = Field(
+        None,
+        description="Review time stored for this combination after the batch (a newer existing review is kept)"
+    )
+    
+    @classmethod
+    def from_domain(cls, index: int, result: ReviewMarkResult) -> "BulkMarkAsReviewedItemResultSchema":
+        """Create schema from a domain result."""
+        return cls(
+            index=index,
+            location_id=result.location_id,
+            category_id=result.category_id,
+            status=result.status,
+            reviewed_at=result.reviewed_at
+        )
+
+
+class BulkMarkAsReviewedResponseSchema(BaseModel):
+    """Schema for bulk mark-as-reviewed responses."""
+    
+    reviewed: int = Field(..., description="Number of items marked as reviewed")
+    failed: int = Field(..., description="Number of items rejected")
+    results: List[BulkMarkAsReviewedItemResultSchema] = Field(..., description="Outcome of each item, in request order")
@@ -1,9 +1,18 @@
 """SQLAlchemy models for recommendations."""
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index, event
 from sqlalchemy.sql import func
 from config.database import Base
+from src.shared.database.sqlite import table_exists
 from ...domain.entities import LocationCategoryReview
 
+# A combination is recommended again this many days after its last review
+REVIEW_INTERVAL_DAYS = 30
+
+# Due date of never-reviewed combinations: earlier than any real due date, so they come first
+NEVER_REVIEWED_DUE_AT = "0001-01-01 00:00:00"
+
+_DUE_AT_FORMAT = "%Y-%m-%d %H:%M:%f"
+
 
 class LocationCategoryReviewModel(Base):
     """SQLAlchemy model for location_category_reviewed table."""
@@ -20,6 +29,7 @@ class LocationCategoryReviewModel(Base):
     __table_args__ = (
         Index('idx_location_category_reviewed_date', 'reviewed_at'),
         Index('idx_location_category_reviewed_composite', 'location_id', 'category_id', 'reviewed_at'),
+        Index('uq_location_category_reviewed_pair', 'location_id', 'category_id', unique=True),
     )
     
     def to_domain(self) -> LocationCategoryReview:
@@ -41,4 +51,106 @@ class LocationCategoryReviewModel(Base):
             category_id=review.category_id,
             reviewed_at=review.reviewed_at,
             created_at=review.created_at
-        ) 
\ No newline at end of file
+        )
+
+
+def _due_at_sql(reviewed_at: str) -> str:
+    """Get the SQL expression for the due date of a combination reviewed at ``reviewed_at``."""
+    return (
+        f"CASE WHEN {reviewed_at} IS NULL THEN '{NEVER_REVIEWED_DUE_AT}' "
+        f"ELSE strftime('{_DUE_AT_FORMAT}', {reviewed_at}, '+{REVIEW_INTERVAL_DAYS} days') END"
+    )
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _ensure_unique_review_pairs(target, connection, **kw) -> None:
+    """Add the unique (location_id, category_id) index to databases created before it existed.
+    
+    Duplicate review rows left by the old read-then-write path are collapsed first,
+    keeping the most recent review of each pair.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    
+    exists = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'uq_location_category_reviewed_pair'"
+    ).first()
+    if exists is not None:
+        return
+    
+    connection.exec_driver_sql(
+        "DELETE FROM location_category_reviewed WHERE id NOT IN ("
+        "SELECT id FROM (SELECT id, row_number() OVER ("
+        "PARTITION BY location_id, category_id ORDER BY reviewed_at IS NULL, reviewed_at DESC, id DESC"
+        ") AS position FROM location_category_reviewed) WHERE position = 1)"
+    )
+    connection.exec_driver_sql(
+        "CREATE UNIQUE INDEX uq_location_category_reviewed_pair "
+        "ON location_category_reviewed (location_id, category_id)"
+    )
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_review_queue(target, connection, **kw) -> None:
+    """Create the review queue: one row per location-category combination ordered by due date.
+    
+    Triggers add rows when locations or categories are created, drop them when either side
+    is deleted, and move a combination's due date whenever it is reviewed, so recommendations
+    are an index range scan instead of a ``locations x categories`` join.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    
+    is_new = not table_exists(connection, "review_queue")
+    
+    connection.exec_driver_sql(
+        "CREATE TABLE IF NOT EXISTS review_queue ("
+        "location_id INTEGER NOT NULL, "
+        "category_id INTEGER NOT NULL, "
+        "reviewed_at DATETIME, "
+        "due_at DATETIME NOT NULL, "
+        "PRIMARY KEY (location_id, category_id))"
+    )
+    connection.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_review_queue_due ON review_queue (due_at, location_id, category_id)"
+    )
+    connection.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_review_queue_category ON review_queue (category_id)"
+    )
+    
+    connection.exec_driver_sql(
+        "CREATE TRIGGER IF NOT EXISTS review_queue_location_ai AFTER INSERT ON locations BEGIN "
+        "INSERT INTO review_queue (location_id, category_id, reviewed_at, due_at) "
+        f"SELECT new.id, categories.id, NULL, '{NEVER_REVIEWED_DUE_AT}' FROM categories; END"
+    )
+    connection.exec_driver_sql(
+        "CREATE TRIGGER IF NOT EXISTS review_queue_category_ai AFTER INSERT ON categories BEGIN "
+        "INSERT INTO review_queue (location_id, category_id, reviewed_at, due_at) "
+        f"SELECT locations.id, new.id, NULL, '{NEVER_REVIEWED_DUE_AT}' FROM locations; END"
+    )
+    connection.exec_driver_sql(
+        "CREATE TRIGGER IF NOT EXISTS review_queue_location_ad AFTER DELETE ON locations BEGIN "
+        "DELETE FROM review_queue WHERE location_id = old.id; END"
+    )
+    connection.exec_driver_sql(
+        "CREATE TRIGGER IF NOT EXISTS review_queue_category_ad AFTER DELETE ON categories BEGIN "
+        "DELETE FROM review_queue WHERE category_id = old.id; END"
+    )
+    for event_name, suffix in (("INSERT", "ai"), ("UPDATE OF reviewed_at", "au")):
+        connection.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS review_queue_review_{suffix} "
+            f"AFTER {event_name} ON location_category_reviewed BEGIN "
+            f"UPDATE review_queue SET reviewed_at = new.reviewed_at, due_at = {_due_at_sql('new.reviewed_at')} "
+            f"WHERE location_id = new.location_id AND category_id = new.category_id; END"
+        )
+    
+    if is_new:
+        # Seed the queue once from the existing catalogue and review history
+        connection.exec_driver_sql(
+            "INSERT INTO review_queue (location_id, category_id, reviewed_at, due_at) "
+            f"SELECT l.id, c.id, r.reviewed_at, {_due_at_sql('r.reviewed_at')} "
+            "FROM locations l CROSS JOIN categories c "
+            "LEFT JOIN (SELECT location_id, category_id, max(reviewed_at) AS reviewed_at "
+            "FROM location_category_reviewed GROUP BY location_id, category_id) r "
+            "ON r.location_id = l.id AND r.category_id = c.id"
+        )
@@ -1,51 +1,90 @@
 """SQLAlchemy repository implementation for recommendations."""
-from typing import List
+from typing import Dict, List, Set, Tuple
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import text
-from ...domain.entities import LocationCategoryReview
+from sqlalchemy import DateTime, case, column, or_, select, table, tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from ...domain.entities import LocationCategoryReview, ReviewMark, ReviewMarkResult
 from ...domain.repositories import RecommendationRepository
 from .models import LocationCategoryReviewModel
 from src.lib.locations.infrastructure.orm.models import LocationModel
 from src.lib.categories.infrastructure.orm.models import CategoryModel
+from src.shared.database.instrumentation import batched_statements
+from src.shared.database.repository import SQLAlchemyRepository
+from src.shared.exceptions.domain_errors import CategoryNotFoundError, LocationNotFoundError
 from src.shared.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Review queue maintained by triggers on locations, categories and reviews (see models.py)
+review_queue = table(
+    "review_queue",
+    column("location_id"),
+    column("category_id"),
+    column("reviewed_at", DateTime),
+    column("due_at", DateTime),
+)
 
-class RecommendationRepositoryImpl(RecommendationRepository):
-    """SQLAlchemy implementation of RecommendationRepository."""
+_REVIEW_COLUMNS = (
+    LocationCategoryReviewModel.id,
+    LocationCategoryReviewModel.location_id,
+    LocationCategoryReviewModel.category_id,
+    LocationCategoryReviewModel.reviewed_at,
+    LocationCategoryReviewModel.created_at,
+)
+
+
+# Bound parameters per IN (...) query, well under SQLite's variable limit
+_ID_CHUNK_SIZE = 500
+
+
+def _upsert_review():
+    """Build the review upsert on the unique (location_id, category_id) pair.
     
-    def __init__(self, session: Session) -> None:
-        self.session = session
+    An existing review is only moved forward, so replaying an older mark never
+    hides a newer one.
+    """
+    statement = sqlite_insert(LocationCategoryReviewModel)
+    current = LocationCategoryReviewModel.reviewed_at
+    return statement.on_conflict_do_update(
+        index_elements=[LocationCategoryReviewModel.location_id, LocationCategoryReviewModel.category_id],
+        set_={
+            "reviewed_at": case(
+                (or_(current.is_(None), statement.excluded.reviewed_at > current), statement.excluded.reviewed_at),
+                else_=current
+            )
+        }
+    )
+
+
+class RecommendationRepositoryImpl(SQLAlchemyRepository, RecommendationRepository):
+    """SQLAlchemy implementation of RecommendationRepository."""
     
     async def get_unreviewed_combinations(self, limit: int = 10) -> List[dict]:
         """Get location-category combinations not reviewed in the last 30 days."""
-        logger.info(f"Getting unreviewed combinations with limit: {limit}")
-        
-        # Optimized SQL query for recommendations
-        query = text("""
-            SELECT 
-                l.id as location_id,
-                l.name as location_name,
-                l.longitude,
-                l.latitude,
-                c.id as category_id,
-                c.name as category_name,
-                lcr.reviewed_at
-            FROM locations l
-            CROSS JOIN categories c
-            LEFT JOIN location_category_reviewed lcr 
-                ON l.id = lcr.location_id AND c.id = lcr.category_id
-            WHERE lcr.reviewed_at IS NULL 
-                OR lcr.reviewed_at < datetime('now', '-30 days')
-            ORDER BY 
-                lcr.reviewed_at IS NULL DESC,  -- Never reviewed first
-                lcr.reviewed_at ASC            -- Then oldest ones
-            LIMIT :limit
-        """)
-        
-        result = self.session.execute(query, {"limit": limit})
+        logger.info("Getting unreviewed combinations with limit: {}", limit)
+        
+        # Range scan on the review queue's due_at index: never-reviewed combinations
+        # come first, then the ones whose last review is oldest
+        query = select(
+            review_queue.c.location_id,
+            LocationModel.name.label("location_name"),
+            LocationModel.longitude,
+            LocationModel.latitude,
+            review_queue.c.category_id,
+            CategoryModel.name.label("category_name"),
+            review_queue.c.reviewed_at,
+        ).join(
+            LocationModel, LocationModel.id == review_queue.c.location_id
+        ).join(
+            CategoryModel, CategoryModel.id == review_queue.c.category_id
+        ).where(
+            review_queue.c.due_at <= datetime.utcnow()
+        ).order_by(
+            review_queue.c.due_at, review_queue.c.location_id, review_queue.c.category_id
+        ).limit(limit)
+        
+        result = await self._execute(query)
         
         # Convert to dictionary format for API response
         combinations = []
@@ -61,85 +100,169 @@ class RecommendationRepositoryImpl(RecommendationRepository):
             }
             combinations.append(combination)
         
-        logger.info(f"Retrieved {len(combinations)} unreviewed combinations")
+        logger.info("Retrieved {} unreviewed combinations", len(combinations))
         return combinations
     
     async def mark_as_reviewed(self, location_id: int, category_id: int) -> LocationCategoryReview:
-        """Mark a location-category combination as reviewed."""
-        logger.info(f"Marking location {location_id} - category {category_id} as reviewed")
+        """Mark a location-category combination as reviewed.
+        
+        A single upsert on the unique (location_id, category_id) pair; foreign keys
+        reject unknown locations and categories.
+        """
+        logger.info("Marking location {} - category {} as reviewed", location_id, category_id)
+        
+        now = datetime.utcnow()
+        statement = _upsert_review().values(
+            location_id=location_id,
+            category_id=category_id,
+            reviewed_at=now,
+            created_at=now
+        ).returning(*_REVIEW_COLUMNS)
         
         try:
-            # Check if record exists
-            existing_review = self.session.query(LocationCategoryReviewModel).filter(
-                LocationCategoryReviewModel.location_id == location_id,
-                LocationCategoryReviewModel.category_id == category_id
-            ).first()
-            
-            now = datetime.utcnow()
-            
-            if existing_review:
-                # Update existing record
-                existing_review.reviewed_at = now
-                self.session.commit()
-                self.session.refresh(existing_review)
-                
-                logger.info(f"Updated existing review record: {existing_review.id}")
-                return existing_review.to_domain()
-            else:
-                # Create new record
-                new_review = LocationCategoryReviewModel(
-                    location_id=location_id,
-                    category_id=category_id,
-                    reviewed_at=now,
-                    created_at=now
-                )
-                
-                self.session.add(new_review)
-                self.session.commit()
-                self.session.refresh(new_review)
-                
-                logger.info(f"Created new review record: {new_review.id}")
-                return new_review.to_domain()
+            result = await self._execute(statement)
+            review = LocationCategoryReview(**result.one()._asdict())
+            await self._commit()
+        except IntegrityError as e:
+            await self._rollback()
+            logger.warning("Review rejected by constraint: {}", e.orig)
+            await self._raise_missing_reference(location_id, category_id)
+            raise
         except Exception as e:
-            logger.error(f"Error marking as reviewed: {e}")
-            self.session.rollback()
+            logger.error("Error marking as reviewed: {}", e)
+            await self._rollback()
             raise
+        
+        logger.info("Upserted review record: {}", review.id)
+        return review
+    
+    @batched_statements
+    async def mark_many_as_reviewed(self, marks: List[ReviewMark]) -> List[ReviewMarkResult]:
+        """Mark many combinations as reviewed in one transaction, reporting each one's outcome.
+        
+        Unknown locations and categories are found with one set-based query per table,
+        the remaining marks are written with a single executemany upsert and one commit.
+        Reviewed results report the stored review time, which keeps a newer existing review.
+        """
+        logger.info("Marking {} combinations as reviewed", len(marks))
+        
+        location_ids = {mark.location_id for mark in marks}
+        category_ids = {mark.category_id for mark in marks}
+        known_locations = await self._existing_ids(LocationModel.id, location_ids)
+        known_categories = await self._existing_ids(CategoryModel.id, category_ids)
+        
+        now = datetime.utcnow()
+        results = []
+        rows = []
+        for mark in marks:
+            if mark.location_id not in known_locations:
+                results.append(ReviewMarkResult(mark.location_id, mark.category_id, ReviewMarkResult.LOCATION_NOT_FOUND))
+            elif mark.category_id not in known_categories:
+                results.append(ReviewMarkResult(mark.location_id, mark.category_id, ReviewMarkResult.CATEGORY_NOT_FOUND))
+            else:
+                results.append(ReviewMarkResult(mark.location_id, mark.category_id, ReviewMarkResult.REVIEWED))
+                rows.append({
+                    "location_id": mark.location_id,
+                    "category_id": mark.category_id,
+                    "reviewed_at": mark.reviewed_at or now,
+                    "created_at": now,
+                })
+        
+        if rows:
+            try:
+                await self._execute(_upsert_review(), rows)
+                stored = await self._stored_review_times({(row["location_id"], row["category_id"]) for row in rows})
+                await self._commit()
+            except Exception as e:
+                logger.error("Error marking batch as reviewed: {}", e)
+                await self._rollback()
+                raise
+            for result in results:
+                if result.status == ReviewMarkResult.REVIEWED:
+                    result.reviewed_at = stored[(result.location_id, result.category_id)]
+        
+        logger.info("Marked {} of {} combinations as reviewed", len(rows), len(marks))
+        return results
+    
+    async def _existing_ids(self, id_column, ids: Set[int]) -> Set[int]:
+        """Get the subset of ``ids`` present in ``id_column``'s table."""
+        existing = set()
+        id_list = sorted(ids)
+        for start in range(0, len(id_list), _ID_CHUNK_SIZE):
+            result = await self._execute(
+                select(id_column).where(id_column.in_(id_list[start:start + _ID_CHUNK_SIZE]))
+            )
+            existing.update(result.scalars())
+        return existing
+    
+    async def _stored_review_times(self, pairs: Set[Tuple[int, int]]) -> Dict[Tuple[int, int], datetime]:
+        """Get the stored reviewed_at of each (location_id, category_id) pair.
+        
+        The plain location_id IN (...) lets SQLite seek the composite index, which it
+        does not do for the row-value IN on its own.
+        """
+        key = tuple_(LocationCategoryReviewModel.location_id, LocationCategoryReviewModel.category_id)
+        stored = {}
+        pair_list = sorted(pairs)
+        for start in range(0, len(pair_list), _ID_CHUNK_SIZE):
+            chunk = pair_list[start:start + _ID_CHUNK_SIZE]
+            result = await self._execute(
+                select(
+                    LocationCategoryReviewModel.location_id,
+                    LocationCategoryReviewModel.category_id,
+                    LocationCategoryReviewModel.reviewed_at,
+                ).where(
+                    LocationCategoryReviewModel.location_id.in_({location_id for location_id, _ in chunk}),
+                    key.in_(chunk),
+                )
+            )
+            stored.update(((row.location_id, row.category_id), row.reviewed_at) for row in result)
+        return stored
+    
+    async def _raise_missing_reference(self, location_id: int, category_id: int) -> None:
+        """Raise the not-found error for whichever side of a rejected review does not exist."""
+        if not await self.check_location_exists(location_id):
+            raise LocationNotFoundError(location_id)
+        if not await self.check_category_exists(category_id):
+            raise CategoryNotFoundError(category_id)
     
     async def get_reviewed_combinations(self, location_id: int, category_id: int) -> List[LocationCategoryReview]:
         """Get reviewed combinations for a specific location and category."""
-        logger.info(f"Getting reviewed combinations for location {location_id} - category {category_id}")
+        logger.info("Getting reviewed combinations for location {} - category {}", location_id, category_id)
         
-        reviews = self.session.query(LocationCategoryReviewModel).filter(
-            LocationCategoryReviewModel.location_id == location_id,
-            LocationCategoryReviewModel.category_id == category_id,
-            LocationCategoryReviewModel.reviewed_at.isnot(None)
-        ).all()
+        result = await self._execute(
+            select(LocationCategoryReviewModel).where(
+                LocationCategoryReviewModel.location_id == location_id,
+                LocationCategoryReviewModel.category_id == category_id,
+                LocationCategoryReviewModel.reviewed_at.isnot(None)
+            )
+        )
         
-        domain_reviews = [review.to_domain() for review in reviews]
+        domain_reviews = [review.to_domain() for review in result.scalars()]
         
-        logger.info(f"Retrieved {len(domain_reviews)} reviewed combinations")
+        logger.info("Retrieved {} reviewed combinations", len(domain_reviews))
         return domain_reviews
     
     async def check_location_exists(self, location_id: int) -> bool:
         """Check if a location exists by ID."""
-        logger.info(f"Checking if location {location_id} exists")
+        logger.info("Checking if location {} exists", location_id)
         
-        location = self.session.query(LocationModel).filter(
-            LocationModel.id == location_id
-        ).first()
+        result = await self._execute(
+            select(LocationModel.id).where(LocationModel.id == location_id)
+        )
         
-        exists = location is not None
-        logger.info(f"Location {location_id} exists: {exists}")
+        exists = result.first() is not None
+        logger.info("Location {} exists: {}", location_id, exists)
         return exists
     
     async def check_category_exists(self, category_id: int) -> bool:
         """Check if a category exists by ID."""
-        logger.info(f"Checking if category {category_id} exists")
+        logger.info("Checking if category {} exists", category_id)
         
-        category = self.session.query(CategoryModel).filter(
-            CategoryModel.id == category_id
-        ).first()
+        result = await self._execute(
+            select(CategoryModel.id).where(CategoryModel.id == category_id)
+        )
         
-        exists = category is not None
-        logger.info(f"Category {category_id} exists: {exists}")
+        exists = result.first() is not None
+        logger.info("Category {} exists: {}", category_id, exists)
         return exists 
\ No newline at end of file
@@ -31,8 +31,8 @@ def run_server(
         "access_log": True,
     }
     
-    logger.info(f"Starting server on http://{server_config['host']}:{server_config['port']}")
-    logger.info(f"Debug mode: {server_config['reload']}")
+    logger.info("Starting server on http://{}:{}", server_config['host'], server_config['port'])
+    logger.info("Debug mode: {}", server_config['reload'])
     logger.info("Documentation available at /docs")
     
     uvicorn.run(**server_config)
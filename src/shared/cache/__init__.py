@@ -0,0 +1 @@
+"""Caching package for Map My World API."""
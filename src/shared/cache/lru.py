@@ -0,0 +1,117 @@
+"""In-process LRU cache with per-entry time-to-live."""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Protocol, Tuple
+
+# Returned by ``get`` when a key is absent, so a cached ``None`` (a known miss) stays distinguishable
+MISSING: Any = object()
+
+
+class EntityCache(Protocol):
+    """Cache interface the repositories read through and invalidate."""
+    
+    def get(self, key: Hashable) -> Any:
+        """Get a cached value, or ``MISSING``."""
+        ...
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a value; ``None`` records that the key does not exist."""
+        ...
+    
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a key."""
+        ...
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get counters describing the cache."""
+        ...
+
+
+class LRUCache:
+    """Thread-safe LRU cache bounded by size, whose entries expire after a TTL.
+    
+    ``None`` values are negative entries: they record that a key does not exist and
+    expire after ``negative_ttl_seconds`` so newly created rows show up quickly. A
+    ``max_size`` of 0 disables the cache while still counting misses.
+    """
+    
+    def __init__(self, max_size: int, ttl_seconds: float, negative_ttl_seconds: Optional[float] = None) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = ttl_seconds if negative_ttl_seconds is None else negative_ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+    
+    def __len__(self) -> int:
+        """Get the number of cached entries, expired ones included."""
+        return len(self._entries)
+    
+    def get(self, key: Hashable) -> Any:
+        """Get a cached value and mark it recently used, or ``MISSING``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return MISSING
+            
+            self._entries.move_to_end(key)
+            if value is None:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a value, evicting the least recently used entries beyond ``max_size``."""
+        if self.max_size <= 0:
+            return
+        ttl = self.negative_ttl_seconds if value is None else self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a key if it is cached."""
+        with self._lock:
+            if self._entries.pop(key, MISSING) is not MISSING:
+                self.invalidations += 1
+    
+    def clear(self) -> None:
+        """Drop every entry, keeping the counters."""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get hit, miss and eviction counters together with the current size."""
+        with self._lock:
+            lookups = self.hits + self.negative_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "negative_ttl_seconds": self.negative_ttl_seconds,
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "hit_ratio": round((self.hits + self.negative_hits) / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
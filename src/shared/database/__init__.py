@@ -0,0 +1 @@
+"""Database helpers package for Map My World API."""
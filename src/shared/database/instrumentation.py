@@ -0,0 +1,110 @@
+"""SQL statement instrumentation for Map My World API."""
+import functools
+import inspect
+import time
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Optional, Set
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from src.shared.database.slow_queries import SlowQueryRecorder
+from src.shared.monitoring.metrics import DB_STATEMENT_DURATION
+from src.shared.monitoring.request_stats import current_request_stats
+
+# Repository method currently running, used to label the statements it issues
+current_repository_method: ContextVar[str] = ContextVar("current_repository_method", default="none")
+
+# Labels of repository methods whose repeated statements are deliberate chunks of one set-based operation
+batched_repository_methods: Set[str] = set()
+
+
+def batched_statements(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Mark a repository method that runs the same statement once per chunk of its input.
+    
+    Its statements are still counted and timed for the request, but left out of
+    the statement budget and the repeated-statement (N+1) check.
+    """
+    setattr(method, "batched_statements", True)
+    return method
+
+
+def track_repository_method(label: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a repository coroutine or async generator so its statements carry ``label``."""
+    if getattr(method, "batched_statements", False):
+        batched_repository_methods.add(label)
+    
+    if inspect.isasyncgenfunction(method):
+        @functools.wraps(method)
+        async def generator_wrapper(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+            # Set the label around each step only, so it never leaks into the consumer
+            iterator = method(*args, **kwargs)
+            try:
+                while True:
+                    token = current_repository_method.set(label)
+                    try:
+                        item = await iterator.__anext__()
+                    except StopAsyncIteration:
+                        return
+                    finally:
+                        current_repository_method.reset(token)
+                    yield item
+            finally:
+                await iterator.aclose()
+        
+        return generator_wrapper
+    
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        token = current_repository_method.set(label)
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            current_repository_method.reset(token)
+    
+    return wrapper
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    """Remember when the statement was handed to the driver."""
+    conn.info.setdefault("statement_start_times", []).append(time.perf_counter())
+
+
+def _handle_error(exception_context: Any) -> None:
+    """Forget the start time of a statement that failed."""
+    # ExceptionContext.cursor is declared but never set on SQLAlchemy 2.1, so it can't tell
+    # whether the statement reached the driver; the stack is empty when it didn't
+    connection = exception_context.connection
+    if connection is not None and exception_context.execution_context is not None:
+        start_times = connection.info.get("statement_start_times")
+        if start_times:
+            start_times.pop()
+
+
+def register_statement_listeners(
+    target: Engine,
+    metrics: bool = True,
+    slow_queries: Optional[SlowQueryRecorder] = None,
+) -> None:
+    """Time every statement executed on an engine.
+    
+    Durations feed the Prometheus histogram when ``metrics`` is set, the stats
+    of the request being handled whenever there is one, and ``slow_queries``
+    for statements above its threshold.
+    """
+    def _after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        """Record the statement's duration under the running repository method and request."""
+        duration = time.perf_counter() - conn.info["statement_start_times"].pop()
+        repository_method = current_repository_method.get()
+        if metrics:
+            operation = statement.lstrip().split(None, 1)[0].upper() if statement else "UNKNOWN"
+            DB_STATEMENT_DURATION.labels(repository_method, operation).observe(duration)
+        
+        stats = current_request_stats.get()
+        if stats is not None:
+            stats.record_statement(statement, duration, batched=repository_method in batched_repository_methods)
+        
+        if slow_queries is not None and duration * 1000 >= slow_queries.threshold_ms:
+            slow_queries.record(conn, statement, parameters, duration, repository_method, executemany)
+    
+    event.listen(target, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target, "after_cursor_execute", _after_cursor_execute)
+    event.listen(target, "handle_error", _handle_error)
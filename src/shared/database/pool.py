@@ -0,0 +1,71 @@
+"""Connection pool instrumentation for Map My World API."""
+import threading
+import time
+from typing import Any, Dict
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolMetrics:
+    """Thread-safe counters describing connection pool checkouts and waits."""
+    
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+    
+    def record_checkout(self, wait_ms: float, timed_out: bool = False) -> None:
+        """Record how long a caller waited for a connection."""
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+    
+    def snapshot(self, pool: QueuePool) -> Dict[str, Any]:
+        """Get the counters together with the pool's current occupancy."""
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait_ms / attempts, 3) if attempts else 0.0,
+                "max_wait_ms": round(self.max_wait_ms, 3),
+            }
+
+
+class MeteredPoolMixin:
+    """Pool mixin that records checkout wait times in a per-class ``PoolMetrics``."""
+    
+    metrics: PoolMetrics
+    
+    def connect(self) -> Any:
+        """Check out a connection, timing the wait for a free slot."""
+        start_time = time.perf_counter()
+        try:
+            connection = super().connect()  # type: ignore[misc]
+        except PoolTimeoutError:
+            self.metrics.record_checkout((time.perf_counter() - start_time) * 1000, timed_out=True)
+            raise
+        self.metrics.record_checkout((time.perf_counter() - start_time) * 1000)
+        return connection
+
+
+class MeteredQueuePool(MeteredPoolMixin, QueuePool):
+    """QueuePool that records checkout wait times."""
+    
+    metrics = PoolMetrics()
+
+
+class MeteredAsyncAdaptedQueuePool(MeteredPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout wait times."""
+    
+    metrics = PoolMetrics()
@@ -0,0 +1,112 @@
+"""Base SQLAlchemy repository for Map My World API."""
+import inspect
+from typing import Any, AsyncIterator, Optional, Sequence, Union
+from sqlalchemy.engine import Result, Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Executable
+from src.shared.cache.lru import MISSING, EntityCache
+from src.shared.database.instrumentation import track_repository_method
+from src.shared.database.sqlite import bump_change_counter
+
+
+class SQLAlchemyRepository:
+    """Base repository that runs statements on a sync or an asyncio session.
+    
+    Repository implementations build SQLAlchemy 2.0 statements and go through
+    these helpers, so the same code awaits the driver when it receives an
+    ``AsyncSession`` and calls it directly when it receives a ``Session``. An
+    optional entity cache backs the ``_cache_*`` helpers; without one they do nothing.
+    Subclasses that set ``versioned_table`` bump its change counter on every commit.
+    
+    Public coroutine methods of subclasses are wrapped so the SQL metrics can
+    label every statement with the repository method that issued it.
+    """
+    
+    # Table whose counter in ``table_versions`` each commit bumps (see create_change_counter)
+    versioned_table: Optional[str] = None
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for name, method in list(vars(cls).items()):
+            if name.startswith("_"):
+                continue
+            if inspect.iscoroutinefunction(method) or inspect.isasyncgenfunction(method):
+                setattr(cls, name, track_repository_method(f"{cls.__name__}.{name}", method))
+    
+    def __init__(
+        self,
+        session: Union[Session, AsyncSession],
+        cache: Optional[EntityCache] = None
+    ) -> None:
+        self.session = session
+        self.is_async = isinstance(session, AsyncSession)
+        self.cache = cache
+    
+    def _cache_get(self, key: Any) -> Any:
+        """Get a cached entity, ``None`` for a cached miss, or ``MISSING``."""
+        if self.cache is None:
+            return MISSING
+        return self.cache.get(key)
+    
+    def _cache_set(self, key: Any, entity: Any) -> None:
+        """Cache an entity, or ``None`` to remember that it does not exist."""
+        if self.cache is not None:
+            self.cache.set(key, entity)
+    
+    def _cache_invalidate(self, *keys: Any) -> None:
+        """Drop cached entries after a write."""
+        if self.cache is not None:
+            for key in keys:
+                self.cache.invalidate(key)
+    
+    async def _execute(self, statement: Executable, params: Optional[Any] = None) -> Result[Any]:
+        """Execute a statement and return its buffered result."""
+        if isinstance(self.session, AsyncSession):
+            return await self.session.execute(statement, params)
+        return self.session.execute(statement, params)
+    
+    async def _stream(
+        self,
+        statement: Executable,
+        batch_size: int
+    ) -> AsyncIterator[Sequence[Row[Any]]]:
+        """Execute a statement on a server-side cursor, yielding ``batch_size`` rows at a time."""
+        statement = statement.execution_options(yield_per=batch_size)
+        if isinstance(self.session, AsyncSession):
+            result = await self.session.stream(statement)
+            async for partition in result.partitions():
+                yield partition
+        else:
+            for partition in self.session.execute(statement).partitions():
+                yield partition
+    
+    async def _commit(self) -> None:
+        """Commit the current transaction, counting it against ``versioned_table``."""
+        if self.versioned_table is not None and self.session.get_bind().dialect.name == "sqlite":
+            await self._execute(bump_change_counter(self.versioned_table))
+        if isinstance(self.session, AsyncSession):
+            await self.session.commit()
+        else:
+            self.session.commit()
+    
+    async def _rollback(self) -> None:
+        """Roll back the current transaction."""
+        if isinstance(self.session, AsyncSession):
+            await self.session.rollback()
+        else:
+            self.session.rollback()
+    
+    async def _refresh(self, instance: Any) -> None:
+        """Reload an instance's attributes from the database."""
+        if isinstance(self.session, AsyncSession):
+            await self.session.refresh(instance)
+        else:
+            self.session.refresh(instance)
+    
+    async def _delete(self, instance: Any) -> None:
+        """Mark an instance for deletion."""
+        if isinstance(self.session, AsyncSession):
+            await self.session.delete(instance)
+        else:
+            self.session.delete(instance)
@@ -0,0 +1,157 @@
+"""Slow-query recorder for Map My World API."""
+import re
+import threading
+from collections import deque
+from datetime import date, datetime, timezone
+from typing import Any, Deque, Dict, List, Optional
+import orjson
+from src.shared.logging.logger import SLOW_QUERY_EXTRA, get_logger
+
+logger = get_logger(__name__)
+
+# Tables at least this large are flagged when a slow statement scans them in full
+LARGE_TABLE_ROWS = 10_000
+
+# Parameter sets kept from an executemany() call
+MAX_PARAMETER_SETS = 5
+
+# "FROM locations" / "JOIN locations AS l", to map plan aliases back to tables
+_TABLE_REFERENCE = re.compile(r'\b(?:FROM|JOIN)\s+"?(\w+)"?(?:\s+AS\s+"?(\w+)"?)?', re.IGNORECASE)
+
+# Statements that have a query plan worth explaining
+_EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "REPLACE")
+
+# "SCAN l", "SCAN locations USING COVERING INDEX ix" (virtual tables and subqueries are not full scans)
+_FULL_SCAN = re.compile(r"^SCAN (\w+)\b(?! VIRTUAL TABLE)")
+
+
+def redact_parameter(value: Any) -> Any:
+    """Keep numbers, flags, dates and NULLs, which explain a plan; hide text and blobs."""
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, str):
+        return f"<redacted str({len(value)})>"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return f"<redacted bytes({len(value)})>"
+    return f"<redacted {type(value).__name__}>"
+
+
+def redact_parameters(parameters: Any, executemany: bool) -> Any:
+    """Redact a statement's bound parameters (or the first sets of an executemany)."""
+    if executemany:
+        sets = list(parameters[:MAX_PARAMETER_SETS])
+        return {
+            "sets": len(parameters),
+            "first": [redact_parameters(parameter_set, False) for parameter_set in sets],
+        }
+    if isinstance(parameters, dict):
+        return {key: redact_parameter(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact_parameter(value) for value in parameters]
+    return redact_parameter(parameters)
+
+
+class SlowQueryRecorder:
+    """Keeps the most recent statements slower than a threshold, with their query plans.
+    
+    Entries live in a bounded ring buffer served by the admin API, and each one
+    is also logged as a warning carrying the JSON document in ``extra``, which
+    the slow-query file sink writes one per line.
+    """
+    
+    def __init__(self, threshold_ms: float, buffer_size: int = 100) -> None:
+        self.threshold_ms = threshold_ms
+        self._lock = threading.Lock()
+        self._entries: Deque[Dict[str, Any]] = deque(maxlen=buffer_size)
+        self.recorded = 0
+    
+    def record(
+        self,
+        connection: Any,
+        statement: str,
+        parameters: Any,
+        duration: float,
+        repository_method: str,
+        executemany: bool = False,
+    ) -> Dict[str, Any]:
+        """Capture a slow statement, explain it and add it to the buffer."""
+        entry: Dict[str, Any] = {
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round(duration * 1000, 3),
+            "repository_method": repository_method,
+            "statement": " ".join(statement.split()),
+            "parameters": redact_parameters(parameters, executemany),
+            "plan": None,
+            "full_scans": [],
+        }
+        if connection.dialect.name == "sqlite" and entry["statement"].upper().startswith(_EXPLAINABLE):
+            self._explain(connection, statement, parameters[0] if executemany and parameters else parameters, entry)
+        
+        with self._lock:
+            self._entries.append(entry)
+            self.recorded += 1
+        
+        slow_query_logger = logger.bind(**{SLOW_QUERY_EXTRA: orjson.dumps(entry).decode()})
+        if entry["full_scans"]:
+            scans = ", ".join(f"{scan['table']} ({scan['rows']} rows)" for scan in entry["full_scans"])
+            slow_query_logger.warning(
+                "Slow query: {:.2f}ms in {} | full scan of {}", entry["duration_ms"], repository_method, scans
+            )
+        else:
+            slow_query_logger.warning("Slow query: {:.2f}ms in {}", entry["duration_ms"], repository_method)
+        return entry
+    
+    def _explain(self, connection: Any, statement: str, parameters: Any, entry: Dict[str, Any]) -> None:
+        """Fill in the SQLite query plan and the large tables it scans in full.
+        
+        Runs on a raw DBAPI cursor of the same connection, so it sees the same
+        transaction and doesn't fire the engine's statement events again.
+        """
+        cursor = connection.connection.dbapi_connection.cursor()
+        try:
+            cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ())
+            plan = [{"id": row[0], "parent": row[1], "detail": row[3]} for row in cursor.fetchall()]
+            entry["plan"] = plan
+            
+            aliases: Dict[str, str] = {}
+            for table, alias in _TABLE_REFERENCE.findall(statement):
+                aliases[table] = table
+                if alias:
+                    aliases[alias] = table
+            for step in plan:
+                match = _FULL_SCAN.match(step["detail"])
+                if not match:
+                    continue
+                table = aliases.get(match.group(1), match.group(1))
+                if not table:
+                    continue
+                rows = self._estimate_rows(cursor, table)
+                if rows is not None and rows >= LARGE_TABLE_ROWS:
+                    entry["full_scans"].append({"table": table, "rows": rows, "detail": step["detail"]})
+        except Exception as e:
+            entry["plan_error"] = f"{type(e).__name__}: {e}"
+        finally:
+            cursor.close()
+    
+    @staticmethod
+    def _estimate_rows(cursor: Any, table: str) -> Optional[int]:
+        """Estimate a table's size from its largest rowid, without scanning it."""
+        try:
+            cursor.execute(f'SELECT MAX(rowid) FROM "{table}"')
+            row = cursor.fetchone()
+        except Exception:
+            return None
+        return int(row[0]) if row and row[0] is not None else 0
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the threshold, the number of statements recorded and the buffer, newest first."""
+        with self._lock:
+            entries: List[Dict[str, Any]] = list(reversed(self._entries))
+            return {
+                "threshold_ms": self.threshold_ms,
+                "recorded": self.recorded,
+                "buffer_size": self._entries.maxlen,
+                "queries": entries,
+            }
@@ -0,0 +1,160 @@
+"""SQLite-specific schema helpers for Map My World API."""
+import re
+from typing import Optional, Sequence
+from sqlalchemy import DateTime, Integer, String, Update, column, func, table, update
+from sqlalchemy.engine import Connection
+
+# Case- and accent-insensitive tokenizer: "Café" and "cafe" produce the same token
+FTS5_TOKENIZER = "unicode61 remove_diacritics 2"
+
+_SEARCH_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+# Per-table change counters, bumped once per write transaction (see bump_change_counter)
+table_versions = table(
+    "table_versions",
+    column("table_name", String),
+    column("version", Integer),
+    column("updated_at", DateTime),
+)
+
+
+def table_exists(connection: Connection, name: str) -> bool:
+    """Check whether a table (or virtual table) exists in the SQLite schema."""
+    result = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+    )
+    return result.first() is not None
+
+
+def create_fts5_index(
+    connection: Connection,
+    source_table: str,
+    fts_table: str,
+    columns: Sequence[str],
+) -> None:
+    """Create an external-content FTS5 index over ``columns`` kept in sync by triggers.
+    
+    Existing rows are indexed once, when the virtual table is first created.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    
+    is_new = not table_exists(connection, fts_table)
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    
+    connection.exec_driver_sql(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5("
+        f"{column_list}, content='{source_table}', content_rowid='id', "
+        f"tokenize='{FTS5_TOKENIZER}', prefix='2 3')"
+    )
+    connection.exec_driver_sql(
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {source_table} BEGIN "
+        f"INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.id, {new_values}); END"
+    )
+    connection.exec_driver_sql(
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {source_table} BEGIN "
+        f"INSERT INTO {fts_table}({fts_table}, rowid, {column_list}) "
+        f"VALUES ('delete', old.id, {old_values}); END"
+    )
+    connection.exec_driver_sql(
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE ON {source_table} BEGIN "
+        f"INSERT INTO {fts_table}({fts_table}, rowid, {column_list}) "
+        f"VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.id, {new_values}); END"
+    )
+    
+    if is_new:
+        connection.exec_driver_sql(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')")
+
+
+def create_rtree_index(
+    connection: Connection,
+    source_table: str,
+    rtree_table: str,
+    latitude_column: str = "latitude",
+    longitude_column: str = "longitude",
+) -> None:
+    """Create an R*Tree index over point coordinates kept in sync by triggers.
+    
+    Each row is stored as a degenerate box (min == max) keyed by the source row ID.
+    Existing rows are indexed once, when the virtual table is first created.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    
+    is_new = not table_exists(connection, rtree_table)
+    new_box = f"new.id, new.{latitude_column}, new.{latitude_column}, new.{longitude_column}, new.{longitude_column}"
+    
+    connection.exec_driver_sql(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {rtree_table} "
+        f"USING rtree(id, min_lat, max_lat, min_lon, max_lon)"
+    )
+    connection.exec_driver_sql(
+        f"CREATE TRIGGER IF NOT EXISTS {rtree_table}_ai AFTER INSERT ON {source_table} BEGIN "
+        f"INSERT INTO {rtree_table} VALUES ({new_box}); END"
+    )
+    connection.exec_driver_sql(
+        f"CREATE TRIGGER IF NOT EXISTS {rtree_table}_ad AFTER DELETE ON {source_table} BEGIN "
+        f"DELETE FROM {rtree_table} WHERE id = old.id; END"
+    )
+    connection.exec_driver_sql(
+        f"CREATE TRIGGER IF NOT EXISTS {rtree_table}_au "
+        f"AFTER UPDATE OF id, {latitude_column}, {longitude_column} ON {source_table} BEGIN "
+        f"DELETE FROM {rtree_table} WHERE id = old.id; "
+        f"INSERT INTO {rtree_table} VALUES ({new_box}); END"
+    )
+    
+    if is_new:
+        connection.exec_driver_sql(
+            f"INSERT INTO {rtree_table} SELECT id, {latitude_column}, {latitude_column}, "
+            f"{longitude_column}, {longitude_column} FROM {source_table}"
+        )
+
+
+def create_change_counter(connection: Connection, source_table: str) -> None:
+    """Count write transactions on ``source_table`` in ``table_versions``.
+    
+    The counter backs HTTP validators, so it starts at the current Unix time rather than 1:
+    a recreated database never reissues a version a client may still hold. Repositories
+    bump it once per commit with bump_change_counter; the per-row triggers of earlier
+    schemas are dropped.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    
+    connection.exec_driver_sql(
+        "CREATE TABLE IF NOT EXISTS table_versions ("
+        "table_name TEXT PRIMARY KEY, "
+        "version INTEGER NOT NULL, "
+        "updated_at DATETIME NOT NULL)"
+    )
+    connection.exec_driver_sql(
+        "INSERT OR IGNORE INTO table_versions (table_name, version, updated_at) "
+        "VALUES (?, CAST(strftime('%s', 'now') AS INTEGER), CURRENT_TIMESTAMP)",
+        (source_table,)
+    )
+    for suffix in ("ai", "au", "ad"):
+        connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {source_table}_version_{suffix}")
+
+
+def bump_change_counter(source_table: str) -> Update:
+    """Build the statement recording one more write transaction on ``source_table``."""
+    return (
+        update(table_versions)
+        .where(table_versions.c.table_name == source_table)
+        .values(version=table_versions.c.version + 1, updated_at=func.current_timestamp())
+    )
+
+
+def build_fts5_prefix_query(search: str) -> Optional[str]:
+    """Turn free text into an FTS5 query matching every word as a prefix.
+    
+    Each word is quoted so FTS5 operators in user input are treated literally.
+    Returns None when the input has no searchable words.
+    """
+    tokens = _SEARCH_TOKEN.findall(search)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
@@ -0,0 +1,29 @@
+"""Per-table change counters for Map My World API."""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import select
+from src.shared.database.repository import SQLAlchemyRepository
+from src.shared.database.sqlite import table_versions
+
+
+@dataclass(frozen=True)
+class TableVersion:
+    """Number of writes a table has seen and when the last one happened (UTC)."""
+    
+    version: int
+    updated_at: datetime
+
+
+class TableVersionRepository(SQLAlchemyRepository):
+    """Reads the per-table change counters."""
+    
+    async def get(self, table_name: str) -> Optional[TableVersion]:
+        """Get a table's change counter, or None when it is not tracked."""
+        result = await self._execute(
+            select(table_versions.c.version, table_versions.c.updated_at).where(
+                table_versions.c.table_name == table_name
+            )
+        )
+        row = result.first()
+        return TableVersion(version=row.version, updated_at=row.updated_at) if row else None
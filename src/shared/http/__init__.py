@@ -0,0 +1 @@
+"""HTTP helpers package for Map My World API."""
@@ -0,0 +1,92 @@
+"""Conditional GET support (ETag / Last-Modified) for Map My World API."""
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+from fastapi import Request, Response
+from config.core import get_settings
+from src.shared.database.versions import TableVersion
+
+
+def build_validator_headers(tag: str, last_modified: datetime) -> Dict[str, str]:
+    """Get the ETag, Last-Modified and Cache-Control headers for a tag and a UTC change time."""
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    return {
+        # Weak: the validator says the data is unchanged, not that the bytes are identical
+        "ETag": f'W/"{tag}"',
+        "Last-Modified": format_datetime(last_modified.astimezone(timezone.utc), usegmt=True),
+        "Cache-Control": f"max-age={get_settings().http_cache_max_age}, must-revalidate",
+    }
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag using weak comparison."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def is_not_modified(request: Request, headers: Dict[str, str]) -> bool:
+    """Check whether the client's cached copy is still current (RFC 9110, section 13.2.2)."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, headers["ETag"])
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return parsedate_to_datetime(headers["Last-Modified"]) <= since
+
+
+def _conditional_response(request: Request, response: Response, headers: Dict[str, str]) -> Optional[Response]:
+    """Get a 304 response for an up-to-date client, otherwise attach ``headers`` to ``response``."""
+    if is_not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+    
+    response.headers.update(headers)
+    return None
+
+
+def evaluate_conditional_get(
+    request: Request,
+    response: Response,
+    resource: str,
+    version: Optional[TableVersion]
+) -> Optional[Response]:
+    """Attach a collection's validators to ``response`` and get a 304 response if the client is up to date.
+    
+    List routes call this before running their query, so an unchanged poll costs one
+    primary-key lookup on ``table_versions``. Returns None when the full response
+    should be built, including when the table has no change counter.
+    """
+    if version is None:
+        return None
+    
+    headers = build_validator_headers(f"{resource}-{version.version}", version.updated_at)
+    return _conditional_response(request, response, headers)
+
+
+def evaluate_conditional_get_for_row(
+    request: Request,
+    response: Response,
+    resource: str,
+    row_id: int,
+    updated_at: datetime
+) -> Optional[Response]:
+    """Attach one row's validators to ``response`` and get a 304 response if the client is up to date.
+    
+    Detail routes call this after loading the row, so a missing row still gets its
+    404 and writes to other rows leave the validators alone.
+    """
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    changed = int(updated_at.timestamp() * 1_000_000)
+    headers = build_validator_headers(f"{resource}-{row_id}-{changed}", updated_at)
+    return _conditional_response(request, response, headers)
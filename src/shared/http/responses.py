@@ -0,0 +1,42 @@
+"""Fast JSON responses for Map My World API."""
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from src.shared.monitoring.request_stats import measure_serialization
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, for payloads that have no response model."""
+    
+    def render(self, content: Any) -> bytes:
+        """Serialize the content with orjson."""
+        with measure_serialization():
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+@lru_cache(maxsize=None)
+def list_adapter(item_type: Any) -> TypeAdapter:
+    """Get the (cached) TypeAdapter that serializes a list of ``item_type``."""
+    return TypeAdapter(List[item_type])
+
+
+def json_list_response(item_type: Any, items: Sequence[Any], response: Optional[Response] = None) -> Response:
+    """Serialize a list to JSON bytes in one pass and wrap it in a response.
+    
+    Routes build plain rows (usually a ``TypedDict``) and return this response, so
+    FastAPI neither validates them against ``response_model`` nor re-encodes them;
+    the route's ``response_model`` still documents the shape. Headers already set
+    on ``response`` (pagination links, validators) are carried over.
+    """
+    with measure_serialization():
+        content = list_adapter(item_type).dump_json(items)
+    json_response = Response(content=content, media_type="application/json")
+    if response is not None:
+        json_response.raw_headers.extend(
+            (key, value) for key, value in response.raw_headers
+            if key not in (b"content-length", b"content-type")
+        )
+    return json_response
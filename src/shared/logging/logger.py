@@ -1,38 +1,190 @@
 """Logger configuration for Map My World API."""
+import random
 import sys
-from typing import Any
+import traceback
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+import orjson
 from loguru import logger
-from config.core import get_settings
+from config.core import Settings, get_settings
+
+if TYPE_CHECKING:
+    from loguru import Record
 
 settings = get_settings()
 
-# Remove default logger
-logger.remove()
-
-# Add colored console logger
-logger.add(
-    sys.stdout,
-    format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-    level=settings.log_level,
-    colorize=True,
-    backtrace=True,
-    diagnose=True,
-)
-
-# Add file logger for production
-if not settings.debug:
+LOG_FORMATS = {
+    "colored": (
+        "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | "
+        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+    ),
+    "plain": "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+}
+
+# Key in a record's ``extra`` holding the JSON document the slow-query file sink writes
+SLOW_QUERY_EXTRA = "slow_query"
+
+# Whether the INFO and DEBUG records of the current request are kept
+_request_sampled: ContextVar[bool] = ContextVar("log_request_sampled", default=True)
+_sample_rate = 1.0
+
+# Minimum level per module prefix, longest prefix first, and the level resolved for each module
+_module_prefixes: List[Tuple[str, int]] = []
+_module_levels: Dict[str, int] = {}
+
+
+def sample_request() -> bool:
+    """Decide whether the current request's INFO and DEBUG records are kept."""
+    sampled = _sample_rate >= 1.0 or random.random() < _sample_rate
+    _request_sampled.set(sampled)
+    return sampled
+
+
+def _module_level(name: str) -> int:
+    """Get the minimum level configured for ``name`` through ``log_levels``."""
+    try:
+        return _module_levels[name]
+    except KeyError:
+        level_no = next(
+            (
+                no for module, no in _module_prefixes
+                if name == module or name.startswith(module + ".")
+            ),
+            0,
+        )
+        _module_levels[name] = level_no
+        return level_no
+
+
+def is_slow_query_record(record: "Record") -> bool:
+    """Whether a log record carries a slow-query document for the slow-query file."""
+    return SLOW_QUERY_EXTRA in record["extra"]
+
+
+def _json_format(record: "Record") -> str:
+    """Render a record as one JSON object per line."""
+    document = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "name": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "message": record["message"],
+    }
+    if record["exception"] is not None:
+        document["exception"] = "".join(traceback.format_exception(*record["exception"]))
+    record["extra"]["json"] = orjson.dumps(document, default=str).decode()
+    return "{extra[json]}\n"
+
+
+def configure_logging(settings: Settings) -> None:
+    """Replace every sink with the console (and file) sinks described by ``settings``."""
+    global _sample_rate, _module_prefixes
+    _sample_rate = settings.log_sample_rate
+    _module_prefixes = sorted(
+        ((module, logger.level(level).no) for module, level in settings.log_levels.items()),
+        key=lambda item: len(item[0]),
+        reverse=True,
+    )
+    _module_levels.clear()
+    
+    json_output = settings.log_format == "json"
+    
+    # Remove default logger
+    logger.remove()
+    
+    # Add console logger
     logger.add(
-        "logs/app.log",
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+        sys.stdout,
+        format=_json_format if json_output else LOG_FORMATS[settings.log_format],
+        colorize=settings.log_format == "colored",
         level=settings.log_level,
-        rotation="10 MB",
-        retention="30 days",
-        compression="zip",
+        enqueue=settings.log_enqueue,
         backtrace=True,
-        diagnose=True,
+        diagnose=settings.log_diagnose,
     )
+    
+    # Add file logger for production
+    if not settings.debug:
+        logger.add(
+            "logs/app.log",
+            format=_json_format if json_output else LOG_FORMATS["plain"],
+            rotation="10 MB",
+            retention="30 days",
+            compression="zip",
+            level=settings.log_level,
+            enqueue=settings.log_enqueue,
+            backtrace=True,
+            diagnose=settings.log_diagnose,
+        )
+    
+    # Add slow-query file, one JSON document per line (loguru appends the newline)
+    if settings.slow_query_threshold_ms > 0 and settings.slow_query_log_file:
+        logger.add(
+            settings.slow_query_log_file,
+            format=f"{{extra[{SLOW_QUERY_EXTRA}]}}",
+            filter=is_slow_query_record,
+            level="WARNING",
+            rotation="10 MB",
+            retention="30 days",
+            compression="zip",
+            enqueue=settings.log_enqueue,
+        )
+
+
+class ModuleLogger:
+    """Logger for one module that drops filtered calls before loguru builds a record.
+    
+    Calls below the module's ``log_levels`` entry are skipped, and so are DEBUG
+    and INFO calls made while handling a request that was not sampled.
+    """
+    
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._logger = logger.bind(name=name).opt(depth=1)
+    
+    def _enabled(self, level_no: int) -> bool:
+        if level_no < 30 and not _request_sampled.get():
+            return False
+        return level_no >= _module_level(self.name)
+    
+    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
+        if self._enabled(10):
+            self._logger.debug(message, *args, **kwargs)
+    
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
+        if self._enabled(20):
+            self._logger.info(message, *args, **kwargs)
+    
+    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
+        if self._enabled(30):
+            self._logger.warning(message, *args, **kwargs)
+    
+    def error(self, message: str, *args: Any, **kwargs: Any) -> None:
+        if self._enabled(40):
+            self._logger.error(message, *args, **kwargs)
+    
+    def exception(self, message: str, *args: Any, **kwargs: Any) -> None:
+        if self._enabled(40):
+            self._logger.exception(message, *args, **kwargs)
+    
+    def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._logger.critical(message, *args, **kwargs)
+    
+    def bind(self, **kwargs: Any) -> "ModuleLogger":
+        """Get a logger for the same module whose records carry ``kwargs`` in ``extra``."""
+        bound = ModuleLogger(self.name)
+        bound._logger = self._logger.bind(**kwargs)
+        return bound
+    
+    async def complete(self) -> None:
+        """Wait until enqueued sinks have written every pending record."""
+        await logger.complete()
+
+
+configure_logging(settings)
 
 
-def get_logger(name: str) -> Any:
+def get_logger(name: str) -> ModuleLogger:
     """Get logger instance for a module."""
-    return logger.bind(name=name) 
\ No newline at end of file
+    return ModuleLogger(name)
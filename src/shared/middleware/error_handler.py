@@ -1,72 +1,100 @@
-"""Error handling middleware for Map My World API."""
-import time
-from typing import Any
-from fastapi import Request, Response
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+"""Error handling for Map My World API."""
+from fastapi import FastAPI, Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from src.shared.exceptions.base import MapMyWorldException
+from src.shared.http.responses import ORJSONResponse
 from src.shared.logging.logger import get_logger
 from src.shared.logging.formatters import format_error_log
 
 logger = get_logger(__name__)
 
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
-    """Middleware to handle exceptions and convert them to HTTP responses."""
+def _internal_error_response() -> ORJSONResponse:
+    """Build the generic 500 response returned for unexpected exceptions."""
+    return ORJSONResponse(
+        status_code=500,
+        content={
+            "status_code": 500,
+            "error": "Internal Server Error",
+            "details": [
+                {
+                    "field": "server",
+                    "message": "An unexpected error occurred"
+                }
+            ],
+        }
+    )
+
+
+async def map_my_world_exception_handler(request: Request, exc: MapMyWorldException) -> ORJSONResponse:
+    """Convert an application-specific exception into its JSON error response."""
+    logger.error(
+        format_error_log(
+            exc,
+            {
+                "method": request.method,
+                "path": request.url.path,
+                "status_code": exc.status_code
+            }
+        )
+    )
     
-    async def dispatch(self, request: Request, call_next: Any) -> Response:
-        """Process request and handle any exceptions."""
-        start_time = time.time()
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content={
+            "status_code": exc.status_code,
+            "error": exc.error,
+            "details": exc.details,
+        }
+    )
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """Register the application's exception handlers on ``app``."""
+    app.add_exception_handler(MapMyWorldException, map_my_world_exception_handler)
+
+
+class ErrorHandlerMiddleware:
+    """Pure ASGI middleware turning unexpected exceptions into a JSON 500.
+    
+    ``MapMyWorldException`` is handled by :func:`map_my_world_exception_handler`
+    inside the router; this only catches what escapes it. An exception raised
+    after the response has started cannot be translated and is re-raised.
+    """
+    
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Forward the request and answer with a 500 if it fails unexpectedly."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
         
         try:
-            response = await call_next(request)
-            return response
-            
-        except MapMyWorldException as e:
-            # Handle application-specific exceptions
-            logger.error(
-                format_error_log(
-                    e, 
-                    {
-                        "method": request.method,
-                        "path": request.url.path,
-                        "status_code": e.status_code
-                    }
-                )
-            )
-            
-            return JSONResponse(
-                status_code=e.status_code,
-                content={
-                    "status_code": e.status_code,
-                    "error": e.error,
-                    "details": e.details,
-                }
-            )
-            
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
+            if response_started:
+                raise
+            
             # Handle unexpected exceptions
             logger.error(
                 format_error_log(
                     e,
                     {
-                        "method": request.method,
-                        "path": request.url.path,
+                        "method": scope["method"],
+                        "path": scope["path"],
                         "exception_type": type(e).__name__
                     }
                 )
             )
             
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "status_code": 500,
-                    "error": "Internal Server Error",
-                    "details": [
-                        {
-                            "field": "server",
-                            "message": "An unexpected error occurred"
-                        }
-                    ],
-                }
-            ) 
\ No newline at end of file
+            await _internal_error_response()(scope, receive, send)
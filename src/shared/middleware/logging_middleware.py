@@ -1,49 +1,68 @@
 """Logging middleware for Map My World API."""
 import time
-from typing import Any
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from src.shared.logging.logger import get_logger
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.shared.logging.logger import get_logger, sample_request
 from src.shared.logging.formatters import format_request_log, format_response_log
 
 logger = get_logger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all requests and responses."""
+class LoggingMiddleware:
+    """Pure ASGI middleware to log all requests and responses.
     
-    async def dispatch(self, request: Request, call_next: Any) -> Response:
-        """Process request and log information."""
+    Unlike ``BaseHTTPMiddleware`` this never wraps the response body, so
+    streaming responses and client disconnects pass straight through.
+    """
+    
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Log the request, forward it and log the response status and time."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        # Requests that are not sampled skip their INFO logs altogether
+        if not sample_request():
+            await self.app(scope, receive, send)
+            return
+        
         start_time = time.time()
         
         # Get client IP
-        client_ip = request.client.host if request.client else "unknown"
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
         
         # Get user agent
-        user_agent = request.headers.get("user-agent")
+        user_agent = None
+        for name, value in scope["headers"]:
+            if name == b"user-agent":
+                user_agent = value.decode("latin-1")
+                break
         
         # Log incoming request
         logger.info(
             format_request_log(
-                method=request.method,
-                path=request.url.path,
+                method=scope["method"],
+                path=scope["path"],
                 client_ip=client_ip,
                 user_agent=user_agent
             )
         )
         
-        # Process request
-        response = await call_next(request)
-        
-        # Calculate response time
-        response_time = (time.time() - start_time) * 1000  # Convert to milliseconds
-        
-        # Log response
-        logger.info(
-            format_response_log(
-                status_code=response.status_code,
-                response_time_ms=response_time
-            )
-        )
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Calculate response time up to the headers, as before
+                response_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+                
+                # Log response
+                logger.info(
+                    format_response_log(
+                        status_code=message["status"],
+                        response_time_ms=response_time
+                    )
+                )
+            await send(message)
         
-        return response 
\ No newline at end of file
+        await self.app(scope, receive, send_wrapper)
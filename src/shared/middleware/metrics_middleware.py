@@ -0,0 +1,53 @@
+"""Prometheus metrics middleware for Map My World API."""
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.shared.monitoring.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_PROGRESS,
+    UNMATCHED_ROUTE,
+)
+
+
+def _route_template(scope: Scope) -> str:
+    """Get the full path template of the route that handled a request."""
+    # Recent FastAPI versions keep included routes unprefixed and record the prefixed one here
+    route = scope.get("fastapi", {}).get("effective_route_context") or scope.get("route")
+    return getattr(route, "path_format", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording request counts, latencies and in-flight requests.
+    
+    Requests are labelled with the matched route's path template (e.g.
+    ``/api/v1/locations/{location_id}``), which the router leaves in the scope.
+    """
+    
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Forward the request and record its outcome once the response is complete."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        method = scope["method"]
+        status_code = 500
+        start_time = time.perf_counter()
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_progress.dec()
+            route_path = _route_template(scope)
+            HTTP_REQUEST_DURATION.labels(method, route_path).observe(time.perf_counter() - start_time)
+            HTTP_REQUESTS.labels(method, route_path, str(status_code)).inc()
@@ -0,0 +1,75 @@
+"""On-demand request profiling middleware for Map My World API."""
+import cProfile
+import hmac
+import time
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.shared.logging.logger import get_logger
+from src.shared.monitoring.profiling import profile_name, write_profile
+
+logger = get_logger(__name__)
+
+# Header that asks for a request to be profiled; its value must be the secret
+PROFILE_HEADER = b"x-profile"
+
+
+class ProfilingMiddleware:
+    """Pure ASGI middleware running requests that carry ``X-Profile: <secret>`` under cProfile.
+    
+    The profile covers the route handler, use case and repositories, and is
+    saved to ``directory``; its name is returned in an ``X-Profile-Id`` header.
+    cProfile sees the whole event loop thread, so requests handled at the same
+    time appear in the profile too, and only one request is profiled at a time.
+    Requests without the header only pay for a scan of their headers.
+    """
+    
+    def __init__(self, app: ASGIApp, secret: str, directory: str) -> None:
+        self.app = app
+        self.secret = secret.encode()
+        self.directory = directory
+        self._active = False
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Profile the request when it asks for it with the right secret."""
+        if scope["type"] != "http" or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+        
+        if self._active:
+            logger.warning("Profile skipped, another request is being profiled: {} {}", scope["method"], scope["path"])
+            await self.app(scope, receive, send)
+            return
+        
+        name = profile_name(scope["method"], scope["path"])
+        
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Profile-Id", name)
+            await send(message)
+        
+        self._active = True
+        profiler = cProfile.Profile()
+        start_time = time.perf_counter()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.disable()
+            self._active = False
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            title = f"{scope['method']} {scope['path']} ({duration_ms:.2f}ms)"
+            # Sorting and writing happen off the event loop, and a failure must not mask the request's outcome
+            try:
+                path = await run_in_threadpool(write_profile, profiler, self.directory, name, title)
+            except Exception as e:
+                logger.error("Could not save profile {}: {}", name, e)
+            else:
+                logger.info("Profile saved: {} -> {}", title, path)
+    
+    def _requested(self, scope: Scope) -> bool:
+        """Whether the request carries the profile header with the secret."""
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                return hmac.compare_digest(value, self.secret)
+        return False
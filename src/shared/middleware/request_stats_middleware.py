@@ -0,0 +1,119 @@
+"""Per-request statement accounting middleware for Map My World API."""
+import time
+from typing import Optional
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.shared.logging.formatters import format_performance_log
+from src.shared.logging.logger import get_logger
+from src.shared.monitoring.request_stats import RequestStats, current_request_stats
+
+logger = get_logger(__name__)
+
+
+def server_timing_header(stats: RequestStats, total_seconds: float) -> str:
+    """Format a request's stats as a ``Server-Timing`` header value (durations in ms)."""
+    db_ms = stats.db_seconds * 1000
+    serialize_ms = stats.serialization_seconds * 1000
+    total_ms = total_seconds * 1000
+    app_ms = max(total_ms - db_ms - serialize_ms, 0.0)
+    statements = f"{stats.statements} statement" + ("" if stats.statements == 1 else "s")
+    return (
+        f'db;dur={db_ms:.2f};desc="{statements}", '
+        f"serialize;dur={serialize_ms:.2f}, app;dur={app_ms:.2f}, total;dur={total_ms:.2f}"
+    )
+
+
+class RequestStatsMiddleware:
+    """Pure ASGI middleware counting the SQL statements and time each request spends.
+    
+    Statement durations come from the engine listeners and serialization time
+    from the JSON response helpers; the rest is attributed to the handler. The
+    totals can be sent back in a ``Server-Timing`` header, and a warning is
+    logged when a request exceeds ``statement_budget`` statements or issues the
+    same statement ``repeated_statement_threshold`` times (a likely N+1).
+    Statements of ``batched_statements`` repository methods are left out of
+    both checks.
+    
+    Streamed responses get no header: it goes out before the body, so it would
+    miss the statements run while streaming.
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        server_timing: bool = False,
+        statement_budget: int = 0,
+        repeated_statement_threshold: int = 0,
+    ) -> None:
+        self.app = app
+        self.server_timing = server_timing
+        self.statement_budget = statement_budget
+        self.repeated_statement_threshold = repeated_statement_threshold
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Account the request's statements, add the header and check the limits."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        response_start: Optional[Message] = None
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_start
+            if message["type"] == "http.response.start":
+                # Held back until the first body message shows whether the body is streamed
+                response_start = message
+                return
+            if response_start is not None:
+                start, response_start = response_start, None
+                if message["type"] == "http.response.body" and not message.get("more_body", False):
+                    elapsed = time.perf_counter() - stats.started_at
+                    MutableHeaders(scope=start).append(
+                        "Server-Timing", server_timing_header(stats, elapsed)
+                    )
+                await send(start)
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper if self.server_timing else send)
+        finally:
+            current_request_stats.reset(token)
+            self._check_limits(scope, stats)
+    
+    def _check_limits(self, scope: Scope, stats: RequestStats) -> None:
+        """Log a warning when the request issued too many or too repetitive statements."""
+        operation = f"{scope['method']} {scope['path']}"
+        duration_ms = (time.perf_counter() - stats.started_at) * 1000
+        
+        statements = stats.statements - stats.batched_statements
+        if 0 < self.statement_budget < statements:
+            logger.warning(
+                "Statement budget exceeded: "
+                + format_performance_log(
+                    operation,
+                    duration_ms,
+                    {
+                        "statements": statements,
+                        "budget": self.statement_budget,
+                        "db_ms": f"{stats.db_seconds * 1000:.2f}",
+                    },
+                )
+            )
+        
+        repeated = stats.most_repeated_statement()
+        if (
+            self.repeated_statement_threshold > 0
+            and repeated is not None
+            and repeated[1] >= self.repeated_statement_threshold
+        ):
+            statement, count = repeated
+            logger.warning(
+                "Repeated statement (possible N+1): "
+                + format_performance_log(
+                    operation,
+                    duration_ms,
+                    {"repeats": count, "statement": " ".join(statement.split())[:200]},
+                )
+            )
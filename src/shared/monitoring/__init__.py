@@ -0,0 +1 @@
+"""Monitoring package for Map My World API."""
@@ -0,0 +1,35 @@
+"""Prometheus metrics for Map My World API."""
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram, generate_latest
+
+# HTTP requests, labelled by route template so path parameters don't multiply series
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests handled, by method, route and status code.",
+    ["method", "route", "status_code"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time from receiving an HTTP request to sending the last byte of its response.",
+    ["method", "route"],
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being handled, by method.",
+    ["method"],
+)
+
+# SQL statements, labelled by the repository method that issued them
+DB_STATEMENT_DURATION = Histogram(
+    "db_statement_duration_seconds",
+    "Time spent executing SQL statements, by repository method and statement type.",
+    ["repository_method", "operation"],
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0, 2.5),
+)
+
+# Route label for requests that matched no route (404s, probes), keeping cardinality bounded
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def render_metrics() -> bytes:
+    """Render every registered metric in the Prometheus text exposition format."""
+    return generate_latest(REGISTRY)
@@ -0,0 +1,43 @@
+"""Per-request profiles for Map My World API."""
+import cProfile
+import io
+import pstats
+import re
+import time
+import uuid
+from pathlib import Path
+
+# Functions listed in each section of the text report
+REPORT_LIMIT = 40
+
+# Project code, to list the route, use case and repository layers on their own
+_PROJECT_FILES = r"/(src|config)/"
+
+
+def profile_name(method: str, path: str) -> str:
+    """Build a unique, file-system safe name for a request's profile."""
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", path).strip("-")[:60] or "root"
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{method}-{slug}-{uuid.uuid4().hex[:6]}"
+
+
+def write_profile(profiler: cProfile.Profile, directory: str, name: str, title: str) -> Path:
+    """Save a profile as ``<name>.prof`` plus a readable ``<name>.txt`` report.
+    
+    The ``.prof`` file holds the full call graph for ``snakeviz`` or
+    ``python -m pstats``; the report lists the most expensive functions by
+    cumulative time, overall and within the project's own code.
+    """
+    target = Path(directory)
+    target.mkdir(parents=True, exist_ok=True)
+    
+    profile_path = target / f"{name}.prof"
+    profiler.dump_stats(profile_path)
+    
+    report = io.StringIO()
+    report.write(f"{title}\n\n")
+    stats = pstats.Stats(profiler, stream=report).sort_stats(pstats.SortKey.CUMULATIVE)
+    stats.print_stats(REPORT_LIMIT)
+    report.write("Project code\n")
+    stats.print_stats(_PROJECT_FILES, REPORT_LIMIT)
+    (target / f"{name}.txt").write_text(report.getvalue())
+    return profile_path
@@ -0,0 +1,56 @@
+"""Per-request query and timing accounting for Map My World API."""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional, Tuple
+
+
+@dataclass
+class RequestStats:
+    """SQL statements and time spent by one request, split by where it went."""
+    
+    started_at: float = field(default_factory=time.perf_counter)
+    statements: int = 0
+    batched_statements: int = 0
+    db_seconds: float = 0.0
+    serialization_seconds: float = 0.0
+    statement_counts: Dict[str, int] = field(default_factory=dict)
+    
+    def record_statement(self, statement: str, duration: float, batched: bool = False) -> None:
+        """Count a statement and add its duration.
+        
+        Statements are also counted by their parameterized SQL to spot repeats,
+        unless ``batched`` marks them as one chunk of a set-based operation.
+        """
+        self.statements += 1
+        self.db_seconds += duration
+        if batched:
+            self.batched_statements += 1
+            return
+        self.statement_counts[statement] = self.statement_counts.get(statement, 0) + 1
+    
+    def most_repeated_statement(self) -> Optional[Tuple[str, int]]:
+        """Get the statement issued most often and how many times, if any was issued."""
+        if not self.statement_counts:
+            return None
+        return max(self.statement_counts.items(), key=lambda item: item[1])
+
+
+# Stats of the request being handled, or None outside a request
+current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+
+
+@contextmanager
+def measure_serialization() -> Iterator[None]:
+    """Add the time spent in the block to the current request's serialization time."""
+    stats = current_request_stats.get()
+    if stats is None:
+        yield
+        return
+    
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.serialization_seconds += time.perf_counter() - start_time
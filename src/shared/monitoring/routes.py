@@ -0,0 +1,66 @@
+"""FastAPI routes for operational monitoring."""
+import hmac
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Response
+from prometheus_client import CONTENT_TYPE_LATEST
+from config.core import get_settings
+from config.database import get_pool_status, get_slow_queries
+from config.dependencies import container
+from src.shared.exceptions.http_errors import ForbiddenError, NotFoundError
+from src.shared.http.responses import ORJSONResponse
+from src.shared.logging.logger import get_logger
+from src.shared.monitoring.metrics import render_metrics
+
+logger = get_logger(__name__)
+
+
+async def require_admin_secret(
+    secret: Optional[str] = Header(None, alias="X-Admin-Secret"),
+) -> None:
+    """Only answer requests carrying the admin secret; hide the endpoints when none is set."""
+    expected = get_settings().admin_secret
+    if not expected:
+        raise NotFoundError()
+    if secret is None or not hmac.compare_digest(secret.encode(), expected.encode()):
+        raise ForbiddenError(error="Missing or invalid X-Admin-Secret header")
+
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    default_response_class=ORJSONResponse,
+    dependencies=[Depends(require_admin_secret)],
+)
+
+# Served at the root, where Prometheus scrapes by default
+metrics_router = APIRouter(tags=["admin"])
+
+
+@router.get("/db-pool")
+async def get_db_pool() -> dict:
+    """Get connection pool occupancy and checkout wait metrics."""
+    logger.info("Getting connection pool status")
+    return get_pool_status()
+
+
+@router.get("/slow-queries")
+async def get_slow_query_log() -> dict:
+    """Get the most recent statements slower than the threshold, with their query plans."""
+    logger.info("Getting slow queries")
+    return get_slow_queries()
+
+
+@router.get("/cache")
+async def get_cache_stats() -> dict:
+    """Get hit, miss and eviction counters of the entity caches."""
+    logger.info("Getting entity cache statistics")
+    return {
+        "locations": container.location_cache().stats(),
+        "categories": container.category_cache().stats(),
+    }
+
+
+@metrics_router.get("/metrics", response_class=Response)
+async def get_metrics() -> Response:
+    """Get request, in-flight and SQL statement metrics in the Prometheus text format."""
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1 @@
+"""Pagination package for Map My World API."""
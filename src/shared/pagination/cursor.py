@@ -0,0 +1,52 @@
+"""Keyset pagination helpers for Map My World API."""
+import base64
+import binascii
+from typing import Optional
+from fastapi import Request, Response
+from src.shared.exceptions.http_errors import BadRequestError
+
+# Page size used when a client does not send ``limit``, and the hard upper bound
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+_CURSOR_PREFIX = "id:"
+
+
+def resolve_page_size(limit: Optional[int]) -> int:
+    """Get the effective page size, never unbounded."""
+    return min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+
+
+def encode_cursor(last_id: int) -> str:
+    """Encode the last ID of a page as an opaque cursor."""
+    raw = f"{_CURSOR_PREFIX}{last_id}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decode an opaque cursor back into the last ID of the previous page."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("ascii")
+        if not raw.startswith(_CURSOR_PREFIX):
+            raise ValueError("unknown cursor format")
+        last_id = int(raw[len(_CURSOR_PREFIX):])
+        if last_id < 0:
+            raise ValueError("negative cursor position")
+        return last_id
+    except (ValueError, UnicodeError, binascii.Error):
+        raise BadRequestError(
+            error="Invalid pagination cursor",
+            details=[{"field": "cursor", "message": "Cursor is malformed or was not issued by this API"}]
+        )
+
+
+def set_next_page_headers(request: Request, response: Response, next_cursor: Optional[str]) -> None:
+    """Expose the next page as ``X-Next-Cursor`` and an RFC 8288 ``Link`` header."""
+    if next_cursor is None:
+        return
+    next_url = request.url.remove_query_params(["offset", "after_id", "cursor"]).include_query_params(
+        cursor=next_cursor
+    )
+    response.headers["X-Next-Cursor"] = next_cursor
+    response.headers["Link"] = f'<{next_url}>; rel="next"'
@@ -0,0 +1 @@
+"""Streaming request and response helpers for Map My World API."""
@@ -0,0 +1,54 @@
+"""Incremental readers for streamed request bodies."""
+import codecs
+from typing import AsyncIterator
+
+# Longest line, in characters, a reader buffers before giving up on the body
+MAX_LINE_LENGTH = 1 << 20
+
+
+class LineTooLongError(ValueError):
+    """A streamed body has a line longer than the reader accepts."""
+    
+    def __init__(self, line_number: int, max_line_length: int) -> None:
+        super().__init__(f"Line is longer than {max_line_length} characters")
+        self.line_number = line_number
+        self.max_line_length = max_line_length
+
+
+async def iter_text_lines(
+    chunks: AsyncIterator[bytes],
+    encoding: str = "utf-8",
+    max_line_length: int = MAX_LINE_LENGTH
+) -> AsyncIterator[str]:
+    """Yield the lines of a streamed body as they arrive, without their line endings.
+    
+    Only the current partial line is buffered, so memory does not grow with the body.
+    A line longer than ``max_line_length`` raises LineTooLongError instead of being
+    buffered. A UTF-8 byte order mark at the start is dropped.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    pending = ""
+    first = True
+    line_number = 0
+    
+    async for chunk in chunks:
+        text = decoder.decode(chunk)
+        if first and text:
+            text = text.lstrip("\ufeff")
+            first = False
+        pending += text
+        
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            line_number += 1
+            if len(line) > max_line_length:
+                raise LineTooLongError(line_number, max_line_length)
+            yield line.rstrip("\r")
+        if len(pending) > max_line_length:
+            raise LineTooLongError(line_number + 1, max_line_length)
+    
+    pending += decoder.decode(b"", final=True)
+    if len(pending) > max_line_length:
+        raise LineTooLongError(line_number + 1, max_line_length)
+    if pending:
+        yield pending.rstrip("\r")
@@ -0,0 +1,18 @@
+"""Streaming responses for Map My World API."""
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+
+class UploadStreamingResponse(StreamingResponse):
+    """Streaming response whose generator is still reading the request body.
+    
+    Starlette's ``StreamingResponse`` may listen for client disconnects on ``receive``
+    while it streams, which would swallow the body chunks the generator is waiting for.
+    This response only sends; a client that goes away surfaces as a send error instead.
+    """
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Stream the body without consuming ``receive``."""
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
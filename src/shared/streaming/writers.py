@@ -0,0 +1,52 @@
+"""Incremental writers for streamed response bodies."""
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Dict, List, Sequence
+
+Record = Dict[str, Any]
+
+# Response media type for each export format
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "geojson": "application/geo+json",
+}
+
+
+async def write_ndjson(batches: AsyncIterator[List[Record]]) -> AsyncIterator[str]:
+    """Yield one chunk of newline-delimited JSON per batch of records."""
+    async for batch in batches:
+        if batch:
+            yield "".join(json.dumps(record) + "\n" for record in batch)
+
+
+async def write_csv(batches: AsyncIterator[List[Record]], fieldnames: Sequence[str]) -> AsyncIterator[str]:
+    """Yield a CSV header, then one chunk of CSV rows per batch of records."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+    writer.writeheader()
+    yield buffer.getvalue()
+    
+    async for batch in batches:
+        if not batch:
+            continue
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(batch)
+        yield buffer.getvalue()
+
+
+async def write_geojson(batches: AsyncIterator[List[Record]]) -> AsyncIterator[str]:
+    """Yield a GeoJSON FeatureCollection whose features arrive in batches.
+    
+    Each record must already be a GeoJSON ``Feature``; the collection is opened
+    before the first batch is read so bytes start flowing immediately.
+    """
+    yield '{"type": "FeatureCollection", "features": ['
+    separator = ""
+    async for batch in batches:
+        if batch:
+            yield separator + ", ".join(json.dumps(feature) for feature in batch)
+            separator = ", "
+    yield "]}\n"
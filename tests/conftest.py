@@ -0,0 +1,21 @@
+"""Shared setup for the test suite.
+
+Settings and engines are created when ``config`` is first imported, so the
+environment is pointed at a throwaway database here, before any test module
+imports the application.
+"""
+import os
+import shutil
+import tempfile
+from pathlib import Path
+import pytest
+
+_DATA_DIR = Path(tempfile.mkdtemp(prefix="map-my-world-tests-"))
+os.environ["DATABASE_URL"] = f"sqlite:///{_DATA_DIR / 'test.db'}"
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Delete the throwaway database."""
+    shutil.rmtree(_DATA_DIR, ignore_errors=True)
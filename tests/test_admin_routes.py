@@ -0,0 +1,46 @@
+"""Access checks for the admin endpoints."""
+from typing import Iterator
+import pytest
+from fastapi.testclient import TestClient
+from config.core import get_settings
+
+ADMIN_PATHS = ["/api/v1/admin/db-pool", "/api/v1/admin/slow-queries", "/api/v1/admin/cache"]
+
+
+@pytest.fixture(scope="module")
+def client() -> Iterator[TestClient]:
+    """Application client with the test database set up."""
+    from src.app import create_app
+    
+    with TestClient(create_app()) as test_client:
+        yield test_client
+
+
+@pytest.mark.parametrize("path", ADMIN_PATHS)
+def test_admin_endpoints_are_hidden_without_a_secret(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch, path: str
+) -> None:
+    """With no secret configured, the endpoints do not exist, whatever the header."""
+    monkeypatch.setattr(get_settings(), "admin_secret", "")
+    
+    assert client.get(path).status_code == 404
+    assert client.get(path, headers={"X-Admin-Secret": ""}).status_code == 404
+
+
+@pytest.mark.parametrize("path", ADMIN_PATHS)
+def test_admin_endpoints_need_the_secret(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch, path: str
+) -> None:
+    """Only requests carrying the configured secret get an answer."""
+    monkeypatch.setattr(get_settings(), "admin_secret", "s3cret")
+    
+    assert client.get(path).status_code == 403
+    assert client.get(path, headers={"X-Admin-Secret": "wrong"}).status_code == 403
+    assert client.get(path, headers={"X-Admin-Secret": "s3cret"}).status_code == 200
+
+
+def test_metrics_stay_open(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Prometheus scrapes /metrics without the admin secret."""
+    monkeypatch.setattr(get_settings(), "admin_secret", "s3cret")
+    
+    assert client.get("/metrics").status_code == 200
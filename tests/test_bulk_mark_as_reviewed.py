@@ -0,0 +1,31 @@
+"""Regression checks for the bulk mark-as-reviewed endpoint."""
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="module")
+def client() -> Iterator[TestClient]:
+    """Application client with the test database set up."""
+    from src.app import create_app
+    
+    with TestClient(create_app()) as test_client:
+        yield test_client
+
+
+@pytest.mark.parametrize("reviewed_at", [
+    "2099-01-01T00:00:00",
+    (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat(),
+])
+def test_future_review_time_is_rejected(client: TestClient, reviewed_at: str) -> None:
+    """A review time after now gets a 422 that points at the item's field."""
+    items = [
+        {"location_id": 1, "category_id": 1},
+        {"location_id": 1, "category_id": 1, "reviewed_at": reviewed_at},
+    ]
+    response = client.post("/api/v1/recommendations/mark-reviewed/bulk", json={"items": items})
+    
+    assert response.status_code == 422
+    locations = [error["loc"] for error in response.json()["detail"]]
+    assert locations == [["body", "items", 1, "reviewed_at"]]
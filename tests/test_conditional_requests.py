@@ -0,0 +1,73 @@
+"""Regression checks for conditional GETs on single locations."""
+import itertools
+from typing import Iterator
+import pytest
+from fastapi.testclient import TestClient
+
+# Distinct coordinates, so repeated names are not rejected as duplicates
+_longitudes = itertools.count(1)
+
+
+@pytest.fixture(scope="module")
+def client() -> Iterator[TestClient]:
+    """Application client with the test database set up."""
+    from src.app import create_app
+    
+    with TestClient(create_app()) as test_client:
+        yield test_client
+
+
+def _create_location(client: TestClient, name: str) -> int:
+    """Create a location and get its ID."""
+    location = {"name": name, "longitude": float(next(_longitudes)), "latitude": 2.0}
+    response = client.post("/api/v1/locations/", json=location)
+    assert response.status_code == 201
+    return int(response.json()["id"])
+
+
+@pytest.mark.parametrize("header", ["If-None-Match", "If-Modified-Since"])
+def test_unknown_location_is_404_whatever_the_validators(client: TestClient, header: str) -> None:
+    """A conditional GET of an ID that does not exist gets 404, never 304."""
+    location_id = _create_location(client, "Conditional known")
+    etag = client.get(f"/api/v1/locations/{location_id}").headers["ETag"]
+    values = {"If-None-Match": ["*", etag], "If-Modified-Since": ["Fri, 01 Jan 2100 00:00:00 GMT"]}
+    
+    for value in values[header]:
+        response = client.get("/api/v1/locations/987654321", headers={header: value})
+        assert response.status_code == 404
+
+
+def test_location_validators_ignore_other_locations(client: TestClient) -> None:
+    """Writing another location leaves a location's ETag, and its 304, alone."""
+    location_id = _create_location(client, "Conditional watched")
+    etag = client.get(f"/api/v1/locations/{location_id}").headers["ETag"]
+    
+    _create_location(client, "Conditional other")
+    
+    response = client.get(f"/api/v1/locations/{location_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+
+def _locations_version(client: TestClient) -> int:
+    """Get the locations change counter from the list ETag, ``W/"locations-<version>"``."""
+    etag = client.get("/api/v1/locations/", params={"limit": 1}).headers["ETag"]
+    return int(etag.strip('W/"').rsplit("-", 1)[1])
+
+
+def test_import_chunk_bumps_the_list_version_once(client: TestClient) -> None:
+    """Rows imported in one chunk count as one write, not one per row."""
+    before = _locations_version(client)
+    body = "".join(
+        f'{{"name": "Conditional import {number}", '
+        f'"longitude": {next(_longitudes)}, "latitude": 3.0}}\n'
+        for number in range(5)
+    )
+    response = client.post(
+        "/api/v1/locations/import",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    assert '"inserted": 5' in response.text
+    assert _locations_version(client) == before + 1
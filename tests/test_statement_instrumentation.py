@@ -0,0 +1,85 @@
+"""Regression checks for the SQL statement instrumentation listeners."""
+import asyncio
+from typing import Any
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.shared.database.instrumentation import _handle_error, register_statement_listeners
+from src.shared.database.slow_queries import SlowQueryRecorder
+
+SCHEMA = (
+    "CREATE TABLE parents (id INTEGER PRIMARY KEY)",
+    "CREATE TABLE children ("
+    "id INTEGER PRIMARY KEY, parent_id INTEGER NOT NULL REFERENCES parents (id))",
+)
+
+# Violates the foreign key, like marking an unknown location as reviewed
+ORPHAN = "INSERT INTO children (parent_id) VALUES (999)"
+
+
+def _enable_foreign_keys(dbapi_connection: Any, connection_record: Any) -> None:
+    """Enforce foreign keys, as the application's PRAGMA profile does."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys = ON")
+    cursor.close()
+
+
+def _instrument(target: Engine) -> None:
+    """Register every statement listener on an engine, slow-query recording included."""
+    event.listen(target, "connect", _enable_foreign_keys)
+    register_statement_listeners(
+        target, metrics=True, slow_queries=SlowQueryRecorder(threshold_ms=0)
+    )
+
+
+def test_integrity_error_passes_through_listeners() -> None:
+    """A constraint violation reaches the caller as the DBAPI error, not one raised by the hooks."""
+    engine = create_engine("sqlite://")
+    _instrument(engine)
+    with engine.connect() as connection:
+        for statement in SCHEMA:
+            connection.exec_driver_sql(statement)
+        with pytest.raises(IntegrityError):
+            connection.exec_driver_sql(ORPHAN)
+        assert not connection.info["statement_start_times"]
+        
+        # Timing keeps working on the same connection after the failure
+        connection.exec_driver_sql("SELECT 1")
+        assert not connection.info["statement_start_times"]
+    engine.dispose()
+
+
+def test_integrity_error_passes_through_listeners_async() -> None:
+    """The same holds on the asyncio engine, whose listeners sit on its sync engine."""
+    async def run() -> None:
+        engine = create_async_engine("sqlite+aiosqlite://")
+        _instrument(engine.sync_engine)
+        try:
+            async with engine.connect() as connection:
+                for statement in SCHEMA:
+                    await connection.exec_driver_sql(statement)
+                with pytest.raises(IntegrityError):
+                    await connection.exec_driver_sql(ORPHAN)
+        finally:
+            await engine.dispose()
+    
+    asyncio.run(run())
+
+
+def test_mark_unknown_location_as_reviewed_returns_404() -> None:
+    """An unknown location's foreign-key failure maps to 404 with the app's listeners registered."""
+    from config.database import async_engine, engine
+    from src.app import create_app
+    
+    target = async_engine.sync_engine if async_engine is not None else engine
+    assert event.contains(target, "handle_error", _handle_error)
+    
+    with TestClient(create_app()) as client:
+        response = client.post(
+            "/api/v1/recommendations/mark-reviewed", json={"location_id": 999, "category_id": 1}
+        )
+    assert response.status_code == 404
+    assert response.json()["error"] == "Location with ID 999 not found"
@@ -0,0 +1,55 @@
+"""Regression checks for the incremental body readers."""
+import asyncio
+from typing import AsyncIterator, List, Tuple
+import pytest
+from fastapi.testclient import TestClient
+from src.shared.streaming.readers import MAX_LINE_LENGTH, LineTooLongError, iter_text_lines
+
+
+async def _chunks(*parts: bytes) -> AsyncIterator[bytes]:
+    """Stream ``parts`` as body chunks."""
+    for part in parts:
+        yield part
+
+
+def _read(*parts: bytes, max_line_length: int = MAX_LINE_LENGTH) -> List[str]:
+    """Collect the lines read from ``parts``."""
+    async def collect() -> List[str]:
+        lines = iter_text_lines(_chunks(*parts), max_line_length=max_line_length)
+        return [line async for line in lines]
+    
+    return asyncio.run(collect())
+
+
+def test_lines_split_across_chunks() -> None:
+    """Lines are rejoined across chunk boundaries and lose their line endings."""
+    assert _read(b"\xef\xbb\xbfab", b"c\r\nde", b"f\n", b"gh") == ["abc", "def", "gh"]
+
+
+@pytest.mark.parametrize("parts, line_number", [
+    ((b"0123456789", b"0123456789"), 1),
+    ((b"ok\n", b"0123456789" * 3, b"\n"), 2),
+    ((b"ok\n0123456789012345",), 2),
+])
+def test_line_longer_than_the_limit_raises(parts: Tuple[bytes, ...], line_number: int) -> None:
+    """A line past the limit raises with its line number, whether or not a newline follows."""
+    with pytest.raises(LineTooLongError) as raised:
+        _read(*parts, max_line_length=12)
+    assert raised.value.line_number == line_number
+
+
+def test_import_without_newlines_stops_with_a_row_error() -> None:
+    """An NDJSON body with no newline ends the import with a row error instead of buffering it."""
+    from src.app import create_app
+    
+    body = b'{"name": "' + b"x" * (MAX_LINE_LENGTH + 1) + b'"'
+    with TestClient(create_app()) as client:
+        response = client.post(
+            "/api/v1/locations/import",
+            content=body,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+    
+    assert response.status_code == 200
+    assert f"Line is longer than {MAX_LINE_LENGTH} characters; import stopped" in response.text
+    assert '"inserted": 0' in response.text